@@ -0,0 +1,101 @@
+"""
+Benchmark the binary TDML encoding against JSON.
+
+For scene, object and pixel label datasets, writes the same dataset with
+``write_to_json`` and ``write_to_binary`` (plain and zstd compressed), then
+compares the file sizes, the time to decode the document to a dict and the
+time of a full trusted read (``validate=False``).
+
+Usage::
+
+    python -m benchmarks.bench_binary --items 20000
+"""
+
+import argparse
+import gc
+import os
+import tempfile
+import time
+
+from benchmarks.synthetic import make_eo_dataset_dict
+from pytdml.io import (
+    get_json_backend,
+    parse_json,
+    read_from_binary,
+    read_from_json,
+    write_to_binary,
+    write_to_json,
+)
+from pytdml.io.tdml_binary import loads_binary
+
+
+def _time(func, *args, **kwargs):
+    gc.collect()
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def _load_binary(file_path):
+    with open(file_path, "rb") as f:
+        return loads_binary(f.read())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--items", type=int, default=20000)
+    parser.add_argument("--labels-per-item", type=int, default=10)
+    parser.add_argument("--kind", nargs="*", default=["scene", "object", "pixel"])
+    args = parser.parse_args()
+
+    backend = get_json_backend()
+    print("JSON backend: {}".format(backend.name))
+    print(
+        "{:<7} {:<12} {:>10} {:>11} {:>11}".format(
+            "kind", "format", "size MiB", "decode", "read"
+        )
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        for kind in args.kind:
+            td = parse_json(
+                make_eo_dataset_dict(args.items, kind, args.labels_per_item),
+                take_ownership=True,
+                validate=False,
+            )
+            json_path = os.path.join(tmp, "{}.json".format(kind))
+            write_to_json(td, json_path)
+            rows = [
+                (
+                    "json",
+                    json_path,
+                    lambda path: backend.load(path),
+                    lambda path: read_from_json(path, validate=False),
+                )
+            ]
+            for compression in (None, "zstd"):
+                binary_path = os.path.join(tmp, "{}.{}.tdmlb".format(kind, compression))
+                write_to_binary(td, binary_path, compression=compression)
+                rows.append(
+                    (
+                        "binary+zstd" if compression else "binary",
+                        binary_path,
+                        _load_binary,
+                        lambda path: read_from_binary(path, validate=False),
+                    )
+                )
+            for name, path, decode, read in rows:
+                decode_time, _ = _time(decode, path)
+                read_time, _ = _time(read, path)
+                print(
+                    "{:<7} {:<12} {:>10.2f} {:>10.3f}s {:>10.3f}s".format(
+                        kind,
+                        name,
+                        os.path.getsize(path) / 2**20,
+                        decode_time,
+                        read_time,
+                    )
+                )
+
+
+if __name__ == "__main__":
+    main()
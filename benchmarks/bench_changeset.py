@@ -0,0 +1,98 @@
+"""
+Benchmark applying changesets to a large training dataset.
+
+Builds a dataset of ``--items`` scene data items and applies a changeset that
+modifies ``--changes`` of them (plus a few additions and deletions) with
+``apply_changesets``. For comparison, the naive approach of scanning ``data``
+for every modified id is timed on ``--naive-changes`` modifications and
+extrapolated.
+
+Usage::
+
+    python -m benchmarks.bench_changeset --items 1000000 --changes 100000
+"""
+
+import argparse
+import gc
+import random
+import time
+
+from benchmarks.synthetic import make_eo_dataset_dict
+from pytdml.io import parse_json
+from pytdml.type import AI_TDChangeset, apply_changesets
+
+
+def _make_dataset(n_items):
+    # Only the first item is generated, the others are copies with a new id
+    td = parse_json(make_eo_dataset_dict(1, "scene"), validate=False)
+    template = td.data[0]
+    td.data = [
+        template.model_copy(update={"id": "item-{:08d}".format(i)})
+        for i in range(n_items)
+    ]
+    return td
+
+
+def _naive_modify(td, items):
+    for item in items:
+        for position, old_item in enumerate(td.data):
+            if old_item.id == item.id:
+                td.data[position] = item
+                break
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--items", type=int, default=1000000)
+    parser.add_argument("--changes", type=int, default=100000)
+    parser.add_argument("--naive-changes", type=int, default=100)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    start = time.perf_counter()
+    td = _make_dataset(args.items)
+    print("built {} items in {:.1f}s".format(args.items, time.perf_counter() - start))
+    template = td.data[0]
+    modified = [
+        template.model_copy(
+            update={"id": "item-{:08d}".format(i), "training_type": "validation"}
+        )
+        for i in rng.sample(range(args.items), args.changes)
+    ]
+    changeset = AI_TDChangeset.model_construct(
+        type="AI_TDChangeset",
+        id="bench",
+        change_count=len(modified) + 20,
+        add=[template.model_copy(update={"id": "new-{}".format(i)}) for i in range(10)],
+        modify=modified,
+        delete=[td.data[i] for i in rng.sample(range(args.items), 10)],
+        created_time="2024-01-01",
+    )
+
+    gc.collect()
+    start = time.perf_counter()
+    apply_changesets(td, [changeset])
+    indexed = time.perf_counter() - start
+    print(
+        "apply_changesets: {} changes in {:.3f}s ({} items now)".format(
+            changeset.change_count, indexed, td.amount_of_training_data
+        )
+    )
+
+    naive_items = modified[: args.naive_changes]
+    gc.collect()
+    start = time.perf_counter()
+    _naive_modify(td, naive_items)
+    naive = time.perf_counter() - start
+    print(
+        "linear scans: {} modifications in {:.3f}s, ~{:.0f}s for {}".format(
+            len(naive_items),
+            naive,
+            naive / max(len(naive_items), 1) * args.changes,
+            args.changes,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark reading compressed TDML encodings against plain JSON.
+
+Writes ``--items`` synthetic data items as plain JSON and compressed with
+gzip, zstd and xz, and times ``read_from_json`` of every file on a warm page
+cache (the file was just read) and on a cold one. The file is evicted from
+the page cache with ``posix_fadvise(POSIX_FADV_DONTNEED)`` before each cold
+read, which needs no privileges; on a cold cache the smaller files have less
+to read from disk.
+
+Usage::
+
+    python -m benchmarks.bench_compression --items 50000 --repeat 3
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.synthetic import make_eo_dataset_dict
+from pytdml.io import parse_json, read_from_json, write_to_json
+
+EXTENSIONS = ("json", "json.gz", "json.zst", "json.xz")
+
+
+def _evict(path):
+    with open(path, "rb") as f:
+        os.fsync(f.fileno())
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+
+
+def _warm(path):
+    with open(path, "rb") as f:
+        while f.read(1 << 24):
+            pass
+
+
+def _best_time(path, prepare, repeat, validate):
+    best = None
+    for _ in range(repeat):
+        prepare(path)
+        start = time.perf_counter()
+        read_from_json(path, validate=validate)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--items", type=int, default=50000)
+    parser.add_argument("--labels", type=int, default=10)
+    parser.add_argument("--kind", default="object", help="Label kind")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--validate", action="store_true", help="Validate while reading"
+    )
+    parser.add_argument("--dir", help="Directory of the files (default: temporary)")
+    args = parser.parse_args()
+
+    td = parse_json(
+        make_eo_dataset_dict(args.items, args.kind, args.labels), validate=False
+    )
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        print(
+            "{:<10} {:>10} {:>8} {:>8} {:>8}".format(
+                "file", "MB", "write s", "warm s", "cold s"
+            )
+        )
+        for extension in EXTENSIONS:
+            path = os.path.join(tmp, "dataset." + extension)
+            start = time.perf_counter()
+            write_to_json(td, path)
+            write_time = time.perf_counter() - start
+            warm = _best_time(path, _warm, args.repeat, args.validate)
+            cold = _best_time(path, _evict, args.repeat, args.validate)
+            print(
+                "{:<10} {:>10.1f} {:>8.2f} {:>8.2f} {:>8.2f}".format(
+                    extension,
+                    os.path.getsize(path) / 1e6,
+                    write_time,
+                    warm,
+                    cold,
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
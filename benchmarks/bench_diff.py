@@ -0,0 +1,78 @@
+"""
+Benchmark diffing two versions of a large TDML encoding.
+
+Writes a synthetic encoding of ``--items`` object data items and a second
+version in which ``--changes`` items are modified, a few are deleted and a few
+are added, then times ``diff`` on the two files and reports the peak resident
+memory of the diffing process.
+
+Usage::
+
+    python -m benchmarks.bench_diff --items 200000 --changes 10000
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import resource
+import tempfile
+import time
+
+from benchmarks.synthetic import make_eo_dataset_dict
+from pytdml.io import diff
+
+
+def _write_versions(n_items, n_changes, n_labels, old_path, new_path):
+    rng = random.Random(0)
+    data = make_eo_dataset_dict(n_items, "object", n_labels)
+    with open(old_path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    for i in rng.sample(range(n_items), n_changes):
+        item = data["data"][i]
+        data["data"][i] = dict(item, dataURL=[url + "?v2" for url in item["dataURL"]])
+    deleted = set(rng.sample(range(n_items), 10))
+    data["data"] = [item for i, item in enumerate(data["data"]) if i not in deleted]
+    data["data"] += [dict(data["data"][0], id="new-{}".format(i)) for i in range(10)]
+    with open(new_path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--items", type=int, default=200000)
+    parser.add_argument("--changes", type=int, default=10000)
+    parser.add_argument("--labels", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        old_path = os.path.join(tmp, "old.json")
+        new_path = os.path.join(tmp, "new.json")
+        # The encodings are built in a child process so that the peak memory
+        # of this one is the one of diff
+        writer = multiprocessing.Process(
+            target=_write_versions,
+            args=(args.items, args.changes, args.labels, old_path, new_path),
+        )
+        writer.start()
+        writer.join()
+        size = os.path.getsize(old_path) + os.path.getsize(new_path)
+
+        start = time.perf_counter()
+        changeset = diff(old_path, new_path)
+        elapsed = time.perf_counter() - start
+    print(
+        "diff: {} items, {:.0f} MB of JSON, {} changes in {:.2f}s".format(
+            args.items, size / 1e6, changeset.change_count, elapsed
+        )
+    )
+    print(
+        "peak RSS {} MB".format(
+            resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // 1024
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Benchmark the deepcopy-free parse path.
+
+Compares ``parse_json(d)`` (which deep-copies ``d`` before validation) with
+``parse_json(d, take_ownership=True)`` on a synthetic encoding.
+
+Usage::
+
+    python -m benchmarks.bench_from_dict --items 400000 --kind scene
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from benchmarks.synthetic import make_eo_dataset_dict
+from pytdml.io import parse_json
+
+
+def _measure(n_items, kind, take_ownership):
+    json_dict = make_eo_dataset_dict(n_items, kind=kind)
+    gc.collect()
+    start = time.perf_counter()
+    parse_json(json_dict, take_ownership=take_ownership)
+    elapsed = time.perf_counter() - start
+
+    json_dict = make_eo_dataset_dict(n_items, kind=kind)
+    gc.collect()
+    tracemalloc.start()
+    td = parse_json(json_dict, take_ownership=take_ownership)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del td
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=100000)
+    parser.add_argument("--kind", default="scene", choices=["scene", "object", "pixel"])
+    args = parser.parse_args()
+
+    print("{} {} items".format(args.items, args.kind))
+    for take_ownership in (False, True):
+        elapsed, peak = _measure(args.items, args.kind, take_ownership)
+        print(
+            "take_ownership={!s:<5}  parse: {:7.2f} s  peak traced memory: {:8.1f} MiB".format(
+                take_ownership, elapsed, peak / 2**20
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark the JSON backends on large COCO and TDML files.
+
+For every installed backend, measures loading a synthetic TDML encoding,
+encoding it again with ``indent=4`` (the ``write_to_json`` default) and
+loading a synthetic COCO file. The ``stdlib-text`` row is the previous text
+mode ``json.load``/``json.dump`` path.
+
+Usage::
+
+    python -m benchmarks.bench_json_backend --items 100000 --images 50000
+"""
+
+import argparse
+import gc
+import json
+import os
+import tempfile
+import time
+
+from benchmarks.synthetic import write_coco_dataset, write_eo_dataset
+from pytdml.io import available_backends, get_json_backend
+
+
+def _time(func, *args, **kwargs):
+    gc.collect()
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def _text_load(file_path):
+    with open(file_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _text_dump(obj, file_path):
+    with open(file_path, "w", encoding="utf-8") as f:
+        json.dump(obj, f, indent=4, ensure_ascii=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--items", type=int, default=50000)
+    parser.add_argument("--images", type=int, default=20000)
+    parser.add_argument("--backends", nargs="*", default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tdml_path = write_eo_dataset(os.path.join(tmp, "tdml.json"), args.items)
+        coco_path = write_coco_dataset(os.path.join(tmp, "coco.json"), args.images)
+        out_path = os.path.join(tmp, "out.json")
+        print(
+            "TDML: {} items, {:.1f} MiB; COCO: {} images, {:.1f} MiB".format(
+                args.items,
+                os.path.getsize(tdml_path) / 2**20,
+                args.images,
+                os.path.getsize(coco_path) / 2**20,
+            )
+        )
+        print(
+            "{:<12} {:>12} {:>12} {:>12}".format(
+                "backend", "TDML load", "TDML dump", "COCO load"
+            )
+        )
+
+        rows = []
+        load_time, obj = _time(_text_load, tdml_path)
+        dump_time, _ = _time(_text_dump, obj, out_path)
+        coco_time, _ = _time(_text_load, coco_path)
+        rows.append(("stdlib-text", load_time, dump_time, coco_time))
+        for name in args.backends or available_backends():
+            backend = get_json_backend(name)
+            load_time, obj = _time(backend.load, tdml_path)
+            dump_time, _ = _time(backend.dump, obj, out_path, indent=4)
+            coco_time, _ = _time(backend.load, coco_path)
+            rows.append((name, load_time, dump_time, coco_time))
+        for name, load_time, dump_time, coco_time in rows:
+            print(
+                "{:<12} {:>11.3f}s {:>11.3f}s {:>11.3f}s".format(
+                    name, load_time, dump_time, coco_time
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Benchmark label validation with a plain and a discriminated union.
+
+Validates the labels of a synthetic encoding once against the plain
+``Union`` of all label types (pydantic tries the members in turn) and once
+against the same union discriminated by ``type``, then reports the full
+``parse_json`` time of the encoding.
+
+Usage::
+
+    python -m benchmarks.bench_label_union --items 5000 --labels-per-item 30
+"""
+
+import argparse
+import gc
+import time
+from typing import Annotated, List, Union
+
+from pydantic import Field, TypeAdapter
+
+from benchmarks.synthetic import make_eo_dataset_dict
+from pytdml.io import parse_json
+from pytdml.type import AI_Label, AI_ObjectLabel, AI_PixelLabel, AI_SceneLabel
+
+_LABEL_TYPES = Union[AI_Label, AI_PixelLabel, AI_ObjectLabel, AI_SceneLabel]
+
+
+def _time(func, *args):
+    gc.collect()
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--items", type=int, default=5000)
+    parser.add_argument("--labels-per-item", type=int, default=30)
+    parser.add_argument("--kind", nargs="*", default=["object", "scene"])
+    args = parser.parse_args()
+
+    plain = TypeAdapter(List[_LABEL_TYPES])
+    discriminated = TypeAdapter(
+        List[Annotated[_LABEL_TYPES, Field(discriminator="type")]]
+    )
+    for kind in args.kind:
+        json_dict = make_eo_dataset_dict(
+            args.items, kind=kind, labels_per_item=args.labels_per_item
+        )
+        labels = [label for item in json_dict["data"] for label in item["labels"]]
+        plain_time = _time(plain.validate_python, labels)
+        discriminated_time = _time(discriminated.validate_python, labels)
+        parse_time = _time(parse_json, json_dict, True)
+        print(
+            "{:>6} {} labels: union {:7.3f}s  discriminated {:7.3f}s  ({:.1f}x)"
+            "  parse_json {:7.3f}s".format(
+                kind,
+                len(labels),
+                plain_time,
+                discriminated_time,
+                plain_time / discriminated_time,
+                parse_time,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Benchmark the compiled JSON Schema validator against pydantic validation.
+
+Builds ``--items`` synthetic data items of every ``--kinds`` with
+``--labels`` labels each and times ``parse_json`` with the ``pydantic`` and
+``schema`` validators, the schema check alone and, as a reference, the
+``jsonschema`` package on the same schema.
+
+Usage::
+
+    python -m benchmarks.bench_schema --items 20000 --labels 10
+"""
+
+import argparse
+import time
+
+from benchmarks.synthetic import make_eo_dataset_dict
+from pytdml.io import parse_json
+from pytdml.io.tdml_schema import get_schema_validator
+
+
+def _time(label, function, n_items):
+    start = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - start
+    print(
+        "  {:<22} {:.2f}s ({:.1f} us per item)".format(
+            label, elapsed, elapsed / n_items * 1e6
+        )
+    )
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--items", type=int, default=20000)
+    parser.add_argument("--labels", type=int, default=10)
+    parser.add_argument(
+        "--kinds", nargs="+", default=["scene", "object"], help="Label kinds"
+    )
+    parser.add_argument(
+        "--jsonschema-items",
+        type=int,
+        default=1000,
+        help="Items validated with the jsonschema package (0 to skip)",
+    )
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    validator = get_schema_validator()
+    print("schema compiled or loaded in {:.2f}s".format(time.perf_counter() - start))
+
+    for kind in args.kinds:
+        json_dict = make_eo_dataset_dict(args.items, kind, args.labels)
+        print("{} labels, {} items:".format(kind, args.items))
+        pydantic = _time(
+            "validator=pydantic",
+            lambda: parse_json(json_dict, validator="pydantic"),
+            args.items,
+        )
+        schema = _time(
+            "validator=schema",
+            lambda: parse_json(json_dict, validator="schema"),
+            args.items,
+        )
+        _time("schema check only", lambda: validator.validate(json_dict), args.items)
+        print("  speedup {:.1f}x".format(pydantic / schema))
+
+        if args.jsonschema_items:
+            import jsonschema
+
+            sample = dict(json_dict, data=json_dict["data"][: args.jsonschema_items])
+            reference = jsonschema.Draft202012Validator(validator.schema)
+            _time(
+                "jsonschema package",
+                lambda: reference.validate(sample),
+                args.jsonschema_items,
+            )
+
+
+if __name__ == "__main__":
+    main()
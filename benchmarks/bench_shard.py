@@ -0,0 +1,66 @@
+"""
+Benchmark loading a sharded encoding against a single TDML JSON file.
+
+Writes ``--items`` synthetic data items to one JSON file, reshards it with
+``--shard-size`` items per shard and times ``read_from_json`` and
+``read_sharded`` with every number of ``--workers``.
+
+Usage::
+
+    python -m benchmarks.bench_shard --items 100000 --workers 1 2 4 8
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.synthetic import write_eo_dataset
+from pytdml.io import read_from_json, read_sharded, write_sharded
+
+
+def _time(label, function, n_items, baseline=None):
+    start = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - start
+    print(
+        "{:<24} {:.2f}s ({:.0f} items/s{})".format(
+            label,
+            elapsed,
+            n_items / elapsed,
+            ", speedup {:.2f}".format(baseline / elapsed) if baseline else "",
+        )
+    )
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--items", type=int, default=100000)
+    parser.add_argument("--labels", type=int, default=10)
+    parser.add_argument("--kind", default="object", help="Label kind")
+    parser.add_argument("--shard-size", type=int, default=10000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, os.cpu_count()])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "dataset.json")
+        write_eo_dataset(path, args.items, args.kind, args.labels)
+        shards = os.path.join(tmp, "shards")
+        _time(
+            "write_sharded",
+            lambda: write_sharded(path, shards, args.shard_size),
+            args.items,
+        )
+        baseline = _time("read_from_json", lambda: read_from_json(path), args.items)
+        for workers in args.workers:
+            _time(
+                "read_sharded {} workers".format(workers),
+                lambda: read_sharded(shards, workers=workers),
+                args.items,
+                baseline,
+            )
+
+
+if __name__ == "__main__":
+    main()
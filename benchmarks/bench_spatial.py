@@ -0,0 +1,74 @@
+"""
+Benchmark area-of-interest selection with the spatial index.
+
+Builds ``--items`` synthetic data items with extents, then answers ``--queries``
+random bounding-box queries with ``SpatialIndex.query_bbox`` and with a Python
+loop over the items.
+
+Usage::
+
+    python -m benchmarks.bench_spatial --items 200000 --queries 1000
+"""
+
+import argparse
+import random
+import time
+
+from benchmarks.synthetic import make_eo_dataset_dict
+from pytdml.io import SpatialIndex
+
+
+def _loop_query(items, bbox):
+    return [
+        position
+        for position, item in enumerate(items)
+        if item["extent"][0] <= bbox[2]
+        and item["extent"][2] >= bbox[0]
+        and item["extent"][1] <= bbox[3]
+        and item["extent"][3] >= bbox[1]
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--items", type=int, default=200000)
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("--loop-queries", type=int, default=20)
+    args = parser.parse_args()
+
+    items = make_eo_dataset_dict(args.items, "scene", labels_per_item=1)["data"]
+    start = time.perf_counter()
+    index = SpatialIndex.from_items(items)
+    print("built {} entries in {:.2f}s".format(len(index), time.perf_counter() - start))
+
+    rng = random.Random(0)
+    bounds = index.bounds
+    queries = []
+    for _ in range(args.queries):
+        x = rng.uniform(bounds[0], bounds[2])
+        y = rng.uniform(bounds[1], bounds[3])
+        queries.append((x, y, x + 0.5, y + 0.5))
+
+    start = time.perf_counter()
+    hits = sum(len(index.query_bbox(bbox)) for bbox in queries)
+    indexed = time.perf_counter() - start
+    print(
+        "query_bbox: {} queries in {:.3f}s ({:.1f} us each, {} hits)".format(
+            len(queries), indexed, indexed / len(queries) * 1e6, hits
+        )
+    )
+
+    loop_queries = queries[: args.loop_queries]
+    start = time.perf_counter()
+    for bbox in loop_queries:
+        _loop_query(items, bbox)
+    loop = time.perf_counter() - start
+    print(
+        "loop: {} queries in {:.3f}s ({:.1f} ms each)".format(
+            len(loop_queries), loop, loop / len(loop_queries) * 1e3
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Benchmark compute_statistics on a large object detection dataset.
+
+Builds ``--items`` synthetic data items with ``--labels`` object labels each
+and times ``compute_statistics`` on the lazily read dataset (items are JSON
+dicts) and on ``--parsed-items`` of them as validated objects.
+
+Usage::
+
+    python -m benchmarks.bench_statistics --items 100000 --labels 10
+"""
+
+import argparse
+import time
+
+from benchmarks.synthetic import make_eo_dataset_dict
+from pytdml.io import compute_statistics, parse_json
+
+
+def _time(label, td, n_labels):
+    start = time.perf_counter()
+    compute_statistics(td)
+    elapsed = time.perf_counter() - start
+    print(
+        "{}: {} labels in {:.2f}s ({:.2f} us per label)".format(
+            label, n_labels, elapsed, elapsed / n_labels * 1e6
+        )
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--items", type=int, default=100000)
+    parser.add_argument("--labels", type=int, default=10)
+    parser.add_argument("--parsed-items", type=int, default=10000)
+    args = parser.parse_args()
+
+    json_dict = make_eo_dataset_dict(args.items, "object", args.labels)
+    lazy = parse_json(json_dict, lazy=True)
+    _time("JSON dict items", lazy, args.items * args.labels)
+
+    json_dict["data"] = json_dict["data"][: args.parsed_items]
+    parsed = parse_json(json_dict, validate=False)
+    _time("object items", parsed, args.parsed_items * args.labels)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Benchmark validated against trusted (``validate=False``) loading.
+
+Writes a synthetic encoding to a temporary file and measures
+``read_from_json(path)`` and ``read_from_json(path, validate=False)``.
+
+Usage::
+
+    python -m benchmarks.bench_trusted_load --items 100000 --kind object
+"""
+
+import argparse
+import gc
+import os
+import tempfile
+import time
+
+from benchmarks.synthetic import write_eo_dataset
+from pytdml.io import read_from_json
+
+
+def _measure(file_path, validate):
+    gc.collect()
+    start = time.perf_counter()
+    read_from_json(file_path, validate=validate)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--items", type=int, default=50000)
+    parser.add_argument("--kind", nargs="*", default=["object", "scene", "pixel"])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for kind in args.kind:
+            file_path = write_eo_dataset(
+                os.path.join(tmp, "{}.json".format(kind)), args.items, kind=kind
+            )
+            validated = _measure(file_path, validate=True)
+            trusted = _measure(file_path, validate=False)
+            print(
+                "{:>6} {} items: validated {:8.3f}s  trusted {:8.3f}s  ({:.1f}x)".format(
+                    kind, args.items, validated, trusted, validated / trusted
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Benchmark validate_file with one worker and with a process pool.
+
+Writes ``--items`` synthetic object detection items with ``--labels`` labels
+each to a temporary file and times a full validation with every number of
+``--workers``.
+
+Usage::
+
+    python -m benchmarks.bench_validate --items 100000 --workers 1 2 4 8
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.synthetic import write_eo_dataset
+from pytdml.io import validate_file
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--items", type=int, default=100000)
+    parser.add_argument("--labels", type=int, default=10)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, os.cpu_count()])
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "dataset.json")
+        write_eo_dataset(path, args.items, "object", args.labels)
+        baseline = None
+        for workers in args.workers:
+            start = time.perf_counter()
+            issues = sum(
+                1 for _ in validate_file(path, workers, chunk_size=args.chunk_size)
+            )
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(
+                "{} workers: {} items in {:.2f}s ({:.0f} items/s, speedup {:.2f}), "
+                "{} issues".format(
+                    workers,
+                    args.items,
+                    elapsed,
+                    args.items / elapsed,
+                    baseline / elapsed,
+                    issues,
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
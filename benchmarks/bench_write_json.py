@@ -0,0 +1,75 @@
+"""
+Benchmark writing a TDML encoding.
+
+Compares the previous ``write_to_json`` path, which encodes
+``remove_empty_values(td.to_dict())`` in one go, with the incremental
+``dump_json`` that serializes and writes one data item at a time.
+
+Usage::
+
+    python -m benchmarks.bench_write_json --items 50000 --kind object
+"""
+
+import argparse
+import gc
+import os
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.synthetic import make_eo_dataset_dict
+from pytdml.io import get_json_backend, parse_json
+from pytdml.io.tdml_writers import dump_json, remove_empty_values
+
+
+def _write_in_one_go(td, file_path, backend):
+    backend.dump(remove_empty_values(td.to_dict()), file_path, indent=4)
+
+
+def _write_incrementally(td, file_path, backend):
+    with open(file_path, "wb") as f:
+        dump_json(td, f, indent=4, backend=backend)
+
+
+def _measure(func, td, file_path, backend):
+    gc.collect()
+    start = time.perf_counter()
+    func(td, file_path, backend)
+    elapsed = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    func(td, file_path, backend)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--items", type=int, default=50000)
+    parser.add_argument(
+        "--kind", default="object", choices=["scene", "object", "pixel"]
+    )
+    parser.add_argument("--backend", default=None)
+    args = parser.parse_args()
+
+    backend = get_json_backend(args.backend)
+    td = parse_json(
+        make_eo_dataset_dict(args.items, kind=args.kind), take_ownership=True
+    )
+    print("{} {} items, {} backend".format(args.items, args.kind, backend.name))
+    with tempfile.TemporaryDirectory() as tmp:
+        file_path = os.path.join(tmp, "out.json")
+        for label, func in (
+            ("to_dict + remove_empty_values", _write_in_one_go),
+            ("dump_json", _write_incrementally),
+        ):
+            elapsed, peak = _measure(func, td, file_path, backend)
+            print(
+                "{:<32} {:8.3f}s  peak {:8.1f} MiB".format(label, elapsed, peak / 2**20)
+            )
+
+
+if __name__ == "__main__":
+    main()
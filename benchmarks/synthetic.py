@@ -0,0 +1,177 @@
+"""
+Synthetic TDML encodings for the benchmarks.
+
+The generated dicts follow the TrainingDML-AI JSON encoding, so they can be
+fed to ``parse_json`` or dumped to disk and read with ``read_from_json``.
+"""
+
+import json
+import random
+
+CLASSES = ["Airport", "Bridge", "Forest", "Harbor", "Parking", "Residential"]
+TRAINING_TYPES = ["training", "validation", "test"]
+
+
+def _scene_labels(rng, n_labels):
+    return [
+        {"type": "AI_SceneLabel", "class": rng.choice(CLASSES)} for _ in range(n_labels)
+    ]
+
+
+def _object_labels(rng, n_labels):
+    labels = []
+    for _ in range(n_labels):
+        x, y = rng.uniform(0, 900), rng.uniform(0, 900)
+        w, h = rng.uniform(8, 100), rng.uniform(8, 100)
+        ring = [[x, y], [x + w, y], [x + w, y + h], [x, y + h], [x, y]]
+        labels.append(
+            {
+                "type": "AI_ObjectLabel",
+                "isNegative": False,
+                "confidence": 1.0,
+                "bboxType": "Horizontal BBox",
+                "class": rng.choice(CLASSES),
+                "object": {
+                    "type": "Feature",
+                    "properties": {},
+                    "geometry": {"type": "Polygon", "coordinates": [ring]},
+                },
+            }
+        )
+    return labels
+
+
+def _pixel_labels(rng, n_labels, index):
+    return [
+        {
+            "type": "AI_PixelLabel",
+            "imageURL": ["labels/{:08d}_{}.png".format(index, i)],
+            "imageFormat": ["image/png"],
+        }
+        for i in range(n_labels)
+    ]
+
+
+def make_eo_dataset_dict(n_items, kind="object", labels_per_item=10, seed=0):
+    """
+    Builds an ``AI_EOTrainingDataset`` JSON dict with ``n_items`` data items.
+
+    ``kind`` is one of ``"scene"``, ``"object"`` or ``"pixel"`` and selects the
+    label type of every data item.
+    """
+    rng = random.Random(seed)
+    data = []
+    for i in range(n_items):
+        if kind == "scene":
+            labels = _scene_labels(rng, 1)
+        elif kind == "object":
+            labels = _object_labels(rng, labels_per_item)
+        elif kind == "pixel":
+            labels = _pixel_labels(rng, 1, i)
+        else:
+            raise ValueError("Unknown label kind: {}".format(kind))
+        lon, lat = rng.uniform(-180, 170), rng.uniform(-80, 70)
+        data.append(
+            {
+                "type": "AI_EOTrainingData",
+                "id": "item-{:08d}".format(i),
+                "dataURL": ["s3://bucket/images/{:08d}.tif".format(i)],
+                "labels": labels,
+                "numberOfLabels": len(labels),
+                "trainingType": rng.choice(TRAINING_TYPES),
+                "extent": [lon, lat, lon + 0.05, lat + 0.05],
+                "dataTime": [
+                    "{}-{:02d}-{:02d}".format(
+                        rng.randint(2015, 2023), rng.randint(1, 12), rng.randint(1, 28)
+                    )
+                ],
+            }
+        )
+    return {
+        "type": "AI_EOTrainingDataset",
+        "id": "synthetic-{}".format(kind),
+        "name": "Synthetic {} dataset".format(kind),
+        "description": "Synthetic dataset generated for benchmarking",
+        "license": "CC BY 4.0",
+        "tasks": [
+            {"type": "AI_EOTask", "id": "synthetic-task", "taskType": "Benchmark"}
+        ],
+        "data": data,
+        "amountOfTrainingData": n_items,
+        "classes": [{"key": c, "value": i} for i, c in enumerate(CLASSES)],
+        "numberOfClasses": len(CLASSES),
+    }
+
+
+def write_eo_dataset(file_path, n_items, kind="object", labels_per_item=10, seed=0):
+    """
+    Writes a synthetic encoding to ``file_path`` and returns the path.
+    """
+    with open(file_path, "w", encoding="utf-8") as f:
+        json.dump(make_eo_dataset_dict(n_items, kind, labels_per_item, seed), f)
+    return file_path
+
+
+def make_coco_dict(n_images, annotations_per_image=7, seed=0):
+    """
+    Builds a COCO object detection JSON dict with ``n_images`` images that can
+    be read with ``convert_coco_to_tdml``.
+    """
+    rng = random.Random(seed)
+    images = []
+    annotations = []
+    for i in range(n_images):
+        width, height = rng.choice([(640, 480), (640, 427), (500, 375)])
+        split = rng.choice(["train2017", "val2017"])
+        images.append(
+            {
+                "license": 1,
+                "file_name": "{:012d}.jpg".format(i),
+                "coco_url": "http://images.cocodataset.org/{}/{:012d}.jpg".format(
+                    split, i
+                ),
+                "height": height,
+                "width": width,
+                "date_captured": "2013-11-14 17:02:52",
+                "id": i,
+            }
+        )
+        for _ in range(annotations_per_image):
+            x, y = rng.uniform(0, width - 40), rng.uniform(0, height - 40)
+            w, h = rng.uniform(4, 40), rng.uniform(4, 40)
+            annotations.append(
+                {
+                    "segmentation": [[x, y, x + w, y, x + w, y + h, x, y + h]],
+                    "area": w * h,
+                    "iscrowd": 0,
+                    "image_id": i,
+                    "bbox": [x, y, w, h],
+                    "category_id": rng.randint(1, len(CLASSES)),
+                    "id": len(annotations),
+                }
+            )
+    return {
+        "info": {
+            "description": "Synthetic COCO dataset",
+            "version": "1.0",
+            "year": 2017,
+            "contributor": "pytdml benchmarks",
+            "date_created": "2017/09/01",
+        },
+        "licenses": [{"id": 1, "name": "CC BY 4.0", "url": ""}],
+        "images": images,
+        "annotations": annotations,
+        "categories": [
+            {"supercategory": "scene", "id": i + 1, "name": c}
+            for i, c in enumerate(CLASSES)
+        ],
+    }
+
+
+def write_coco_dataset(file_path, n_images, annotations_per_image=7, seed=0):
+    """
+    Writes a synthetic COCO file to ``file_path`` and returns the path.
+    """
+    with open(file_path, "w", encoding="utf-8") as f:
+        json.dump(make_coco_dict(n_images, annotations_per_image, seed), f)
+    return file_path
@@ -88,7 +88,8 @@ class EOTrainingDatasetCollection:
             dataset_name (str): dataset name.
 
         Returns:
-            EOTrainingDataset: Training Dataset Markup Language of the dataset .
+            EOTrainingDataset: Training Dataset Markup Language of the dataset. Data items
+            are validated on first access.
         """
         datasets_item = list(
             filter(
@@ -102,7 +103,7 @@ class EOTrainingDatasetCollection:
                 "dataset {} is not in Collections, Please check your input parameters!"
             )
 
-        datasets_tdml = internal.read_from_server(datasets_item[0]["name"])
+        datasets_tdml = internal.read_from_server(datasets_item[0]["name"], lazy=True)
         return datasets_tdml
 
     def fetch_tdml(self, url):
@@ -128,7 +129,7 @@ class EOTrainingDatasetCollection:
                     "Failed to import requests, please install the library first"
                 )
             response = requests.get(url).json()
-            dataset_td_encode = parse_json(response)
+            dataset_td_encode = parse_json(response, take_ownership=True)
 
             # If the URL is an HTTP/HTTPS link, send a GET request and retrieve the JSON response
             return dataset_td_encode
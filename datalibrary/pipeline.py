@@ -98,7 +98,7 @@ class SceneClassificationTDPipeline:
         cls_list = self.dataset.classes
         class_map = create_classes_map_(cls_list)
 
-        cache_file_path = utils.generate_cache_file_path(self.root, self.dataset.name)
+        cache_file_path = utils.dataset_cache_file_path(self.root, self.dataset)
         td_list = utils.load_cached_training_data(cache_file_path)
         # if the dataset is initially local
         if len(td_list) == 0:
@@ -142,7 +142,7 @@ class SceneClassificationTDPipeline:
         """
         # if isinstance(self.dataset, EOTrainingDataset):
         class_map = create_classes_map_(self.dataset.classes)
-        cache_path = utils.generate_cache_file_path(self.root, self.dataset.name)
+        cache_path = utils.dataset_cache_file_path(self.root, self.dataset)
         return tdml_torch_data_pipe.TorchSceneClassificationDataPipe(
             self.dataset.data, self.root, cache_path, class_map, transform
         )
@@ -150,7 +150,7 @@ class SceneClassificationTDPipeline:
     def tensorflow_data_pipe(self):
 
         class_map = create_classes_map_(self.dataset.classes)
-        cache_path = utils.generate_cache_file_path(self.root, self.dataset.name)
+        cache_path = utils.dataset_cache_file_path(self.root, self.dataset)
         return tdml_tensorflow.TensorSceneClassificationDataPipe(
             self.dataset, self.root, cache_path, class_map
         )
@@ -184,8 +184,8 @@ class ObjectDetectionTDPipeline:
 
         class_map = create_classes_map_(self.dataset.classes)
 
-        cache_file_path = utils.generate_cache_file_path(
-            self.root, self.dataset.name, self.crop
+        cache_file_path = utils.dataset_cache_file_path(
+            self.root, self.dataset, self.crop
         )
         td_list = utils.load_cached_training_data(cache_file_path)
         # if the dataset is initially local
@@ -229,9 +229,7 @@ class ObjectDetectionTDPipeline:
             TorchDPEOImageObjectTD: A data pipe object that can be used for training an object detection model.
         """
         class_map = create_classes_map_(self.dataset.classes)
-        cache_path = utils.generate_cache_file_path(
-            self.root, self.dataset.name, self.crop
-        )
+        cache_path = utils.dataset_cache_file_path(self.root, self.dataset, self.crop)
         return tdml_torch_data_pipe.TorchObjectDetectionDataPipe(
             self.dataset.data, self.root, cache_path, class_map, self.crop, transform
         )
@@ -264,9 +262,7 @@ class SemanticSegmentationTDPipeline:
             The cache file is generated using the `get_cache_path` function from the `eo_utils` module.
         """
 
-        cache_path = utils.generate_cache_file_path(
-            self.root, self.dataset.name, self.crop
-        )
+        cache_path = utils.dataset_cache_file_path(self.root, self.dataset, self.crop)
         return tdml_torch_data_pipe.TorchSemanticSegmentationDataPipe(
             self.dataset.data,
             self.root,
@@ -296,8 +292,8 @@ class SemanticSegmentationTDPipeline:
         """
         # if isinstance(self.dataset, EOTrainingDataset):
 
-        cache_file_path = utils.generate_cache_file_path(
-            self.root, self.dataset.name, self.crop
+        cache_file_path = utils.dataset_cache_file_path(
+            self.root, self.dataset, self.crop
         )
         td_list = utils.load_cached_training_data(cache_file_path)
         # if the dataset is initially local
@@ -338,8 +334,8 @@ class ChangeDetectionTDPipeline:
 
         if isinstance(self.dataset, EOTrainingDataset):
 
-            cache_file_path = utils.generate_cache_file_path(
-                self.root, self.dataset.name, self.crop
+            cache_file_path = utils.dataset_cache_file_path(
+                self.root, self.dataset, self.crop
             )
             td_list = utils.load_cached_training_data(cache_file_path)
             # if the dataset is initially local
@@ -365,9 +361,7 @@ class ChangeDetectionTDPipeline:
             TorchDPEOImageChangeDetectionTD: A data pipe object that can be used for training an image change
              detection model.
         """
-        cache_path = utils.generate_cache_file_path(
-            self.root, self.dataset.name, self.crop
-        )
+        cache_path = utils.dataset_cache_file_path(self.root, self.dataset, self.crop)
         return tdml_torch_data_pipe.TorchChangeDetectionDataPipe(
             self.dataset.data, self.root, cache_path, self.crop, transform
         )
@@ -399,9 +393,7 @@ class Model3DReconstructionTDPipeLine:
             TorchEOImageStereoTD: A stereo image dataset object that can be used for training or inference.
         """
 
-        cache_file_path = utils.generate_cache_file_path(
-            self.root, self.dataset.name, self.crop
-        )
+        cache_file_path = utils.dataset_cache_file_path(self.root, self.dataset)
         td_list = utils.load_cached_training_data(cache_file_path)
         # if the dataset is initially local
         if len(td_list) == 0:
@@ -28,8 +28,40 @@
 # SOFTWARE.
 #
 # ------------------------------------------------------------------------------
-from pytdml.io.tdml_readers import read_from_json, parse_json
-from pytdml.io.tdml_writers import write_to_json
+from pytdml.io.tdml_readers import (
+    read_from_json,
+    parse_json,
+    parse_training_data,
+    iter_training_data,
+    TrainingDataStream,
+)
+from pytdml.io.tdml_writers import write_to_json, dump_json, TDMLStreamWriter
+from pytdml.io.json_backend import get_json_backend, available_backends
+from pytdml.io.compression import open_tdml_file
+from pytdml.io.tdml_index import build_index, open_indexed, IndexedTrainingData
+from pytdml.io.tdml_binary import write_to_binary, read_from_binary
+from pytdml.io.tdml_parquet import to_parquet, from_parquet, read_parquet_columns
+from pytdml.io.tdml_store import TDMLStore
+from pytdml.io.tdml_diff import diff
+from pytdml.io.tdml_spatial import (
+    SpatialIndex,
+    build_spatial_index,
+    open_spatial_index,
+)
+from pytdml.io.tdml_temporal import TemporalIndex
+from pytdml.io.tdml_statistics import compute_statistics
+from pytdml.io.tdml_validate import validate_file, ValidationIssue
+from pytdml.io.tdml_shard import (
+    write_sharded,
+    read_sharded,
+    open_sharded,
+    ShardedEncoding,
+)
+from pytdml.io.tdml_schema import (
+    SchemaValidator,
+    SchemaValidationError,
+    tdml_json_schema,
+)
 from pytdml.io.yaml_converter import yaml_to_eo_tdml, yaml_to_tdml
 from pytdml.io.coco_converter import convert_coco_to_tdml
 from pytdml.io.stac_converter import convert_stac_to_tdml
@@ -0,0 +1,200 @@
+"""
+Incremental scanner for the top level of a TDML JSON document.
+
+The scanner walks a binary stream chunk by chunk and reports every top-level
+member. Elements of one array member (usually ``data``) are reported one at a
+time together with their absolute byte span, so a huge encoding can be
+processed without holding the whole document in memory.
+
+Values are decoded with the C JSON decoder running over a latin-1 view of the
+UTF-8 bytes: latin-1 maps every byte to one character, so character positions
+are byte offsets and structural characters are unaffected. Values that contain
+non-ASCII bytes are decoded again from their UTF-8 bytes.
+"""
+
+import json
+
+MEMBER = "member"
+ITEM = "item"
+STREAM = "stream"
+END = "end"
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+_NUMBER_CHARS = "0123456789+-.eE"
+
+
+class _Buffer:
+    """
+    Growable window over a binary stream with absolute offsets
+    """
+
+    def __init__(self, fp, chunk_size):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.data = b""
+        self.text = ""
+        self.base = 0
+        self.eof = False
+
+    def fill(self, size=None):
+        if self.eof:
+            return False
+        chunk = self.fp.read(size or self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.data += chunk
+        self.text += chunk.decode("latin-1")
+        return True
+
+    def compact(self, i):
+        # Only drop consumed bytes once they are worth the copy
+        if i < self.chunk_size:
+            return i
+        self.data = self.data[i:]
+        self.text = self.text[i:]
+        self.base += i
+        return 0
+
+    def peek(self, i):
+        """
+        Skips whitespace from ``i`` and returns the position and the character there
+        """
+        text = self.text
+        while True:
+            while i < len(text) and text[i] in _WHITESPACE:
+                i += 1
+            if i < len(text):
+                return i, text[i]
+            if not self.fill():
+                raise ValueError("Unexpected end of JSON document")
+            text = self.text
+
+    def expect(self, i, char):
+        i, found = self.peek(i)
+        if found != char:
+            raise ValueError(
+                "Expected {!r} at byte {}, found {!r}".format(
+                    char, self.base + i, found
+                )
+            )
+        return i + 1
+
+    def decode_value(self, i):
+        """
+        Decodes the JSON value starting at ``i``, reading more of the stream
+        until it is complete. Returns the value and its end position.
+        """
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.text, i)
+            except json.JSONDecodeError as e:
+                # Grow geometrically so that large values are not re-scanned
+                # once per chunk
+                if not self.fill(max(self.chunk_size, len(self.data) - i)):
+                    raise ValueError(
+                        "Invalid JSON value at byte {}: {}".format(self.base + i, e.msg)
+                    ) from None
+                continue
+            # A number cut by the chunk boundary decodes as a shorter number
+            # ("1." or "1e" as 1), so make sure the number is terminated
+            if isinstance(value, (int, float)) and not self.eof:
+                j = end
+                while j < len(self.text) and self.text[j] in _NUMBER_CHARS:
+                    j += 1
+                if j == len(self.text):
+                    self.fill()
+                    continue
+            raw = self.data[i:end]
+            if not raw.isascii():
+                value = json.loads(raw)
+            return value, raw, end
+
+
+def iter_members(fp, stream_key="data", chunk_size=DEFAULT_CHUNK_SIZE, items=True):
+    """
+    Scans the top-level object of the JSON document in the binary stream ``fp``.
+
+    Yields ``(MEMBER, key, value, raw, start, end)`` for every top-level member
+    and ``(ITEM, index, value, raw, start, end)`` for every element of the
+    array member named ``stream_key``. ``value`` is the decoded value, ``raw``
+    its UTF-8 bytes and ``start``/``end`` its absolute byte span in the stream.
+
+    With ``items=False`` the scan stops at the array member named
+    ``stream_key``: ``(STREAM, key, None, None, start, None)`` is yielded
+    last, ``start`` being the byte offset of its first element (or of its
+    closing bracket if it is empty), see ``iter_elements``.
+    """
+    buf = _Buffer(fp, chunk_size)
+    i = buf.expect(0, "{")
+    i, char = buf.peek(i)
+    if char == "}":
+        return
+    while True:
+        i, char = buf.peek(i)
+        if char != '"':
+            raise ValueError("Expected a key at byte {}".format(buf.base + i))
+        key, _, end = buf.decode_value(i)
+        i = buf.expect(end, ":")
+        i, char = buf.peek(i)
+        if key == stream_key and char == "[":
+            index = 0
+            i, char = buf.peek(i + 1)
+            if not items:
+                yield STREAM, key, None, None, buf.base + i, None
+                return
+            while char != "]":
+                value, raw, end = buf.decode_value(i)
+                yield ITEM, index, value, raw, buf.base + i, buf.base + end
+                index += 1
+                i, char = buf.peek(buf.compact(end))
+                if char == ",":
+                    i, char = buf.peek(i + 1)
+                elif char != "]":
+                    raise ValueError(
+                        "Expected ',' or ']' at byte {}".format(buf.base + i)
+                    )
+            i += 1
+        else:
+            value, raw, end = buf.decode_value(i)
+            yield MEMBER, key, value, raw, buf.base + i, buf.base + end
+            i = buf.compact(end)
+        i, char = buf.peek(i)
+        if char == "}":
+            return
+        if char != ",":
+            raise ValueError("Expected ',' or '}}' at byte {}".format(buf.base + i))
+        i += 1
+
+
+def iter_elements(fp, offset, stop=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Scans the elements of a JSON array in the seekable binary stream ``fp``
+    from byte ``offset``, which must be the start of one of its elements (or
+    its closing bracket).
+
+    Yields ``(ITEM, value, raw, start, end)`` for every element up to the end
+    of the array, then ``(END, None, None, start, end)`` with the span of the
+    closing bracket. With ``stop``, the scan ends instead at the first element
+    that starts at or after it, without decoding it:
+    ``(STREAM, None, None, start, None)`` is yielded last.
+    """
+    fp.seek(offset)
+    buf = _Buffer(fp, chunk_size)
+    buf.base = offset
+    i, char = buf.peek(0)
+    while char != "]":
+        if stop is not None and buf.base + i >= stop:
+            yield STREAM, None, None, buf.base + i, None
+            return
+        value, raw, end = buf.decode_value(i)
+        yield ITEM, value, raw, buf.base + i, buf.base + end
+        i, char = buf.peek(buf.compact(end))
+        if char == ",":
+            i, char = buf.peek(i + 1)
+        elif char != "]":
+            raise ValueError("Expected ',' or ']' at byte {}".format(buf.base + i))
+    yield END, None, None, buf.base + i, buf.base + i + 1
@@ -1,10 +1,10 @@
-import json
 import os
 import re
 from datetime import datetime
 
 from geojson import Feature
 
+from pytdml.io.json_backend import get_json_backend
 from pytdml.type import (
     AI_EOTrainingData,
     EOTrainingDataset,
@@ -88,18 +88,18 @@ def parse_date(input_date):
     return "Invalid date format"
 
 
-def convert_coco_to_tdml(cocofile):
+def convert_coco_to_tdml(cocofile, backend=None):
     """
     Reads data from a COCO-formatted JSON file and converts it to a TDML object.
 
     params:
         coco_dataset_path (str): JSON file in COCO format
+        backend: JSON backend used to read the file (see ``get_json_backend``)
 
     return:
         EOTrainingDataset
     """
-    with open(cocofile, "r") as file:
-        coco_dataset = json.load(file)
+    coco_dataset = get_json_backend(backend).load(cocofile)
 
     try:
         info = coco_dataset["info"]
@@ -0,0 +1,67 @@
+"""
+Transparent compression of TDML files, chosen by the file extension.
+
+``dataset.json.gz`` (gzip), ``dataset.json.zst`` (zstd, requires
+``zstandard``) and ``dataset.json.xz`` (xz) are opened as streams that
+decompress on read and compress on write, so callers that read or write
+incrementally never hold the uncompressed text in memory. Other paths are
+opened as plain binary files.
+"""
+
+import gzip
+import lzma
+import os
+
+COMPRESSIONS = {".gz": "gzip", ".zst": "zstd", ".xz": "xz"}
+
+# Levels that compress TDML encodings well at a fraction of the maximum cost
+_GZIP_LEVEL = 6
+_ZSTD_LEVEL = 3
+
+
+def _import_zstd():
+    try:
+        import zstandard
+    except ModuleNotFoundError:
+        raise ModuleNotFoundError(
+            "Failed to import zstandard, please install the library first"
+        )
+    return zstandard
+
+
+def compression_of(file_path):
+    """
+    Returns the compression of a file by its extension ("gzip", "zstd" or
+    "xz"), None for a plain file
+    """
+    if not isinstance(file_path, (str, os.PathLike)):
+        return None
+    return COMPRESSIONS.get(os.path.splitext(os.fspath(file_path))[1].lower())
+
+
+def open_tdml_file(file_path, mode="rb"):
+    """
+    Opens a TDML file for binary reading (``mode="rb"``) or writing
+    (``mode="wb"``), decompressing or compressing it on the fly according to
+    its extension
+    """
+    if mode not in ("rb", "wb"):
+        raise ValueError("Unsupported mode: {}, expected rb or wb".format(mode))
+    compression = compression_of(file_path)
+    if compression is None:
+        return open(file_path, mode)
+    if compression == "gzip":
+        if mode == "wb":
+            return gzip.open(file_path, mode, compresslevel=_GZIP_LEVEL)
+        return gzip.open(file_path, mode)
+    if compression == "xz":
+        return lzma.open(file_path, mode)
+    zstandard = _import_zstd()
+    if mode == "wb":
+        # Compression runs in zstd worker threads, next to the encoding
+        return zstandard.open(
+            file_path,
+            mode,
+            cctx=zstandard.ZstdCompressor(level=_ZSTD_LEVEL, threads=-1),
+        )
+    return zstandard.open(file_path, mode)
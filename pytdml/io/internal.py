@@ -3,15 +3,18 @@ from io import BytesIO
 
 from datalibrary.s3Client import minio_client as client
 from pytdml.type.extended_types import EOTrainingDataset
+from pytdml.type.lazy_types import LazyEOTrainingDataset
 
 
-def read_from_server(name):
+def read_from_server(name, lazy=False):
     print("reading dataset " + name + "...")
     encode_data = client.get_object("pytdml", "datasetTDEncodes/" + name + ".json")
     json_dict = json.load(BytesIO(encode_data.read()))
     print("parsing dataset " + name + "...")
     if json_dict["type"] == "AI_EOTrainingDataset":
-        return EOTrainingDataset.from_dict(json_dict)
+        if lazy:
+            return LazyEOTrainingDataset.from_dict(json_dict, take_ownership=True)
+        return EOTrainingDataset.from_dict(json_dict, take_ownership=True)
     else:
         raise ValueError("Unknown TDML type: {}".format(json_dict["type"]))
 
@@ -0,0 +1,198 @@
+"""
+Pluggable JSON backends for reading and writing TDML encodings.
+
+A backend is chosen by name (``"orjson"``, ``"ujson"`` or ``"stdlib"``), by the
+``PYTDML_JSON_BACKEND`` environment variable, or automatically (``"auto"``):
+orjson if it is installed, then ujson, then the standard library. Readers
+choose automatically by default; writers use the standard library unless a
+backend is requested, so that the bytes written do not depend on which
+libraries are installed. Every
+backend reads and writes UTF-8 bytes directly, so files are opened in binary
+mode and no text-mode decode/encode pass is made. Compressed files are
+decompressed and compressed by their extension (see ``compression``).
+"""
+
+import json
+import os
+
+from pytdml.io.compression import open_tdml_file
+from pytdml.type._utils import _gc_paused
+
+JSON_BACKEND_ENV = "PYTDML_JSON_BACKEND"
+
+_BACKEND_NAMES = ("orjson", "ujson", "stdlib")
+
+
+class JSONBackend:
+    """
+    Base class of the JSON backends
+    """
+
+    name = None
+
+    def loads(self, data):
+        """
+        Decodes a JSON document from bytes (or str)
+        """
+        with _gc_paused():
+            return self._loads(data)
+
+    def dumps(self, obj, indent=None, sort_keys=False):
+        """
+        Encodes ``obj`` to UTF-8 JSON bytes. Non-ASCII characters are written
+        as is, like ``json.dumps(obj, ensure_ascii=False)``. Keys of objects
+        are sorted if ``sort_keys`` is True.
+        """
+        raise NotImplementedError
+
+    def _loads(self, data):
+        raise NotImplementedError
+
+    def load(self, file_path):
+        with open_tdml_file(file_path) as f:
+            return self.loads(f.read())
+
+    def dump(self, obj, file_path, indent=None):
+        with open_tdml_file(file_path, "wb") as f:
+            f.write(self.dumps(obj, indent=indent))
+
+    def __repr__(self):
+        return "{}()".format(type(self).__name__)
+
+
+class StdlibJSONBackend(JSONBackend):
+    name = "stdlib"
+
+    def _loads(self, data):
+        return json.loads(data)
+
+    def dumps(self, obj, indent=None, sort_keys=False):
+        return json.dumps(
+            obj, indent=indent, ensure_ascii=False, sort_keys=sort_keys
+        ).encode("utf-8")
+
+
+def _reindent(data, indent):
+    """
+    Re-indents orjson's two-space indented output. JSON strings never contain a
+    raw newline or control character, so every newline is followed by
+    indentation only and ``\\x01`` can serve as a placeholder. Levels are
+    replaced deepest first so that a shallower pattern never matches them.
+    """
+    unit = indent.encode("utf-8") if isinstance(indent, str) else b" " * indent
+    depth = 1
+    while b"\n" + b"  " * (depth + 1) in data:
+        depth += 1
+    for level in range(depth, 0, -1):
+        data = data.replace(b"\n" + b"  " * level, b"\n" + b"\x01" * level)
+    return data.replace(b"\x01", unit)
+
+
+class OrjsonBackend(JSONBackend):
+    name = "orjson"
+
+    def __init__(self):
+        try:
+            import orjson
+        except ModuleNotFoundError:
+            raise ModuleNotFoundError(
+                "Failed to import orjson, please install the library first"
+            )
+        self._orjson = orjson
+
+    def _loads(self, data):
+        return self._orjson.loads(data)
+
+    def dumps(self, obj, indent=None, sort_keys=False):
+        orjson = self._orjson
+        option = orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent is None:
+            return orjson.dumps(obj, option=option)
+        data = orjson.dumps(obj, option=option | orjson.OPT_INDENT_2)
+        # orjson only indents with two spaces
+        if indent != 2:
+            data = _reindent(data, indent)
+        return data
+
+
+class UjsonBackend(JSONBackend):
+    name = "ujson"
+
+    def __init__(self):
+        try:
+            import ujson
+        except ModuleNotFoundError:
+            raise ModuleNotFoundError(
+                "Failed to import ujson, please install the library first"
+            )
+        self._ujson = ujson
+
+    def _loads(self, data):
+        return self._ujson.loads(data)
+
+    def dumps(self, obj, indent=None, sort_keys=False):
+        if isinstance(indent, str):
+            # ujson only indents with spaces
+            return StdlibJSONBackend().dumps(obj, indent=indent, sort_keys=sort_keys)
+        return self._ujson.dumps(
+            obj,
+            indent=indent or 0,
+            ensure_ascii=False,
+            escape_forward_slashes=False,
+            sort_keys=sort_keys,
+        ).encode("utf-8")
+
+
+_BACKEND_CLASSES = {
+    "orjson": OrjsonBackend,
+    "ujson": UjsonBackend,
+    "stdlib": StdlibJSONBackend,
+}
+_backends = {}
+
+
+def available_backends():
+    """
+    Returns the names of the JSON backends that can be used, fastest first
+    """
+    names = []
+    for name in _BACKEND_NAMES:
+        try:
+            get_json_backend(name)
+        except ModuleNotFoundError:
+            continue
+        names.append(name)
+    return names
+
+
+def get_json_backend(backend=None, default="auto"):
+    """
+    Returns a JSON backend.
+
+    ``backend`` is a JSONBackend instance, a backend name or ``"auto"``. If it
+    is None, the ``PYTDML_JSON_BACKEND`` environment variable is used, and
+    ``default`` if that is not set either. A backend that is requested by name
+    but not installed raises ModuleNotFoundError.
+    """
+    if isinstance(backend, JSONBackend):
+        return backend
+    if backend is None:
+        backend = os.environ.get(JSON_BACKEND_ENV) or default
+    name = backend.lower()
+    if name == "auto":
+        for candidate in _BACKEND_NAMES:
+            try:
+                return get_json_backend(candidate)
+            except ModuleNotFoundError:
+                continue
+    if name not in _BACKEND_CLASSES:
+        raise ValueError(
+            "Unknown JSON backend: {}, expected one of {}".format(
+                backend, ", ".join(("auto",) + _BACKEND_NAMES)
+            )
+        )
+    if name not in _backends:
+        _backends[name] = _BACKEND_CLASSES[name]()
+    return _backends[name]
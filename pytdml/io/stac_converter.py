@@ -31,18 +31,18 @@
 #
 # ------------------------------------------------------------------------------
 
-import json
 import re
 from datetime import datetime
 from geojson import Feature
 from pystac import Collection
+from pytdml.io.json_backend import get_json_backend
 from pytdml.type import EOTrainingDataset, AI_EOTrainingData, AI_ObjectLabel, AI_EOTask
 
 
-def convert_stac_to_tdml(stac_dataset_path):
+def convert_stac_to_tdml(stac_dataset_path, backend=None):
     # Reads JSON data in stac format from a given path.
-    with open(stac_dataset_path, "r") as file:
-        collection_data = json.load(file)
+    json_backend = get_json_backend(backend)
+    collection_data = json_backend.load(stac_dataset_path)
     collection_object = Collection.from_dict(collection_data)
     stac_collection_dataset = collection_object.to_dict(
         include_self_link=False, transform_hrefs=True
@@ -81,8 +81,7 @@ def convert_stac_to_tdml(stac_dataset_path):
     datalist = []
     for link in collection_filtered_links:
         item_path = link.get("href")
-        with open(item_path, "r") as item_file:
-            stac_item = json.load(item_file)
+        stac_item = json_backend.load(item_path)
         link_id = stac_item.get("id")
         link_rel = link.get("rel")
         feature = Feature(**stac_item)
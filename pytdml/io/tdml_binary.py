@@ -0,0 +1,198 @@
+"""
+Compact binary TDML encoding based on MessagePack.
+
+A binary file holds the same JSON document as ``write_to_json`` writes::
+
+    header   "<8sB": magic, compression (0 none, 1 zstd)
+    payload  three MessagePack objects: string table, prefix table, document
+
+Repeated string values (types, classes, image formats, ...) are written once
+to the string table and referenced by index, and strings sharing a prefix up
+to their last "/" (data and label URLs) reference the prefix in the prefix
+table and only store their suffix. References are MessagePack extension
+values that are resolved while unpacking, so reading needs no extra pass over
+the document.
+"""
+
+import struct
+from collections import Counter
+
+from pytdml.io.json_backend import _gc_paused
+from pytdml.io.tdml_readers import parse_json
+from pytdml.io.tdml_writers import remove_empty_values
+
+BINARY_MAGIC = b"TDMLBIN1"
+
+_HEADER = struct.Struct("<8sB")
+_COMPRESSIONS = {None: 0, "zstd": 1}
+
+# Extension type of a string table reference, and of prefix references by the
+# byte width of their prefix index
+_STRING_REF = 1
+_PREFIX_REFS = {1: 2, 2: 3, 4: 4}
+_PREFIX_WIDTHS = {code: width for width, code in _PREFIX_REFS.items()}
+
+# Shorter strings are cheaper to store inline than as a reference
+_MIN_STRING_LENGTH = 4
+_MIN_PREFIX_LENGTH = 4
+
+
+def _import_msgpack():
+    try:
+        import msgpack
+    except ModuleNotFoundError:
+        raise ModuleNotFoundError(
+            "Failed to import msgpack, please install the library first"
+        )
+    return msgpack
+
+
+def _import_zstd():
+    try:
+        import zstandard
+    except ModuleNotFoundError:
+        raise ModuleNotFoundError(
+            "Failed to import zstandard, please install the library first"
+        )
+    return zstandard
+
+
+def _index_width(index):
+    return 1 if index < 0x100 else 2 if index < 0x10000 else 4
+
+
+def _count_strings(obj, strings, prefixes):
+    if isinstance(obj, dict):
+        for value in obj.values():
+            _count_strings(value, strings, prefixes)
+    elif isinstance(obj, list):
+        for value in obj:
+            _count_strings(value, strings, prefixes)
+    elif isinstance(obj, str) and len(obj) >= _MIN_STRING_LENGTH:
+        strings[obj] += 1
+        cut = obj.rfind("/") + 1
+        if cut >= _MIN_PREFIX_LENGTH:
+            prefixes[obj[:cut]] += 1
+
+
+class _Tables:
+    """
+    String and prefix tables of a document
+    """
+
+    def __init__(self, obj):
+        strings = Counter()
+        prefixes = Counter()
+        _count_strings(obj, strings, prefixes)
+        self.strings = [s for s, count in strings.most_common() if count > 1]
+        # Strings that are in the string table are not split by prefix
+        for s in self.strings:
+            cut = s.rfind("/") + 1
+            if cut >= _MIN_PREFIX_LENGTH:
+                prefixes[s[:cut]] -= strings[s]
+        self.prefixes = [p for p, count in prefixes.most_common() if count > 1]
+        self.string_index = {s: i for i, s in enumerate(self.strings)}
+        self.prefix_index = {p: i for i, p in enumerate(self.prefixes)}
+
+    def encode(self, obj, ext_type):
+        if isinstance(obj, dict):
+            return {key: self.encode(value, ext_type) for key, value in obj.items()}
+        if isinstance(obj, list):
+            return [self.encode(value, ext_type) for value in obj]
+        if isinstance(obj, str) and len(obj) >= _MIN_STRING_LENGTH:
+            index = self.string_index.get(obj)
+            if index is not None:
+                return ext_type(
+                    _STRING_REF, index.to_bytes(_index_width(index), "little")
+                )
+            cut = obj.rfind("/") + 1
+            index = self.prefix_index.get(obj[:cut]) if cut else None
+            if index is not None:
+                width = _index_width(index)
+                return ext_type(
+                    _PREFIX_REFS[width],
+                    index.to_bytes(width, "little") + obj[cut:].encode("utf-8"),
+                )
+        return obj
+
+
+def dumps_binary(json_dict, compression=None):
+    """
+    Encodes a TDML JSON dict to the binary encoding. ``compression`` is None
+    or ``"zstd"``.
+    """
+    if compression not in _COMPRESSIONS:
+        raise ValueError(
+            "Unknown compression: {}, expected None or 'zstd'".format(compression)
+        )
+    msgpack = _import_msgpack()
+    tables = _Tables(json_dict)
+    packer = msgpack.Packer(use_bin_type=True)
+    payload = b"".join(
+        (
+            packer.pack(tables.strings),
+            packer.pack(tables.prefixes),
+            packer.pack(tables.encode(json_dict, msgpack.ExtType)),
+        )
+    )
+    if compression == "zstd":
+        payload = _import_zstd().ZstdCompressor().compress(payload)
+    return _HEADER.pack(BINARY_MAGIC, _COMPRESSIONS[compression]) + payload
+
+
+def loads_binary(data):
+    """
+    Decodes the binary encoding back to the TDML JSON dict
+    """
+    if len(data) < _HEADER.size:
+        raise ValueError("Invalid binary TDML encoding")
+    magic, compression = _HEADER.unpack_from(data)
+    if magic != BINARY_MAGIC:
+        raise ValueError("Invalid binary TDML encoding")
+    payload = memoryview(data)[_HEADER.size :]
+    if compression == _COMPRESSIONS["zstd"]:
+        payload = _import_zstd().ZstdDecompressor().decompress(payload)
+    elif compression != _COMPRESSIONS[None]:
+        raise ValueError("Unknown compression of binary TDML encoding")
+    msgpack = _import_msgpack()
+
+    strings = []
+    prefixes = []
+
+    def ext_hook(code, ext_data):
+        if code == _STRING_REF:
+            return strings[int.from_bytes(ext_data, "little")]
+        width = _PREFIX_WIDTHS.get(code)
+        if width is None:
+            return msgpack.ExtType(code, ext_data)
+        prefix = prefixes[int.from_bytes(ext_data[:width], "little")]
+        return prefix + ext_data[width:].decode("utf-8")
+
+    unpacker = msgpack.Unpacker(
+        ext_hook=ext_hook, raw=False, max_buffer_size=max(len(payload), 1)
+    )
+    unpacker.feed(payload)
+    strings.extend(unpacker.unpack())
+    prefixes.extend(unpacker.unpack())
+    with _gc_paused():
+        return unpacker.unpack()
+
+
+def write_to_binary(td, file_path: str, compression=None):
+    """
+    Writes a TrainingDataset to a binary TDML file. The file stores the same
+    document as ``write_to_json``, ``compression="zstd"`` compresses it.
+    """
+    json_dict = remove_empty_values(td.to_dict())
+    with open(file_path, "wb") as f:
+        f.write(dumps_binary(json_dict, compression=compression))
+
+
+def read_from_binary(file_path: str, lazy: bool = False, validate: bool = True):
+    """
+    Reads a binary TDML file and returns a TrainingDataset object (see
+    ``parse_json`` for ``lazy`` and ``validate``)
+    """
+    with open(file_path, "rb") as f:
+        json_dict = loads_binary(f.read())
+    return parse_json(json_dict, take_ownership=True, lazy=lazy, validate=validate)
@@ -0,0 +1,144 @@
+"""
+Differences between two versions of a training dataset as an AI_TDChangeset.
+
+Data items are compared by id and by a hash of their JSON form with sorted
+keys. Items of a TrainingDataset are serialized as ``write_to_json`` writes
+them (without empty values) and items of a file as they are stored, so a file
+written by pytdml and the dataset it was written from have no differences.
+
+Both versions can be TDML JSON files, which are streamed: only the id and
+hash of every item of the old version are kept in memory, plus the items that
+end up in the changeset.
+"""
+
+import hashlib
+import os
+from datetime import datetime
+
+from pytdml.io._json_stream import ITEM, MEMBER, iter_members
+from pytdml.io.compression import open_tdml_file
+from pytdml.io.json_backend import get_json_backend
+from pytdml.io.tdml_readers import parse_training_data
+from pytdml.io.tdml_writers import remove_empty_values
+from pytdml.type import AI_TDChangeset
+from pytdml.type.lazy_types import LazyTrainingDataList
+
+
+def item_hash(json_item, backend=None):
+    """
+    Returns the hash of the JSON form of a data item dict with sorted keys.
+    Hashes are only comparable if they were computed with the same JSON
+    backend.
+    """
+    canonical = get_json_backend(backend).dumps(json_item, sort_keys=True)
+    return hashlib.blake2b(canonical, digest_size=16).digest()
+
+
+class _Version:
+    """
+    One version of a dataset, either a TrainingDataset or a TDML JSON file
+    """
+
+    def __init__(self, source):
+        self.source = source
+        self.is_file = isinstance(source, (str, os.PathLike))
+        self.header = {} if self.is_file else None
+
+    @property
+    def id(self):
+        return self.header.get("id") if self.is_file else self.source.id
+
+    @property
+    def version(self):
+        return self.header.get("version") if self.is_file else self.source.version
+
+    def items(self):
+        """
+        Yields (id, JSON dict, training data object or None) of every item
+        """
+        if self.is_file:
+            with open_tdml_file(self.source) as f:
+                for kind, key, value, _, _, _ in iter_members(f):
+                    if kind == ITEM:
+                        yield value.get("id"), value, None
+                    elif kind == MEMBER:
+                        self.header[key] = value
+            return
+        data = self.source.data or ()
+        if isinstance(data, LazyTrainingDataList):
+            # Items that were not accessed yet are hashed as they were read
+            data = data._items
+        for item in data:
+            if isinstance(item, dict):
+                yield item.get("id"), item, None
+            else:
+                yield item.id, remove_empty_values(item.to_dict()), item
+
+    def training_data(self, json_item, item, validate):
+        if item is not None:
+            return item
+        # Dicts of a lazy dataset still belong to it
+        return parse_training_data(
+            json_item, take_ownership=self.is_file, validate=validate
+        )
+
+
+def _duplicate(item_id, version):
+    return ValueError(
+        "Training data id {!r} is not unique in the {} version".format(item_id, version)
+    )
+
+
+def diff(old, new, changeset_id=None, validate=True, json_backend=None):
+    """
+    Returns the AI_TDChangeset that turns ``old`` into ``new``.
+
+    ``old`` and ``new`` are TrainingDataset objects or paths of TDML JSON
+    files. Items whose id only exists in ``new`` are added, items whose
+    content changed are modified and items whose id only exists in ``old``
+    are deleted. Data item ids must be unique in both versions. Items read
+    from files are validated unless ``validate`` is False. ``json_backend``
+    serializes the items to hash them (see ``get_json_backend``).
+
+    Files are streamed: ``old`` is read once to hash its items, ``new`` once
+    to compare them, and ``old`` a second time only if items were deleted.
+    """
+    backend = get_json_backend(json_backend)
+    old_version, new_version = _Version(old), _Version(new)
+    old_hashes = {}
+    for item_id, json_item, _ in old_version.items():
+        if item_id in old_hashes:
+            raise _duplicate(item_id, "old")
+        old_hashes[item_id] = item_hash(json_item, backend)
+
+    add = []
+    modify = []
+    seen = set()
+    for item_id, json_item, item in new_version.items():
+        if item_id in seen:
+            raise _duplicate(item_id, "new")
+        seen.add(item_id)
+        old_hash = old_hashes.get(item_id)
+        if old_hash is None:
+            add.append(new_version.training_data(json_item, item, validate))
+        elif old_hash != item_hash(json_item, backend):
+            modify.append(new_version.training_data(json_item, item, validate))
+
+    delete = []
+    if len(seen) - len(add) < len(old_hashes):
+        for item_id, json_item, item in old_version.items():
+            if item_id not in seen:
+                delete.append(old_version.training_data(json_item, item, validate))
+
+    old_id, new_id = old_version.id, new_version.id
+    return AI_TDChangeset(
+        type="AI_TDChangeset",
+        id=changeset_id or "{}-changeset".format(new_id or old_id),
+        change_count=len(add) + len(modify) + len(delete),
+        dataset_id=old_id,
+        version=new_version.version,
+        created_time=datetime.now().strftime("%Y-%m-%dT%H:%M:%S"),
+        add=add or None,
+        modify=modify or None,
+        delete=delete or None,
+    )
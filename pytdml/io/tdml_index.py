@@ -0,0 +1,263 @@
+"""
+Byte-offset index for random access into the data items of a TDML JSON file.
+
+The index is a binary sidecar (``<file>.idx`` by default) with the layout::
+
+    header     "<8sQQqQ": magic, item count, source file size, source file
+               modification time (ns), id bytes size
+    spans      2 * count little-endian uint64: start, end of every data item
+    id offsets (count + 1) little-endian uint64 into the id bytes
+    id bytes   UTF-8 ids of all data items, concatenated
+
+Building the index takes one streaming pass over the JSON file. Reading an item
+afterwards only decodes its own bytes from a memory map of the JSON file. An
+index is rejected as out of date if the size or the modification time of the
+JSON file changed since it was built.
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+from pytdml.io._json_stream import ITEM, iter_members
+from pytdml.io.compression import compression_of
+from pytdml.io.tdml_readers import parse_training_data
+
+INDEX_SUFFIX = ".idx"
+
+_MAGIC = b"TDMLIDX2"
+_HEADER = struct.Struct("<8sQQqQ")
+
+
+def _default_index_path(file_path):
+    return str(file_path) + INDEX_SUFFIX
+
+
+def _check_uncompressed(file_path):
+    # Items are read by their byte span in the file
+    if compression_of(file_path) is not None:
+        raise ValueError(
+            "Indexed access needs an uncompressed TDML JSON file: {}".format(file_path)
+        )
+
+
+def _to_bytes(values):
+    if sys.byteorder != "little":
+        values = array("Q", values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def build_index(file_path, index_path=None):
+    """
+    Scans a TDML JSON file once and writes the byte span and id of every data
+    item to a binary index file. Returns the path of the index file.
+    """
+    _check_uncompressed(file_path)
+    if index_path is None:
+        index_path = _default_index_path(file_path)
+    spans = array("Q")
+    id_offsets = array("Q", [0])
+    ids = bytearray()
+    with open(file_path, "rb") as f:
+        for kind, _, value, _, start, end in iter_members(f):
+            if kind != ITEM:
+                continue
+            spans.append(start)
+            spans.append(end)
+            item_id = value.get("id") if isinstance(value, dict) else None
+            ids += str(item_id if item_id is not None else "").encode("utf-8")
+            id_offsets.append(len(ids))
+        # The scan stops at the end of the JSON document, trailing bytes count
+        stat = os.fstat(f.fileno())
+        source_size, source_mtime = stat.st_size, stat.st_mtime_ns
+    with open(index_path, "wb") as f:
+        f.write(
+            _HEADER.pack(
+                _MAGIC, len(id_offsets) - 1, source_size, source_mtime, len(ids)
+            )
+        )
+        f.write(_to_bytes(spans))
+        f.write(_to_bytes(id_offsets))
+        f.write(ids)
+    return index_path
+
+
+class IndexedTrainingData:
+    """
+    Random access to the data items of a TDML JSON file through its index
+
+    Items are looked up by position (``reader[i]``) or by id
+    (``reader.get(id)``) and only the requested item is decoded and validated.
+    Both files are memory-mapped lazily, and the memory maps are not pickled,
+    so a reader can be shared with DataLoader worker processes to back a
+    map-style torch Dataset.
+    """
+
+    def __init__(self, file_path, index_path=None):
+        _check_uncompressed(file_path)
+        self.file_path = str(file_path)
+        self.index_path = (
+            _default_index_path(file_path) if index_path is None else index_path
+        )
+        self._data = None
+        self._index = None
+        self._spans = None
+        self._id_offsets = None
+        self._ids = None
+        self._positions = None
+        self._open()
+
+    def _open(self):
+        with open(self.index_path, "rb") as f:
+            self._index = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._index) < _HEADER.size:
+            raise ValueError("Invalid TDML index file: {}".format(self.index_path))
+        magic, count, source_size, source_mtime, ids_size = _HEADER.unpack_from(
+            self._index
+        )
+        if magic != _MAGIC:
+            raise ValueError("Invalid TDML index file: {}".format(self.index_path))
+        spans_end = _HEADER.size + 16 * count
+        offsets_end = spans_end + 8 * (count + 1)
+        if len(self._index) != offsets_end + ids_size:
+            raise ValueError("Truncated TDML index file: {}".format(self.index_path))
+        view = memoryview(self._index)
+        if sys.byteorder == "little":
+            self._spans = view[_HEADER.size : spans_end].cast("Q")
+            self._id_offsets = view[spans_end:offsets_end].cast("Q")
+        else:
+            self._spans = array("Q", view[_HEADER.size : spans_end])
+            self._spans.byteswap()
+            self._id_offsets = array("Q", view[spans_end:offsets_end])
+            self._id_offsets.byteswap()
+        self._ids = view[offsets_end:]
+        del view
+        self._count = count
+
+        with open(self.file_path, "rb") as f:
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            mtime = os.fstat(f.fileno()).st_mtime_ns
+        if len(self._data) != source_size or mtime != source_mtime:
+            self.close()
+            raise ValueError(
+                "TDML index {} is out of date for {}".format(
+                    self.index_path, self.file_path
+                )
+            )
+
+    def _ensure_open(self):
+        if self._data is None:
+            self._open()
+
+    def __len__(self):
+        self._ensure_open()
+        return self._count
+
+    def _position(self, index):
+        self._ensure_open()
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("training data index out of range")
+        return index
+
+    def raw(self, index):
+        """
+        Returns the UTF-8 bytes of the data item at position ``index``
+        """
+        index = self._position(index)
+        return self._data[self._spans[2 * index] : self._spans[2 * index + 1]]
+
+    def get_dict(self, index):
+        """
+        Returns the JSON dict of the data item at position ``index``
+        """
+        return json.loads(self.raw(index))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return parse_training_data(self.get_dict(index), take_ownership=True)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def id_at(self, index):
+        """
+        Returns the id of the data item at position ``index`` without decoding it
+        """
+        index = self._position(index)
+        start, end = self._id_offsets[index], self._id_offsets[index + 1]
+        return bytes(self._ids[start:end]).decode("utf-8")
+
+    @property
+    def ids(self):
+        return [self.id_at(index) for index in range(len(self))]
+
+    def index_of(self, item_id):
+        """
+        Returns the position of the data item with id ``item_id``. If several
+        items share the id, the first one is returned.
+        """
+        if self._positions is None:
+            positions = {}
+            for index, item_id_at in enumerate(self.ids):
+                positions.setdefault(item_id_at, index)
+            self._positions = positions
+        try:
+            return self._positions[item_id]
+        except KeyError:
+            raise KeyError("No training data with id {!r}".format(item_id)) from None
+
+    def get(self, item_id):
+        """
+        Returns the validated data item with id ``item_id``
+        """
+        return self[self.index_of(item_id)]
+
+    def close(self):
+        # Views into the index map have to be released before it is closed
+        for view in (self._spans, self._id_offsets, self._ids):
+            if isinstance(view, memoryview):
+                view.release()
+        self._spans = self._id_offsets = self._ids = None
+        for mapped in (self._index, self._data):
+            if mapped is not None:
+                mapped.close()
+        self._index = self._data = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for key in ("_data", "_index", "_spans", "_id_offsets", "_ids"):
+            state[key] = None
+        return state
+
+
+def open_indexed(file_path, index_path=None, build=True):
+    """
+    Opens a TDML JSON file for random access by position or id. If ``build``
+    is true, the index is built first if it does not exist yet and rebuilt if
+    it is out of date or unreadable.
+    """
+    if index_path is None:
+        index_path = _default_index_path(file_path)
+    if build and not os.path.exists(index_path):
+        build_index(file_path, index_path)
+    try:
+        return IndexedTrainingData(file_path, index_path)
+    except ValueError:
+        if not build:
+            raise
+    build_index(file_path, index_path)
+    return IndexedTrainingData(file_path, index_path)
@@ -0,0 +1,226 @@
+"""
+Apache Parquet export and import of TDML data items.
+
+Every data item is one row. The common item members are columns of their
+own, labels are a nested list column, and all other members are kept as
+JSON text in the ``extra`` columns, so a dataset written with ``to_parquet``
+reads back to the same model. The dataset header (everything but ``data``)
+is stored as JSON in the ``tdml`` key-value metadata of the file.
+
+Each label carries the bounding box ``[minx, miny, maxx, maxy]`` of its
+geometry as a fixed-size list, next to the geometry itself in the label's
+``extra`` column. Parquet stores every leaf column separately, so reading
+``id``, ``dataURL`` and ``labels.class`` (see ``read_parquet_columns``)
+does not touch the geometries, and every row group can be read on its own.
+"""
+
+import json
+
+from pytdml.io.tdml_readers import parse_json
+from pytdml.io.tdml_writers import _data_item_dict, remove_empty_values
+
+METADATA_KEY = b"tdml"
+
+DEFAULT_ROW_GROUP_SIZE = 10000
+
+_ITEM_COLUMNS = ("type", "id", "dataURL", "trainingType", "numberOfLabels")
+_LABEL_COLUMNS = (
+    "type",
+    "class",
+    "isNegative",
+    "confidence",
+    "bboxType",
+    "imageURL",
+    "imageFormat",
+)
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ModuleNotFoundError:
+        raise ModuleNotFoundError(
+            "Failed to import pyarrow, please install the library first"
+        )
+    return pyarrow
+
+
+def _schema(pa):
+    label = pa.struct(
+        [
+            ("type", pa.string()),
+            ("class", pa.string()),
+            ("isNegative", pa.bool_()),
+            ("confidence", pa.float64()),
+            ("bboxType", pa.string()),
+            ("bbox", pa.list_(pa.float64(), 4)),
+            ("imageURL", pa.list_(pa.string())),
+            ("imageFormat", pa.list_(pa.string())),
+            ("extra", pa.string()),
+        ]
+    )
+    return pa.schema(
+        [
+            ("type", pa.string()),
+            ("id", pa.string()),
+            ("dataURL", pa.list_(pa.string())),
+            ("trainingType", pa.string()),
+            ("numberOfLabels", pa.int64()),
+            ("labels", pa.list_(label)),
+            ("extra", pa.string()),
+        ]
+    )
+
+
+def _extra(json_dict, columns):
+    extra = {key: value for key, value in json_dict.items() if key not in columns}
+    return json.dumps(extra, ensure_ascii=False) if extra else None
+
+
+def _coordinates_bounds(coordinates, bounds):
+    if coordinates and isinstance(coordinates[0], (int, float)):
+        x, y = coordinates[0], coordinates[1]
+        if bounds[0] is None:
+            bounds[:] = [x, y, x, y]
+        else:
+            bounds[0] = min(bounds[0], x)
+            bounds[1] = min(bounds[1], y)
+            bounds[2] = max(bounds[2], x)
+            bounds[3] = max(bounds[3], y)
+        return
+    for child in coordinates or ():
+        _coordinates_bounds(child, bounds)
+
+
+def _bbox(label):
+    """
+    Returns [minx, miny, maxx, maxy] of the geometry of an object label
+    """
+    feature = label.get("object")
+    geometry = feature.get("geometry") if isinstance(feature, dict) else None
+    if not isinstance(geometry, dict):
+        return None
+    bounds = [None] * 4
+    geometries = geometry.get("geometries")
+    for part in geometries if geometries is not None else [geometry]:
+        _coordinates_bounds(part.get("coordinates"), bounds)
+    return None if bounds[0] is None else bounds
+
+
+def _label_row(label):
+    row = {key: label.get(key) for key in _LABEL_COLUMNS}
+    row["bbox"] = _bbox(label)
+    row["extra"] = _extra(label, _LABEL_COLUMNS)
+    return row
+
+
+def _item_row(json_item):
+    row = {key: json_item.get(key) for key in _ITEM_COLUMNS}
+    row["labels"] = [_label_row(label) for label in json_item.get("labels", [])]
+    row["extra"] = _extra(json_item, _ITEM_COLUMNS + ("labels",))
+    return row
+
+
+def _row_item(row):
+    json_item = {key: row[key] for key in _ITEM_COLUMNS if row.get(key) is not None}
+    labels = []
+    for label_row in row.get("labels") or []:
+        label = {
+            key: label_row[key]
+            for key in _LABEL_COLUMNS
+            if label_row.get(key) is not None
+        }
+        if label_row.get("extra"):
+            label.update(json.loads(label_row["extra"]))
+        labels.append(label)
+    json_item["labels"] = labels
+    if row.get("extra"):
+        json_item.update(json.loads(row["extra"]))
+    return json_item
+
+
+def to_parquet(
+    td,
+    file_path: str,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    compression: str = "snappy",
+):
+    """
+    Writes the data items of a TrainingDataset to a Parquet file, one row per
+    item and ``row_group_size`` items per row group. The items are converted
+    and written one row group at a time.
+    """
+    pa = _import_pyarrow()
+    header = remove_empty_values(td.model_copy(update={"data": []}).to_dict())
+    header.pop("data", None)
+    schema = _schema(pa).with_metadata(
+        {METADATA_KEY: json.dumps(header, ensure_ascii=False).encode("utf-8")}
+    )
+    with pa.parquet.ParquetWriter(file_path, schema, compression=compression) as writer:
+        rows = []
+        for item in td.data:
+            rows.append(_item_row(remove_empty_values(_data_item_dict(td, item))))
+            if len(rows) == row_group_size:
+                writer.write_table(pa.Table.from_pylist(rows, schema=schema))
+                rows = []
+        if rows or not td.data:
+            writer.write_table(pa.Table.from_pylist(rows, schema=schema))
+
+
+def _parquet_file(file_path):
+    return _import_pyarrow().parquet.ParquetFile(file_path)
+
+
+def _row_groups(parquet_file, row_groups):
+    if row_groups is None:
+        return range(parquet_file.num_row_groups)
+    if isinstance(row_groups, int):
+        return [row_groups]
+    return row_groups
+
+
+def from_parquet(
+    file_path: str, row_groups=None, lazy: bool = False, validate: bool = True
+):
+    """
+    Reads a Parquet file written by ``to_parquet`` and returns a
+    TrainingDataset object. ``row_groups`` (an index or a list of indices)
+    restricts the data to some row groups, e.g. the shard of one worker. See
+    ``parse_json`` for ``lazy`` and ``validate``.
+    """
+    parquet_file = _parquet_file(file_path)
+    metadata = parquet_file.schema_arrow.metadata or {}
+    if METADATA_KEY not in metadata:
+        raise ValueError("{} is not a TDML Parquet file".format(file_path))
+    json_dict = json.loads(metadata[METADATA_KEY])
+    json_dict["data"] = [
+        _row_item(row)
+        for index in _row_groups(parquet_file, row_groups)
+        for row in parquet_file.read_row_group(index).to_pylist()
+    ]
+    return parse_json(json_dict, take_ownership=True, lazy=lazy, validate=validate)
+
+
+def _column_path(column):
+    # Label members are addressed as "labels.<member>"
+    if column.startswith("labels.") and ".list." not in column:
+        return "labels.list.element." + column[len("labels.") :]
+    return column
+
+
+def read_parquet_columns(
+    file_path: str, columns=("id", "dataURL", "labels.class"), row_groups=None
+):
+    """
+    Reads only the given columns of a Parquet file written by ``to_parquet``
+    and returns them as a pyarrow Table. Label members are selected as
+    ``"labels.<member>"``, e.g. ``"labels.class"`` or ``"labels.bbox"``.
+    """
+    parquet_file = _parquet_file(file_path)
+    paths = [_column_path(column) for column in columns]
+    if row_groups is None:
+        return parquet_file.read(columns=paths)
+    return parquet_file.read_row_groups(
+        list(_row_groups(parquet_file, row_groups)), columns=paths
+    )
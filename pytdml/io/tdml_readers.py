@@ -28,25 +28,215 @@
 # SOFTWARE.
 #
 # ------------------------------------------------------------------------------
-import json
-from pytdml.type import TrainingDataset, EOTrainingDataset
+from pytdml.io._json_stream import ITEM, MEMBER, iter_members
+from pytdml.io.compression import compression_of, open_tdml_file
+from pytdml.io.json_backend import _gc_paused, get_json_backend
+from pytdml.io.tdml_schema import SchemaValidator, get_schema_validator
+from pytdml.type import (
+    TrainingDataset,
+    EOTrainingDataset,
+    LazyEOTrainingDataset,
+    LazyTrainingDataList,
+    AI_TrainingData,
+    AI_EOTrainingData,
+)
+from pytdml.type._construct import run_validators
 
+_TRAINING_DATA_TYPES = {
+    "AI_AbstractTrainingData": AI_TrainingData,
+    "AI_EOTrainingData": AI_EOTrainingData,
+}
 
-def read_from_json(file_path: str):
+VALIDATORS = ("pydantic", "schema", "none")
+
+
+def read_from_json(
+    file_path: str,
+    lazy: bool = False,
+    backend=None,
+    validate: bool = True,
+    validator=None,
+):
     """
     Reads a TDML JSON file and returns a TrainingDataset object.
+
+    With ``lazy=True`` only the dataset header is validated up front and the
+    data items are validated on first access, with ``validate=False`` the
+    file is trusted and not validated at all (see ``parse_json``, also for
+    ``validator``). ``backend`` selects the JSON backend (see
+    ``get_json_backend``).
+
+    Files ending in ``.gz``, ``.zst`` or ``.xz`` are decompressed while they
+    are decoded one data item at a time, so the uncompressed text is never
+    held in memory. If ``backend`` is given, such a file is decompressed
+    entirely and decoded by that backend instead.
+    """
+    if backend is None and compression_of(file_path) is not None:
+        json_dict = _load_stream(file_path)
+    else:
+        json_dict = get_json_backend(backend).load(file_path)
+
+    # The freshly loaded dict is not shared with anyone, so hand it over as is
+    return parse_json(
+        json_dict,
+        take_ownership=True,
+        lazy=lazy,
+        validate=validate,
+        validator=validator,
+    )
+
+
+def _load_stream(file_path):
+    json_dict = {}
+    data = []
+    with open_tdml_file(file_path) as f:
+        with _gc_paused():
+            for kind, key, value, _, _, _ in iter_members(f):
+                if kind == ITEM:
+                    data.append(value)
+                else:
+                    json_dict[key] = value
+    if data:
+        json_dict["data"] = data
+    return json_dict
+
+
+def parse_json(
+    json_dict, take_ownership=False, lazy=False, validate=True, validator=None
+):
     """
-    with open(file_path, "r", encoding="utf-8") as f:
-        json_dict = json.load(f)
+    Parses a TDML JSON dict and returns a TrainingDataset object.
+
+    By default the dict is deep-copied before validation so that the caller
+    can keep using it. Pass ``take_ownership=True`` when the dict is not used
+    afterwards (e.g. it was just loaded from a file) to skip the copy of the
+    whole tree on large encodings. The parsed object may then share nested
+    values with ``json_dict``.
 
-    return parse_json(json_dict)
+    With ``lazy=True`` an ``AI_EOTrainingDataset`` is returned as a
+    ``LazyEOTrainingDataset``: the header is validated eagerly and ``data`` is
+    a sequence that validates and caches each item on first access. Other
+    dataset types are always parsed eagerly.
 
+    With ``validate=False`` the dict is trusted: the object graph is built
+    without running pydantic validation, field validators or the geojson
+    coordinate cleaning, and label unions are resolved by their ``type``.
+    This is much faster but must only be used for encodings that are known
+    to be valid, such as files written by pytdml.
+
+    ``validator`` selects the validation engine and overrides ``validate``:
+    ``"pydantic"`` (``validate=True``), ``"none"`` (``validate=False``) or
+    ``"schema"``, which checks the dict against the compiled TDML JSON Schema
+    (see ``pytdml.io.tdml_schema``), builds the objects as trusted and then
+    runs the field and model validators on them (date formats, the
+    normalization of labeling methods, training types and image formats), so
+    it returns the same objects as ``"pydantic"``. Items of a lazy dataset
+    are checked on first access. A ``SchemaValidator`` instance validates
+    against its own schema.
+    """
+    if validator is None:
+        validator = "pydantic" if validate else "none"
+    elif isinstance(validator, str) and validator not in VALIDATORS:
+        raise ValueError(
+            "Unknown validator: {}, expected one of {}".format(
+                validator, ", ".join(VALIDATORS)
+            )
+        )
 
-def parse_json(json_dict):
     # Different kinds of training datasets are supported
     if json_dict["type"] == "AI_TrainingDataset":
-        return TrainingDataset.from_dict(json_dict)
+        dataset_type = TrainingDataset
     elif json_dict["type"] == "AI_EOTrainingDataset":
-        return EOTrainingDataset.from_dict(json_dict)
+        dataset_type = LazyEOTrainingDataset if lazy else EOTrainingDataset
     else:
         raise ValueError("Unknown TDML type: {}".format(json_dict["type"]))
+
+    if validator == "schema" or isinstance(validator, SchemaValidator):
+        if not isinstance(validator, SchemaValidator):
+            validator = get_schema_validator()
+        validator.validate(json_dict)
+        td = dataset_type.from_dict(
+            json_dict, take_ownership=take_ownership, validate=False
+        )
+        if isinstance(td.data, LazyTrainingDataList):
+            td.data._check = True
+        run_validators(td)
+        return td
+    return dataset_type.from_dict(
+        json_dict, take_ownership=take_ownership, validate=validator == "pydantic"
+    )
+
+
+def parse_training_data(json_dict, take_ownership=False, validate=True):
+    """
+    Parses a single TDML data item dict into its training data object.
+    ``validate=False`` trusts the dict (see ``parse_json``).
+    """
+    item_type = _TRAINING_DATA_TYPES.get(json_dict.get("type"))
+    if item_type is None:
+        raise ValueError(
+            "Unknown TDML training data type: {}".format(json_dict.get("type"))
+        )
+    return item_type.from_dict(
+        json_dict, take_ownership=take_ownership, validate=validate
+    )
+
+
+class TrainingDataStream:
+    """
+    Re-iterable stream over the data items of a TDML JSON file
+
+    Each iteration re-opens the file and yields validated training data objects
+    one at a time, so memory use is bounded by the largest data item rather
+    than by the file size. The dataset header (every top-level member except
+    ``data``) is available separately through ``header``.
+
+    The stream can be used directly as the source of a torch ``IterDataPipe``,
+    e.g. ``IterableWrapper(stream, deepcopy=False).sharding_filter()``.
+    With ``validate=False`` the items are trusted (see ``parse_json``).
+    """
+
+    def __init__(self, file_path: str, validate: bool = True):
+        self.file_path = file_path
+        self.validate = validate
+        self._header = None
+
+    @property
+    def header(self):
+        """
+        Dataset header as a JSON dict without ``data``. Members may follow
+        ``data`` (as written by ``TDMLStreamWriter``), so reading it scans the
+        whole file once: every data item is decoded and dropped right away,
+        which keeps memory bounded but takes about as long as decoding the
+        file (the C decoder is faster than skipping the items in Python). The
+        header is cached, and iterating the stream fills it on the way.
+        """
+        if self._header is None:
+            header = {}
+            with open_tdml_file(self.file_path) as f:
+                for kind, key, value, _, _, _ in iter_members(f):
+                    if kind == MEMBER:
+                        header[key] = value
+            self._header = header
+        return self._header
+
+    def __iter__(self):
+        header = {}
+        with open_tdml_file(self.file_path) as f:
+            for kind, key, value, _, _, _ in iter_members(f):
+                if kind == ITEM:
+                    yield parse_training_data(
+                        value, take_ownership=True, validate=self.validate
+                    )
+                elif self._header is None:
+                    header[key] = value
+        if self._header is None:
+            self._header = header
+
+
+def iter_training_data(file_path: str, validate: bool = True):
+    """
+    Returns a TrainingDataStream yielding the training data items of a TDML
+    JSON file one at a time. See ``TrainingDataStream`` for details.
+    """
+    return TrainingDataStream(file_path, validate=validate)
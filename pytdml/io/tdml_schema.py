@@ -0,0 +1,679 @@
+"""
+JSON Schema validation of TDML encodings compiled to Python code.
+
+A JSON Schema is translated once into the source of a Python module with one
+function per definition, in which every keyword is an inline check (type
+tests, dict lookups, loops over arrays), and compiled in memory once per
+process. Optionally the module is written to a cache directory under the hash
+of the schema and imported from there, for debugging or to let Python cache
+its bytecode. Discriminated unions (``oneOf`` with a ``discriminator``, as
+generated by pydantic for labels and data items) dispatch on the tag instead
+of trying every alternative.
+
+The default schema is generated from the pytdml models, so it accepts the
+same encodings as pydantic validation, except for the checks that JSON
+Schema cannot express (date formats, model validators, which
+``parse_json(validator="schema")`` runs on the objects afterwards) and without the
+coercions pydantic applies in lax mode (e.g. "1" for an integer). Another
+schema, such as the TrainingDML-AI schema of ``pytdml.io.internal.
+schema_load``, can be used if its ``$ref`` are local.
+"""
+
+import hashlib
+import importlib.util
+import json
+import os
+import re
+import threading
+
+from pydantic.json_schema import GenerateJsonSchema, models_json_schema
+
+from pytdml.type import EOTrainingDataset, TrainingDataset
+
+# Bump when the generated code changes, to invalidate the cached modules
+GENERATOR_VERSION = 1
+
+# Keywords that do not constrain the instance
+_ANNOTATIONS = {
+    "$schema",
+    "$id",
+    "$comment",
+    "$defs",
+    "definitions",
+    "title",
+    "description",
+    "default",
+    "examples",
+    "format",
+    "readOnly",
+    "writeOnly",
+    "deprecated",
+    "contentEncoding",
+    "contentMediaType",
+}
+_SUPPORTED = _ANNOTATIONS | {
+    "$ref",
+    "type",
+    "enum",
+    "const",
+    "minimum",
+    "maximum",
+    "exclusiveMinimum",
+    "exclusiveMaximum",
+    "minLength",
+    "maxLength",
+    "pattern",
+    "items",
+    "prefixItems",
+    "minItems",
+    "maxItems",
+    "properties",
+    "required",
+    "additionalProperties",
+    "minProperties",
+    "maxProperties",
+    "allOf",
+    "anyOf",
+    "oneOf",
+    "not",
+    "discriminator",
+}
+_TYPE_CHECKS = {
+    "null": "{0} is None",
+    "boolean": "isinstance({0}, bool)",
+    "integer": "(isinstance({0}, int) and not isinstance({0}, bool)"
+    " or isinstance({0}, float) and {0}.is_integer())",
+    "number": "isinstance({0}, (int, float)) and not isinstance({0}, bool)",
+    "string": "isinstance({0}, str)",
+    "array": "isinstance({0}, (list, tuple))",
+    "object": "isinstance({0}, dict)",
+}
+_NUMBER_KEYWORDS = ("minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum")
+_STRING_KEYWORDS = ("minLength", "maxLength", "pattern")
+_ARRAY_KEYWORDS = ("items", "prefixItems", "minItems", "maxItems")
+_OBJECT_KEYWORDS = (
+    "required",
+    "properties",
+    "additionalProperties",
+    "minProperties",
+    "maxProperties",
+)
+
+
+class SchemaValidationError(ValueError):
+    """
+    An instance does not match the JSON Schema. ``path`` holds the keys and
+    indices from the root of the instance to the offending value.
+    """
+
+    def __init__(self, message, path):
+        super().__init__(message)
+        self.message = message
+        self.path = path
+
+    @property
+    def pointer(self):
+        """
+        JSON pointer (RFC 6901) of the offending value
+        """
+        return "".join(
+            "/" + str(token).replace("~", "~0").replace("/", "~1")
+            for token in self.path
+        )
+
+    def __str__(self):
+        return "{} at {}".format(self.message, self.pointer or "/")
+
+
+class _TDMLJsonSchema(GenerateJsonSchema):
+    # GeoJSON objects are validated by isinstance checks in the models
+    def is_instance_schema(self, schema):
+        cls = schema["cls"]
+        if cls.__module__.startswith("geojson."):
+            return {
+                "type": "object",
+                "properties": {"type": {"const": cls.__name__}},
+                "required": ["type"],
+            }
+        return super().is_instance_schema(schema)
+
+
+def tdml_json_schema():
+    """
+    Returns the JSON Schema of TDML encodings generated from the pytdml
+    models. Every model is a definition named after its class in ``$defs``,
+    the root accepts both dataset types.
+    """
+    models = (TrainingDataset, EOTrainingDataset)
+    _, schema = models_json_schema(
+        [(model, "validation") for model in models],
+        by_alias=True,
+        schema_generator=_TDMLJsonSchema,
+    )
+    mapping = {}
+    for model in models:
+        ref = "#/$defs/{}".format(model.__name__)
+        mapping[schema["$defs"][model.__name__]["properties"]["type"]["const"]] = ref
+    schema["oneOf"] = [{"$ref": ref} for ref in mapping.values()]
+    schema["discriminator"] = {"propertyName": "type", "mapping": mapping}
+    return schema
+
+
+def schema_hash(schema):
+    """
+    Returns the hash of a JSON Schema under which its compiled module is
+    cached
+    """
+    text = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+    digest = hashlib.sha256(text.encode("utf-8"))
+    digest.update(str(GENERATOR_VERSION).encode("ascii"))
+    return digest.hexdigest()[:32]
+
+
+def _unescape(token):
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+class _Generator:
+    """
+    Generates the source of the validation module of a schema
+    """
+
+    def __init__(self, schema):
+        self.schema = schema
+        self.lines = []
+        self.constants = []
+        self.patterns = []
+        self.functions = {}
+        self.pending = []
+        self.variables = 0
+
+    def resolve(self, ref):
+        if ref != "#" and not ref.startswith("#/"):
+            raise ValueError("Only local $ref are supported: {}".format(ref))
+        schema = self.schema
+        for token in ref[2:].split("/") if ref != "#" else ():
+            token = _unescape(token)
+            try:
+                schema = schema[int(token) if isinstance(schema, list) else token]
+            except (KeyError, IndexError, ValueError):
+                raise ValueError("Unresolvable $ref: {}".format(ref)) from None
+        return schema
+
+    def function(self, ref):
+        name = self.functions.get(ref)
+        if name is None:
+            name = "_f{}".format(len(self.functions))
+            self.functions[ref] = name
+            self.pending.append(ref)
+        return name
+
+    def constant(self, value):
+        self.constants.append(value)
+        return "_c[{}]".format(len(self.constants) - 1)
+
+    def variable(self, prefix="v"):
+        self.variables += 1
+        return "{}{}".format(prefix, self.variables)
+
+    def emit(self, indent, line):
+        self.lines.append("    " * indent + line)
+
+    def error(self, indent, message, path, value=None):
+        # The message is only formatted when the check fails
+        if value is not None:
+            message = "{!r}.format({})".format(message, value)
+        else:
+            message = repr(message)
+        self.emit(indent, "raise _Error({}, [{}])".format(message, ", ".join(path)))
+
+    def source(self, definitions):
+        root = self.function("#")
+        names = {
+            name: self.function("#/$defs/" + name.replace("~", "~0").replace("/", "~1"))
+            for name in definitions
+        }
+        while self.pending:
+            ref = self.pending.pop(0)
+            self.emit(0, "")
+            self.emit(0, "")
+            self.emit(0, "def {}(v0):".format(self.functions[ref]))
+            self.block(self.resolve(ref), "v0", [], 1)
+        header = [
+            "# Generated by pytdml.io.tdml_schema, do not edit",
+            "import re",
+            "",
+            "_MISSING = object()",
+            "_c = {!r}".format(self.constants),
+            "_p = [{}]".format(
+                ", ".join("re.compile({!r})".format(p) for p in self.patterns)
+            ),
+        ]
+        footer = [
+            "",
+            "",
+            "ROOT = {}".format(root),
+            "DEFINITIONS = {{{}}}".format(
+                ", ".join("{!r}: {}".format(k, v) for k, v in names.items())
+            ),
+            "",
+        ]
+        return "\n".join(header + self.lines + footer)
+
+    def block(self, schema, var, path, indent):
+        # Emits the checks as the body of a statement, which cannot be empty
+        start = len(self.lines)
+        self.body(schema, var, path, indent)
+        if len(self.lines) == start:
+            self.emit(indent, "pass")
+
+    def body(self, schema, var, path, indent):
+        """
+        Emits the checks of ``schema`` on the value in ``var`` at ``path``,
+        a list of Python expressions of the keys and indices
+        """
+        if schema is True or schema == {}:
+            return
+        if schema is False:
+            self.error(indent, "No value is allowed", path)
+            return
+        unsupported = set(schema) - _SUPPORTED
+        if unsupported:
+            raise ValueError(
+                "Unsupported JSON Schema keywords: {}".format(
+                    ", ".join(sorted(unsupported))
+                )
+            )
+
+        if "$ref" in schema:
+            self.call(self.function(schema["$ref"]), var, path, indent)
+
+        known_type = None
+        types = schema.get("type")
+        if types is not None:
+            types = [types] if isinstance(types, str) else types
+            check = " or ".join(_TYPE_CHECKS[t].format(var) for t in types)
+            self.emit(indent, "if not ({}):".format(check))
+            self.error(
+                indent + 1,
+                "{!r} is not of type " + " or ".join(repr(t) for t in types),
+                path,
+                var,
+            )
+            if len(types) == 1:
+                known_type = types[0]
+
+        if "const" in schema:
+            self.emit(
+                indent, "if {} != {}:".format(var, self.constant(schema["const"]))
+            )
+            self.error(
+                indent + 1, "{{!r}} is not {!r}".format(schema["const"]), path, var
+            )
+        if "enum" in schema:
+            self.emit(
+                indent, "if {} not in {}:".format(var, self.constant(schema["enum"]))
+            )
+            self.error(
+                indent + 1,
+                "{{!r}} is not one of {!r}".format(schema["enum"]),
+                path,
+                var,
+            )
+
+        for keywords, kind, emit in (
+            (_NUMBER_KEYWORDS, "number", self.number),
+            (_STRING_KEYWORDS, "string", self.string),
+            (_ARRAY_KEYWORDS, "array", self.array),
+            (_OBJECT_KEYWORDS, "object", self.object),
+        ):
+            if not any(keyword in schema for keyword in keywords):
+                continue
+            if known_type == kind or (kind == "number" and known_type == "integer"):
+                emit(schema, var, path, indent)
+            else:
+                # The keywords only apply to values of their type
+                self.emit(indent, "if {}:".format(_TYPE_CHECKS[kind].format(var)))
+                start = len(self.lines)
+                emit(schema, var, path, indent + 1)
+                if len(self.lines) == start:
+                    self.lines.pop()
+
+        for subschema in schema.get("allOf", ()):
+            self.body(subschema, var, path, indent)
+        if "anyOf" in schema:
+            self.any_of(schema, schema["anyOf"], var, path, indent)
+        if "oneOf" in schema:
+            self.one_of(schema, schema["oneOf"], var, path, indent)
+        if "not" in schema:
+            self.emit(indent, "try:")
+            self.block(schema["not"], var, path, indent + 1)
+            self.emit(indent, "except _Error:")
+            self.emit(indent + 1, "pass")
+            self.emit(indent, "else:")
+            self.error(indent + 1, "{!r} must not match the schema", path, var)
+
+    def call(self, function, var, path, indent):
+        if not path:
+            self.emit(indent, "{}({})".format(function, var))
+            return
+        self.emit(indent, "try:")
+        self.emit(indent + 1, "{}({})".format(function, var))
+        self.emit(indent, "except _Error as error:")
+        self.emit(indent + 1, "error.path[:0] = [{}]".format(", ".join(path)))
+        self.emit(indent + 1, "raise")
+
+    def number(self, schema, var, path, indent):
+        for keyword, operator in (
+            ("minimum", "<"),
+            ("maximum", ">"),
+            ("exclusiveMinimum", "<="),
+            ("exclusiveMaximum", ">="),
+        ):
+            if keyword in schema:
+                self.emit(
+                    indent, "if {} {} {!r}:".format(var, operator, schema[keyword])
+                )
+                self.error(
+                    indent + 1,
+                    "{{!r}} is not within {} {!r}".format(keyword, schema[keyword]),
+                    path,
+                    var,
+                )
+
+    def string(self, schema, var, path, indent):
+        if "minLength" in schema:
+            self.emit(indent, "if len({}) < {}:".format(var, schema["minLength"]))
+            self.error(indent + 1, "{!r} is too short", path, var)
+        if "maxLength" in schema:
+            self.emit(indent, "if len({}) > {}:".format(var, schema["maxLength"]))
+            self.error(indent + 1, "{!r} is too long", path, var)
+        if "pattern" in schema:
+            self.patterns.append(schema["pattern"])
+            self.emit(
+                indent,
+                "if _p[{}].search({}) is None:".format(len(self.patterns) - 1, var),
+            )
+            self.error(
+                indent + 1,
+                "{{!r}} does not match {!r}".format(schema["pattern"]),
+                path,
+                var,
+            )
+
+    def array(self, schema, var, path, indent):
+        if "minItems" in schema:
+            self.emit(indent, "if len({}) < {}:".format(var, schema["minItems"]))
+            self.error(
+                indent + 1,
+                "Expected at least {} items".format(schema["minItems"]),
+                path,
+            )
+        if "maxItems" in schema:
+            self.emit(indent, "if len({}) > {}:".format(var, schema["maxItems"]))
+            self.error(
+                indent + 1,
+                "Expected at most {} items".format(schema["maxItems"]),
+                path,
+            )
+        prefix_items = schema.get("prefixItems", ())
+        for position, subschema in enumerate(prefix_items):
+            item = self.variable()
+            self.emit(indent, "if len({}) > {}:".format(var, position))
+            self.emit(indent + 1, "{} = {}[{}]".format(item, var, position))
+            self.body(subschema, item, path + [str(position)], indent + 1)
+        items = schema.get("items", True)
+        if items is True or items == {}:
+            return
+        index = self.variable("i")
+        item = self.variable()
+        if prefix_items:
+            self.emit(
+                indent,
+                "for {}, {} in enumerate({}[{}:], {}):".format(
+                    index, item, var, len(prefix_items), len(prefix_items)
+                ),
+            )
+        else:
+            self.emit(indent, "for {}, {} in enumerate({}):".format(index, item, var))
+        self.block(items, item, path + [index], indent + 1)
+
+    def object(self, schema, var, path, indent):
+        required = schema.get("required", ())
+        for key in required:
+            self.emit(indent, "if {!r} not in {}:".format(key, var))
+            self.error(
+                indent + 1,
+                "{!r} is a required property".format(key),
+                path + [repr(key)],
+            )
+        for keyword, operator in (("minProperties", "<"), ("maxProperties", ">")):
+            if keyword in schema:
+                self.emit(
+                    indent, "if len({}) {} {}:".format(var, operator, schema[keyword])
+                )
+                self.error(
+                    indent + 1,
+                    "Expected {} {}".format(keyword, schema[keyword]),
+                    path,
+                )
+        properties = schema.get("properties", {})
+        for key, subschema in properties.items():
+            if subschema is True or subschema == {}:
+                continue
+            value = self.variable()
+            if key in required:
+                self.emit(indent, "{} = {}[{!r}]".format(value, var, key))
+                self.body(subschema, value, path + [repr(key)], indent)
+            else:
+                self.emit(indent, "{} = {}.get({!r}, _MISSING)".format(value, var, key))
+                self.emit(indent, "if {} is not _MISSING:".format(value))
+                self.block(subschema, value, path + [repr(key)], indent + 1)
+        additional = schema.get("additionalProperties", True)
+        if additional is True or additional == {}:
+            return
+        key = self.variable("k")
+        value = self.variable()
+        known = self.constant(set(properties))
+        self.emit(indent, "for {}, {} in {}.items():".format(key, value, var))
+        self.emit(indent + 1, "if {} in {}:".format(key, known))
+        self.emit(indent + 2, "continue")
+        if additional is False:
+            self.error(indent + 1, "Additional property {!r} is not allowed", path, key)
+        else:
+            self.body(additional, value, path + [key], indent + 1)
+
+    def any_of(self, schema, subschemas, var, path, indent):
+        if "discriminator" in schema:
+            self.discriminated(schema, subschemas, var, path, indent)
+            return
+        # Optional values (anyOf [..., {"type": "null"}]) are the usual case
+        nullable = {"type": "null"} in subschemas
+        subschemas = [s for s in subschemas if s != {"type": "null"}]
+        if nullable:
+            if not subschemas:
+                self.emit(indent, "if {} is not None:".format(var))
+                self.error(indent + 1, "{!r} is not None", path, var)
+                return
+            self.emit(indent, "if {} is not None:".format(var))
+            indent += 1
+        if len(subschemas) == 1:
+            self.block(subschemas[0], var, path, indent)
+            return
+        if all(
+            isinstance(s, dict) and set(s) - _ANNOTATIONS == {"type"}
+            for s in subschemas
+        ):
+            types = [
+                t
+                for s in subschemas
+                for t in ([s["type"]] if isinstance(s["type"], str) else s["type"])
+            ]
+            if nullable:
+                types.append("null")
+            check = " or ".join(_TYPE_CHECKS[t].format(var) for t in types)
+            self.emit(indent, "if not ({}):".format(check))
+            self.error(
+                indent + 1,
+                "{!r} is not of type " + " or ".join(repr(t) for t in types),
+                path,
+                var,
+            )
+            return
+        for position, subschema in enumerate(subschemas):
+            self.emit(indent, "try:")
+            self.block(subschema, var, path, indent + 1)
+            self.emit(indent, "except _Error:")
+            indent += 1
+        self.error(indent, "{!r} does not match any of the schemas", path, var)
+
+    def one_of(self, schema, subschemas, var, path, indent):
+        if "discriminator" in schema:
+            self.discriminated(schema, subschemas, var, path, indent)
+            return
+        matches = self.variable("m")
+        self.emit(indent, "{} = 0".format(matches))
+        for subschema in subschemas:
+            self.emit(indent, "try:")
+            self.body(subschema, var, path, indent + 1)
+            self.emit(indent + 1, "{} += 1".format(matches))
+            self.emit(indent, "except _Error:")
+            self.emit(indent + 1, "pass")
+        self.emit(indent, "if {} != 1:".format(matches))
+        self.error(
+            indent + 1, "{!r} does not match exactly one of the schemas", path, var
+        )
+
+    def discriminated(self, schema, subschemas, var, path, indent):
+        discriminator = schema["discriminator"]
+        name = discriminator["propertyName"]
+        mapping = discriminator.get("mapping")
+        if not mapping:
+            # Without a mapping the tag is the definition name (OpenAPI)
+            mapping = {}
+            for subschema in subschemas:
+                ref = subschema.get("$ref", "")
+                mapping[ref.rsplit("/", 1)[-1]] = ref
+        tag = self.variable("t")
+        self.emit(indent, "if not isinstance({}, dict):".format(var))
+        self.error(indent + 1, "{!r} is not of type 'object'", path, var)
+        self.emit(indent, "{} = {}.get({!r})".format(tag, var, name))
+        keyword = "if"
+        for value, ref in mapping.items():
+            self.emit(indent, "{} {} == {!r}:".format(keyword, tag, value))
+            self.call(self.function(ref), var, path, indent + 1)
+            keyword = "elif"
+        self.emit(indent, "else:")
+        self.error(
+            indent + 1,
+            "Unknown {} {{!r}}, expected one of {}".format(
+                name, ", ".join(repr(value) for value in mapping)
+            ),
+            path + [repr(name)],
+            tag,
+        )
+
+
+def _cached_source_matches(file_path, source):
+    try:
+        with open(file_path, "rb") as f:
+            return f.read() == source
+    except FileNotFoundError:
+        return False
+
+
+def _import(source, schema_hash, cache_dir):
+    """
+    Returns the namespace of the module compiled from ``source``, in memory
+    unless a ``cache_dir`` is given. The cached module is only imported if its
+    content is the source generated in this process, otherwise it is
+    rewritten first, so a modified or truncated file in the cache directory is
+    never executed.
+    """
+    module_name = "_tdml_schema_" + schema_hash
+    namespace = {"_Error": SchemaValidationError}
+    if cache_dir:
+        file_path = os.path.join(cache_dir, module_name + ".py")
+        data = source.encode("utf-8")
+        try:
+            if not _cached_source_matches(file_path, data):
+                os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+                temp_path = "{}.{}.tmp".format(file_path, os.getpid())
+                with open(temp_path, "wb") as f:
+                    f.write(data)
+                os.replace(temp_path, file_path)
+            spec = importlib.util.spec_from_file_location(module_name, file_path)
+            module = importlib.util.module_from_spec(spec)
+            module.__dict__.update(namespace)
+            spec.loader.exec_module(module)
+            return module.__dict__
+        except OSError:
+            # Read-only cache directory, compile in memory
+            pass
+    exec(compile(source, "<{}>".format(module_name), "exec"), namespace)
+    return namespace
+
+
+class SchemaValidator:
+    """
+    Validator compiled from a JSON Schema (the TDML schema by default)
+
+    The generated module is compiled in memory. If ``cache_dir`` is given,
+    it is written there under the hash of the schema and imported from the
+    file instead, after checking it against the generated source.
+    """
+
+    def __init__(self, schema=None, cache_dir=None):
+        self.schema = tdml_json_schema() if schema is None else schema
+        self.hash = schema_hash(self.schema)
+        definitions = self.schema.get("$defs", {})
+        namespace = _import(
+            _Generator(self.schema).source(definitions), self.hash, cache_dir
+        )
+        self._root = namespace["ROOT"]
+        self._definitions = namespace["DEFINITIONS"]
+
+    @property
+    def definitions(self):
+        """
+        Names of the definitions in ``$defs`` that instances can be validated
+        against
+        """
+        return list(self._definitions)
+
+    def validate(self, instance, definition=None):
+        """
+        Raises a SchemaValidationError for the first value of ``instance``
+        that does not match the schema, or its definition ``definition``
+        (e.g. ``"AI_EOTrainingData"``)
+        """
+        if definition is None:
+            self._root(instance)
+            return
+        try:
+            function = self._definitions[definition]
+        except KeyError:
+            raise ValueError("Unknown schema definition: {}".format(definition))
+        function(instance)
+
+    def is_valid(self, instance, definition=None):
+        try:
+            self.validate(instance, definition)
+        except SchemaValidationError:
+            return False
+        return True
+
+
+_validators = {}
+_validators_lock = threading.Lock()
+
+
+def get_schema_validator(cache_dir=None):
+    """
+    Returns the validator of the TDML schema, compiled once per process
+    """
+    with _validators_lock:
+        validator = _validators.get(cache_dir)
+        if validator is None:
+            validator = _validators[cache_dir] = SchemaValidator(cache_dir=cache_dir)
+        return validator
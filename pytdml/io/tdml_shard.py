@@ -0,0 +1,325 @@
+"""
+Sharded TDML encodings: a manifest with the dataset header plus shard files
+that each hold a slice of ``data``.
+
+A directory written by ``write_sharded`` contains::
+
+    manifest.json     {"format": "pytdml-sharded", "version": 1,
+                       "count": <number of data items>,
+                       "shards": [{"path": "data-00000.json", "count": ...,
+                                   "size": ..., "blake2b": ...}, ...],
+                       "header": <the encoding without data>}
+    data-00000.json   JSON array of the first data items
+    data-00001.json   ...
+
+Shards are independent parse units: ``read_sharded`` decodes and validates
+them in parallel processes, and distributed loaders can read their own
+shards through ``open_sharded(...).shards``. The size and hash of every shard
+are checked before it is decoded.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+from pytdml.io._json_stream import MEMBER, iter_members
+from pytdml.io.compression import open_tdml_file
+from pytdml.io.json_backend import _gc_paused, get_json_backend
+from pytdml.io.tdml_readers import parse_json, parse_training_data
+from pytdml.io.tdml_writers import _data_item_dict, _is_empty, remove_empty_values
+
+MANIFEST_NAME = "manifest.json"
+SHARD_FORMAT = "pytdml-sharded"
+SHARD_VERSION = 1
+DEFAULT_SHARD_SIZE = 10000
+
+_SHARD_NAME = "data-{:05d}.json"
+
+
+def _hash(data):
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class Shard:
+    """
+    One shard of a sharded encoding: ``count`` data items starting at
+    position ``start`` of ``data``, stored in the file ``path``
+    """
+
+    def __init__(self, path, count, start, size, blake2b):
+        self.path = path
+        self.count = count
+        self.start = start
+        self.size = size
+        self.blake2b = blake2b
+
+    def __repr__(self):
+        return "Shard({!r}, count={}, start={})".format(
+            self.path, self.count, self.start
+        )
+
+    def read_bytes(self, verify=True):
+        """
+        Returns the content of the shard file, checked against the size and
+        hash in the manifest if ``verify`` is true
+        """
+        with open(self.path, "rb") as f:
+            data = f.read()
+        if verify and (len(data) != self.size or _hash(data) != self.blake2b):
+            raise ValueError(
+                "Shard {} does not match the manifest, it was modified or "
+                "truncated".format(self.path)
+            )
+        return data
+
+    def load_dicts(self, verify=True, backend=None):
+        """
+        Returns the data items of the shard as JSON dicts
+        """
+        items = get_json_backend(backend).loads(self.read_bytes(verify))
+        if len(items) != self.count:
+            raise ValueError(
+                "Shard {} has {} data items, the manifest records {}".format(
+                    self.path, len(items), self.count
+                )
+            )
+        return items
+
+    def load(self, validate=True, verify=True, backend=None):
+        """
+        Returns the data items of the shard as training data objects (see
+        ``parse_json`` for ``validate``)
+        """
+        items = self.load_dicts(verify, backend)
+        with _gc_paused():
+            return [
+                parse_training_data(item, take_ownership=True, validate=validate)
+                for item in items
+            ]
+
+
+def _load_shard(shard, validate, verify, backend):
+    # The objects are sent back pickled, so that the parent can unpickle them
+    # with the cyclic garbage collector paused
+    return pickle.dumps(
+        shard.load(validate, verify, backend), protocol=pickle.HIGHEST_PROTOCOL
+    )
+
+
+class ShardedEncoding:
+    """
+    Manifest of a sharded encoding written by ``write_sharded``
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        with open(os.path.join(directory, MANIFEST_NAME), "rb") as f:
+            manifest = json.loads(f.read())
+        if manifest.get("format") != SHARD_FORMAT:
+            raise ValueError("Not a sharded TDML encoding: {}".format(directory))
+        if manifest.get("version", 0) > SHARD_VERSION:
+            raise ValueError(
+                "Unsupported sharded encoding version: {}".format(manifest["version"])
+            )
+        self.header = manifest["header"]
+        self.shards = []
+        start = 0
+        for entry in manifest["shards"]:
+            self.shards.append(
+                Shard(
+                    os.path.join(directory, entry["path"]),
+                    entry["count"],
+                    start,
+                    entry["size"],
+                    entry["blake2b"],
+                )
+            )
+            start += entry["count"]
+
+    def __len__(self):
+        return sum(shard.count for shard in self.shards)
+
+    def shards_for(self, rank, world_size):
+        """
+        Returns the shards of worker ``rank`` out of ``world_size`` workers
+        of a distributed loader, assigned round robin
+        """
+        if not 0 <= rank < world_size:
+            raise ValueError("Invalid rank {} of {}".format(rank, world_size))
+        return self.shards[rank::world_size]
+
+    def load_items(self, workers=None, validate=True, verify=True, backend=None):
+        """
+        Returns the data items of all shards as training data objects in
+        order. The shards are parsed by ``workers`` processes (default: the
+        number of CPUs, 1 parses them in this process).
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        workers = min(workers, len(self.shards))
+        if workers <= 1:
+            items = []
+            for shard in self.shards:
+                items.extend(shard.load(validate, verify, backend))
+            return items
+
+        items = []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(
+                _load_shard,
+                self.shards,
+                [validate] * len(self.shards),
+                [verify] * len(self.shards),
+                [backend] * len(self.shards),
+            )
+            for result in results:
+                with _gc_paused():
+                    items.extend(pickle.loads(result))
+        return items
+
+    def load(self, workers=None, validate=True, verify=True, backend=None):
+        """
+        Returns the TrainingDataset of the encoding (see ``load_items``)
+        """
+        items = self.load_items(workers, validate, verify, backend)
+        json_dict = dict(self.header)
+        if items:
+            json_dict["data"] = items
+        # The items are objects already, only the header is validated
+        return parse_json(json_dict, take_ownership=True, validate=validate)
+
+
+def _write_shard(directory, number, chunks):
+    """
+    Writes the encoded data items ``chunks`` as a JSON array and returns the
+    manifest entry of the shard
+    """
+    data = b"[" + b",".join(chunks) + b"]"
+    name = _SHARD_NAME.format(number)
+    with open(os.path.join(directory, name), "wb") as f:
+        f.write(data)
+    return {
+        "path": name,
+        "count": len(chunks),
+        "size": len(data),
+        "blake2b": _hash(data),
+    }
+
+
+def _dataset_header(td):
+    header = remove_empty_values(td.model_copy(update={"data": []}).to_dict())
+    header.pop("data", None)
+    return header
+
+
+def _encoded_items(td, backend):
+    for item in td.data or ():
+        json_item = remove_empty_values(_data_item_dict(td, item))
+        if not _is_empty(json_item):
+            yield backend.dumps(json_item)
+
+
+def _file_items(file_path, header):
+    # Items are copied as they are, the header is collected on the way
+    with open_tdml_file(file_path) as f:
+        for kind, key, value, raw, _, _ in iter_members(f):
+            if kind == MEMBER:
+                header[key] = value
+            else:
+                yield bytes(raw)
+
+
+def _manifest_shards(directory):
+    """
+    Returns the file names of the shards listed by the manifest in
+    ``directory``, an empty set if there is no readable manifest
+    """
+    try:
+        with open(os.path.join(directory, MANIFEST_NAME), "rb") as f:
+            manifest = json.loads(f.read())
+        if manifest.get("format") != SHARD_FORMAT:
+            return set()
+        paths = {entry["path"] for entry in manifest["shards"]}
+    except (OSError, ValueError, TypeError, KeyError, AttributeError):
+        return set()
+    # Only shards of the directory itself are ever removed
+    return {
+        path
+        for path in paths
+        if isinstance(path, str) and path == os.path.basename(path)
+    }
+
+
+def write_sharded(td, directory, shard_size=DEFAULT_SHARD_SIZE, backend=None):
+    """
+    Writes a TrainingDataset, or a TDML JSON file given by its path, as a
+    sharded encoding of ``shard_size`` data items per shard to ``directory``.
+    The data items of a file are copied as their raw JSON, without being
+    parsed into objects. Returns the ShardedEncoding.
+
+    The manifest is written last, then the shards listed by the previous
+    manifest that the new one does not reference are removed; other files of
+    the directory are left alone. Shards overwritten by an interrupted write
+    are detected by their hashes.
+    """
+    if shard_size < 1:
+        raise ValueError("shard_size must be positive")
+    backend = get_json_backend(backend, default="stdlib")
+    os.makedirs(directory, exist_ok=True)
+    previous = _manifest_shards(directory)
+    if isinstance(td, (str, os.PathLike)):
+        header = {}
+        chunks = _file_items(td, header)
+    else:
+        header = _dataset_header(td)
+        chunks = _encoded_items(td, backend)
+
+    entries = []
+    buffer = []
+    for chunk in chunks:
+        buffer.append(chunk)
+        if len(buffer) == shard_size:
+            entries.append(_write_shard(directory, len(entries), buffer))
+            buffer = []
+    if buffer:
+        entries.append(_write_shard(directory, len(entries), buffer))
+    header.pop("data", None)
+
+    manifest = {
+        "format": SHARD_FORMAT,
+        "version": SHARD_VERSION,
+        "count": sum(entry["count"] for entry in entries),
+        "shards": entries,
+        "header": header,
+    }
+    manifest_path = os.path.join(directory, MANIFEST_NAME)
+    temp_path = manifest_path + ".tmp"
+    with open(temp_path, "wb") as f:
+        f.write(backend.dumps(manifest, indent=2))
+    os.replace(temp_path, manifest_path)
+
+    for name in previous - {entry["path"] for entry in entries}:
+        try:
+            os.remove(os.path.join(directory, name))
+        except FileNotFoundError:
+            pass
+    return ShardedEncoding(directory)
+
+
+def open_sharded(directory):
+    """
+    Opens the manifest of a sharded encoding, to load its shards separately
+    """
+    return ShardedEncoding(directory)
+
+
+def read_sharded(directory, workers=None, validate=True, verify=True, backend=None):
+    """
+    Reads a sharded encoding written by ``write_sharded`` and returns the
+    TrainingDataset. The shards are decoded and validated by ``workers``
+    processes (default: the number of CPUs) and concatenated in order;
+    ``verify`` checks every shard against the size and hash in the manifest.
+    """
+    return ShardedEncoding(directory).load(workers, validate, verify, backend)
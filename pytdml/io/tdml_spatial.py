@@ -0,0 +1,629 @@
+"""
+Spatial index over the extents or object-label geometries of data items.
+
+The index is a static R-tree packed with the Sort-Tile-Recursive (STR)
+algorithm and stored in NumPy arrays, one level per array::
+
+    level 0    entry boxes (minx, miny, maxx, maxy) and the data item position
+               of every entry, in STR order
+    level 1+   node boxes and the first child of every node in the level
+               below; a node has ``node_capacity`` children except the last
+
+Every level is sorted into STR order before the level above is packed over
+it, so the children of a node are consecutive. Queries descend one level at a
+time with vectorized box tests.
+
+Entries are bounding boxes: with ``source="extent"`` one per data item that
+has an extent, with ``source="labels"`` one per object label geometry. Label
+geometries are usually in pixel coordinates of their image, so the two kinds
+of entries are never mixed in one index.
+
+The index can be saved as a ``.npz`` sidecar next to the encoding
+(``<file>.<source>.rtree`` by default) and is rebuilt by ``open_spatial_index``
+only when the encoding changed size.
+"""
+
+import heapq
+import math
+import os
+
+import numpy as np
+
+from pytdml.io._json_stream import ITEM, MEMBER, iter_members
+from pytdml.io.compression import open_tdml_file
+
+DEFAULT_NODE_CAPACITY = 16
+SOURCES = ("extent", "labels")
+
+_FORMAT_VERSION = 2
+
+
+def _default_index_path(file_path, source):
+    return "{}.{}.rtree".format(file_path, source)
+
+
+def _check_source(source):
+    if source not in SOURCES:
+        raise ValueError(
+            "Unknown source: {}, expected one of {}".format(source, ", ".join(SOURCES))
+        )
+
+
+def _union(a, b):
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
+
+
+def _coordinate_bounds(coordinates):
+    if not coordinates:
+        return None
+    if isinstance(coordinates[0], (int, float)):
+        x, y = coordinates[0], coordinates[1]
+        return (x, y, x, y)
+    bounds = None
+    for part in coordinates:
+        bounds = _union(bounds, _coordinate_bounds(part))
+    return bounds
+
+
+def geometry_bounds(geometry):
+    """
+    Returns (minx, miny, maxx, maxy) of a GeoJSON geometry or feature, or
+    None if it has no coordinates
+    """
+    if geometry is None:
+        return None
+    if geometry.get("type") == "Feature":
+        return geometry_bounds(geometry.get("geometry"))
+    if geometry.get("type") == "GeometryCollection":
+        bounds = None
+        for part in geometry.get("geometries") or ():
+            bounds = _union(bounds, geometry_bounds(part))
+        return bounds
+    return _coordinate_bounds(geometry.get("coordinates"))
+
+
+def _pos_list_bounds(pos_list):
+    if not pos_list:
+        return None
+    xs, ys = pos_list[0::2], pos_list[1::2]
+    return (min(xs), min(ys), max(xs), max(ys))
+
+
+def extent_bounds(extent):
+    """
+    Returns (minx, miny, maxx, maxy) of an extent: a [minx, miny, maxx, maxy]
+    list (or a 3D one with the z values after x and y) or an EX_Extent object
+    or dict with bounding boxes or polygons. Returns None if the extent has no
+    coordinates.
+    """
+    if extent is None:
+        return None
+    if hasattr(extent, "to_dict"):
+        extent = extent.to_dict()
+    if isinstance(extent, (list, tuple)):
+        if len(extent) == 4:
+            return tuple(extent)
+        if len(extent) == 6:
+            return (extent[0], extent[1], extent[3], extent[4])
+        raise ValueError("Invalid extent: {}".format(extent))
+    bounds = None
+    for element in extent.get("geographicElement") or ():
+        if "westBoundLongitude" in element:
+            bounds = _union(
+                bounds,
+                (
+                    element["westBoundLongitude"],
+                    element["southBoundLatitude"],
+                    element["eastBoundLongitude"],
+                    element["northBoundLatitude"],
+                ),
+            )
+        for polygon in element.get("polygon") or ():
+            exterior = polygon.get("exterior") or {}
+            pos_list = (exterior.get("linearRing") or {}).get("posList")
+            bounds = _union(bounds, _pos_list_bounds(pos_list))
+    return bounds
+
+
+def _field(item, name, key):
+    # Items are validated objects or JSON dicts
+    if isinstance(item, dict):
+        return item.get(key)
+    return getattr(item, name, None)
+
+
+def _item_entries(items, source):
+    """
+    Yields (position, id, bounds) of every entry of the data items
+    """
+    for position, item in enumerate(items):
+        item_id = _field(item, "id", "id")
+        if source == "extent":
+            bounds = extent_bounds(_field(item, "extent", "extent"))
+            if bounds is not None:
+                yield position, item_id, bounds
+            continue
+        for label in _field(item, "labels", "labels") or ():
+            if _field(label, "type", "type") != "AI_ObjectLabel":
+                continue
+            bounds = geometry_bounds(_field(label, "object", "object"))
+            if bounds is not None:
+                yield position, item_id, bounds
+
+
+def _str_order(boxes, node_capacity):
+    """
+    Returns the order that tiles ``boxes`` into nodes of ``node_capacity``
+    """
+    count = len(boxes)
+    n_nodes = math.ceil(count / node_capacity)
+    n_slices = math.ceil(math.sqrt(n_nodes))
+    slice_size = n_slices * node_capacity
+    centers_x = boxes[:, 0] + boxes[:, 2]
+    centers_y = boxes[:, 1] + boxes[:, 3]
+    order = np.argsort(centers_x, kind="stable")
+    for start in range(0, count, slice_size):
+        part = order[start : start + slice_size]
+        order[start : start + slice_size] = part[
+            np.argsort(centers_y[part], kind="stable")
+        ]
+    return order
+
+
+def _node_boxes(boxes, node_capacity):
+    starts = np.arange(0, len(boxes), node_capacity)
+    return np.column_stack(
+        (
+            np.minimum.reduceat(boxes[:, 0], starts),
+            np.minimum.reduceat(boxes[:, 1], starts),
+            np.maximum.reduceat(boxes[:, 2], starts),
+            np.maximum.reduceat(boxes[:, 3], starts),
+        )
+    )
+
+
+def _intersects(boxes, bbox):
+    return (
+        (boxes[:, 0] <= bbox[2])
+        & (boxes[:, 2] >= bbox[0])
+        & (boxes[:, 1] <= bbox[3])
+        & (boxes[:, 3] >= bbox[1])
+    )
+
+
+def _distances(boxes, x, y):
+    dx = np.maximum(np.maximum(boxes[:, 0] - x, x - boxes[:, 2]), 0)
+    dy = np.maximum(np.maximum(boxes[:, 1] - y, y - boxes[:, 3]), 0)
+    return np.hypot(dx, dy)
+
+
+def _rings(polygon):
+    """
+    Returns the polygons of a GeoJSON Polygon, MultiPolygon or Feature, or
+    of a sequence of (x, y) points, as lists of (n, 2) rings (exterior first)
+    """
+    if isinstance(polygon, dict):
+        if polygon.get("type") == "Feature":
+            return _rings(polygon.get("geometry"))
+        if polygon.get("type") == "Polygon":
+            parts = [polygon["coordinates"]]
+        elif polygon.get("type") == "MultiPolygon":
+            parts = polygon["coordinates"]
+        else:
+            raise ValueError("Expected a Polygon or MultiPolygon geometry")
+    else:
+        parts = [[polygon]]
+    return [
+        [np.asarray(ring, dtype=np.float64)[:, :2] for ring in part]
+        for part in parts
+        if part
+    ]
+
+
+def _points_in_ring(points, ring):
+    # Even-odd rule, casting a ray in +x from every point
+    x, y = points[:, :1], points[:, 1:]
+    x1, y1 = ring[:, 0], ring[:, 1]
+    x2, y2 = np.roll(x1, -1), np.roll(y1, -1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        crossing = ((y1 > y) != (y2 > y)) & (x < (x2 - x1) * (y - y1) / (y2 - y1) + x1)
+    return crossing.sum(axis=1) % 2 == 1
+
+
+def _ring_crosses_box(ring, box):
+    # Liang-Barsky clipping of every edge of the ring against the box
+    x1, y1 = ring[:, 0], ring[:, 1]
+    dx, dy = np.roll(x1, -1) - x1, np.roll(y1, -1) - y1
+    t0 = np.zeros(len(ring))
+    t1 = np.ones(len(ring))
+    inside = np.ones(len(ring), dtype=bool)
+    for p, q in (
+        (-dx, x1 - box[0]),
+        (dx, box[2] - x1),
+        (-dy, y1 - box[1]),
+        (dy, box[3] - y1),
+    ):
+        parallel = p == 0
+        inside &= ~(parallel & (q < 0))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = q / p
+        t0 = np.where(p < 0, np.maximum(t0, t), t0)
+        t1 = np.where(p > 0, np.minimum(t1, t), t1)
+    return bool((inside & (t0 <= t1)).any())
+
+
+def _box_intersects_polygon(box, rings):
+    corner = np.array([[box[0], box[1]]])
+    exterior, holes = rings[0], rings[1:]
+    if not (_ring_crosses_box(exterior, box) or _points_in_ring(corner, exterior)[0]):
+        return False
+    # A box that is entirely inside a hole does not intersect the polygon
+    for hole in holes:
+        if not _ring_crosses_box(hole, box) and _points_in_ring(corner, hole)[0]:
+            return False
+    return True
+
+
+class SpatialIndex:
+    """
+    STR-packed R-tree over the entries of a training dataset
+
+    Queries return the positions of the matching data items in ``data``, in
+    ascending order (nearest-neighbour queries: by distance), or their ids
+    with ``ids=True``. An item is returned once even if several of its label
+    geometries match.
+    """
+
+    def __init__(
+        self,
+        boxes,
+        positions,
+        ids=None,
+        source="extent",
+        node_capacity=DEFAULT_NODE_CAPACITY,
+        bounds=None,
+        source_size=None,
+        source_mtime=None,
+    ):
+        _check_source(source)
+        if node_capacity < 2:
+            raise ValueError("node_capacity must be at least 2")
+        self.source = source
+        self.node_capacity = node_capacity
+        self.ids = ids
+        self.source_size = source_size
+        self.source_mtime = source_mtime
+
+        boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+        positions = np.asarray(positions, dtype=np.int64)
+        self.bounds = tuple(bounds) if bounds is not None else None
+        if self.bounds is None and len(boxes):
+            self.bounds = (
+                float(boxes[:, 0].min()),
+                float(boxes[:, 1].min()),
+                float(boxes[:, 2].max()),
+                float(boxes[:, 3].max()),
+            )
+
+        # _boxes[0] holds the entries, _firsts[level] the first child of
+        # every node of that level (None for the entries)
+        self._boxes = []
+        self._firsts = []
+        if len(boxes):
+            order = _str_order(boxes, node_capacity)
+            boxes, positions = boxes[order], positions[order]
+        self._boxes.append(boxes)
+        self._firsts.append(None)
+        self.positions = positions
+        firsts = np.arange(0, len(boxes), node_capacity)
+        while len(boxes) > node_capacity:
+            boxes = _node_boxes(boxes, node_capacity)
+            order = _str_order(boxes, node_capacity)
+            boxes, firsts = boxes[order], firsts[order]
+            self._boxes.append(boxes)
+            self._firsts.append(firsts)
+            firsts = np.arange(0, len(boxes), node_capacity)
+
+    @classmethod
+    def _packed(cls, levels, firsts, positions, **kwargs):
+        index = cls.__new__(cls)
+        index.source = kwargs["source"]
+        index.node_capacity = kwargs["node_capacity"]
+        index.ids = kwargs["ids"]
+        index.bounds = kwargs["bounds"]
+        index.source_size = kwargs["source_size"]
+        index.source_mtime = kwargs["source_mtime"]
+        index._boxes = levels
+        index._firsts = firsts
+        index.positions = positions
+        return index
+
+    @classmethod
+    def from_items(
+        cls,
+        items,
+        source="extent",
+        node_capacity=DEFAULT_NODE_CAPACITY,
+        bounds=None,
+        source_size=None,
+        source_mtime=None,
+    ):
+        """
+        Builds the index over data items (objects or JSON dicts)
+        """
+        _check_source(source)
+        positions = []
+        boxes = []
+        ids = {}
+        for position, item_id, item_bounds in _item_entries(items, source):
+            positions.append(position)
+            boxes.append(item_bounds)
+            ids[position] = item_id
+        id_list = [None] * (max(ids) + 1 if ids else 0)
+        for position, item_id in ids.items():
+            id_list[position] = item_id
+        return cls(
+            boxes,
+            positions,
+            ids=id_list,
+            source=source,
+            node_capacity=node_capacity,
+            bounds=bounds,
+            source_size=source_size,
+            source_mtime=source_mtime,
+        )
+
+    @classmethod
+    def from_dataset(cls, td, source="extent", node_capacity=DEFAULT_NODE_CAPACITY):
+        """
+        Builds the index over the data items of a training dataset. The
+        extent of the dataset, if it has one, is used as ``bounds``.
+        """
+        data = td.data or []
+        if hasattr(data, "_items"):
+            # Items of a lazy dataset are indexed without validating them
+            data = data._items
+        bounds = (
+            extent_bounds(getattr(td, "extent", None)) if source == "extent" else None
+        )
+        return cls.from_items(data, source, node_capacity, bounds)
+
+    def __len__(self):
+        return len(self.positions)
+
+    @property
+    def height(self):
+        return len(self._boxes)
+
+    def _result(self, positions, ids):
+        if ids:
+            return [self.ids[position] for position in positions]
+        return positions
+
+    def _search(self, bbox):
+        """
+        Returns the entry indexes whose boxes intersect ``bbox``
+        """
+        top = len(self._boxes) - 1
+        nodes = np.arange(len(self._boxes[top]))
+        for level in range(top, 0, -1):
+            nodes = nodes[_intersects(self._boxes[level][nodes], bbox)]
+            first = self._firsts[level][nodes]
+            children = (first[:, None] + np.arange(self.node_capacity)).ravel()
+            nodes = children[children < len(self._boxes[level - 1])]
+        return nodes[_intersects(self._boxes[0][nodes], bbox)]
+
+    def query_bbox(self, bbox, ids=False):
+        """
+        Returns the data items with an entry intersecting ``bbox`` (minx, miny,
+        maxx, maxy)
+        """
+        entries = self._search(bbox)
+        return self._result(np.unique(self.positions[entries]), ids)
+
+    def query_polygon(self, polygon, ids=False):
+        """
+        Returns the data items with an entry intersecting ``polygon``: a
+        GeoJSON Polygon or MultiPolygon (geometry or feature) or a sequence
+        of (x, y) points. Entries are tested by their bounding boxes.
+        """
+        matches = set()
+        for rings in _rings(polygon):
+            exterior = rings[0]
+            bbox = (
+                exterior[:, 0].min(),
+                exterior[:, 1].min(),
+                exterior[:, 0].max(),
+                exterior[:, 1].max(),
+            )
+            for entry in self._search(bbox):
+                position = int(self.positions[entry])
+                if position not in matches and _box_intersects_polygon(
+                    self._boxes[0][entry], rings
+                ):
+                    matches.add(position)
+        return self._result(np.array(sorted(matches), dtype=np.int64), ids)
+
+    def nearest(self, x, y, k=1, max_distance=None, ids=False):
+        """
+        Returns the ``k`` data items with the entries nearest to the point
+        (x, y), nearest first. Entries containing the point have distance 0.
+        """
+        top = len(self._boxes) - 1
+        heap = []
+        if len(self.positions):
+            for node, distance in enumerate(_distances(self._boxes[top], x, y)):
+                heap.append((distance, top, node))
+        heapq.heapify(heap)
+        found = []
+        seen = set()
+        while heap and len(found) < k:
+            distance, level, node = heapq.heappop(heap)
+            if max_distance is not None and distance > max_distance:
+                break
+            if level == 0:
+                position = int(self.positions[node])
+                if position not in seen:
+                    seen.add(position)
+                    found.append(position)
+                continue
+            first = int(self._firsts[level][node])
+            last = min(first + self.node_capacity, len(self._boxes[level - 1]))
+            distances = _distances(self._boxes[level - 1][first:last], x, y)
+            for child, child_distance in zip(range(first, last), distances.tolist()):
+                heapq.heappush(heap, (child_distance, level - 1, child))
+        return self._result(np.array(found, dtype=np.int64), ids)
+
+    def save(self, index_path):
+        """
+        Writes the index to ``index_path`` as a NumPy ``.npz`` archive
+        """
+        arrays = {
+            "meta": np.array(
+                [
+                    _FORMAT_VERSION,
+                    self.node_capacity,
+                    SOURCES.index(self.source),
+                    -1 if self.source_size is None else self.source_size,
+                    -1 if self.source_mtime is None else self.source_mtime,
+                ],
+                dtype=np.int64,
+            ),
+            "positions": self.positions,
+        }
+        if self.bounds is not None:
+            arrays["bounds"] = np.array(self.bounds, dtype=np.float64)
+        if self.ids is not None:
+            arrays["ids"] = np.array(
+                ["" if item_id is None else item_id for item_id in self.ids],
+                dtype=str,
+            )
+        for level, boxes in enumerate(self._boxes):
+            arrays["boxes_{}".format(level)] = boxes
+            if level:
+                arrays["firsts_{}".format(level)] = self._firsts[level]
+        # np.savez appends .npz to names without it
+        with open(index_path, "wb") as f:
+            np.savez(f, **arrays)
+
+    @classmethod
+    def load(cls, index_path):
+        """
+        Reads an index written by ``save``
+        """
+        with np.load(index_path, allow_pickle=False) as archive:
+            meta = archive["meta"].tolist()
+            version = meta[0]
+            if version != _FORMAT_VERSION:
+                raise ValueError(
+                    "Unsupported spatial index version: {}".format(version)
+                )
+            _, node_capacity, source, source_size, source_mtime = meta
+            height = sum(1 for name in archive.files if name.startswith("boxes_"))
+            levels = [archive["boxes_{}".format(level)] for level in range(height)]
+            firsts = [None] + [
+                archive["firsts_{}".format(level)] for level in range(1, height)
+            ]
+            return cls._packed(
+                levels,
+                firsts,
+                archive["positions"],
+                source=SOURCES[source],
+                node_capacity=node_capacity,
+                ids=archive["ids"].tolist() if "ids" in archive.files else None,
+                bounds=(
+                    tuple(archive["bounds"].tolist())
+                    if "bounds" in archive.files
+                    else None
+                ),
+                source_size=None if source_size < 0 else source_size,
+                source_mtime=None if source_mtime < 0 else source_mtime,
+            )
+
+
+def build_spatial_index(
+    file_path, index_path=None, source="extent", node_capacity=DEFAULT_NODE_CAPACITY
+):
+    """
+    Scans a TDML JSON file once, builds the spatial index of its data items
+    and saves it to ``index_path``. Returns the path of the index file.
+    """
+    _check_source(source)
+    if index_path is None:
+        index_path = _default_index_path(file_path, source)
+    header = {}
+
+    def items(f):
+        for kind, key, value, _, _, _ in iter_members(f):
+            if kind == ITEM:
+                yield value
+            elif kind == MEMBER:
+                header[key] = value
+
+    # Taken before the scan, so that a change during the scan makes the index
+    # out of date
+    stat = os.stat(file_path)
+    with open_tdml_file(file_path) as f:
+        index = SpatialIndex.from_items(
+            items(f),
+            source,
+            node_capacity,
+            source_size=stat.st_size,
+            source_mtime=stat.st_mtime_ns,
+        )
+    if source == "extent":
+        dataset_bounds = extent_bounds(header.get("extent"))
+        if dataset_bounds is not None:
+            index.bounds = dataset_bounds
+    index.save(index_path)
+    return index_path
+
+
+def _is_current(index, file_path, source):
+    stat = os.stat(file_path)
+    return (
+        index.source == source
+        and index.source_size == stat.st_size
+        and index.source_mtime == stat.st_mtime_ns
+    )
+
+
+def open_spatial_index(
+    file_path,
+    index_path=None,
+    source="extent",
+    build=True,
+    node_capacity=DEFAULT_NODE_CAPACITY,
+):
+    """
+    Loads the spatial index of a TDML JSON file. If it does not exist yet, was
+    built for a file of another size or modification time, or was written by
+    another version, it is built first (with ``node_capacity``) when ``build``
+    is true.
+    """
+    _check_source(source)
+    if index_path is None:
+        index_path = _default_index_path(file_path, source)
+    if os.path.exists(index_path):
+        try:
+            index = SpatialIndex.load(index_path)
+        except ValueError:
+            if not build:
+                raise
+        else:
+            if _is_current(index, file_path, source):
+                return index
+            if not build:
+                raise ValueError(
+                    "Spatial index {} is out of date for {}".format(
+                        index_path, file_path
+                    )
+                )
+    elif not build:
+        raise FileNotFoundError("No spatial index at {}".format(index_path))
+    build_spatial_index(file_path, index_path, source, node_capacity)
+    return SpatialIndex.load(index_path)
@@ -0,0 +1,237 @@
+"""
+Dataset statistics computed in one pass over the data items.
+
+The pass only extracts columns (labels per item, training type per item,
+class and bounding box size per label) into flat lists; the statistics are
+then aggregated with NumPy. They are written back to the dataset:
+
+* ``amount_of_training_data`` and ``number_of_labels`` of every data item
+* ``statistics_info`` entries ``labelsPerClass``, ``labelsPerImage``,
+  ``trainingTypes``, ``bboxWidth``, ``bboxHeight`` and ``bboxArea``
+  (other entries are kept)
+* ``classes``: classes used by labels but missing are added with their label
+  count, classes without a value get their label count. Existing values are
+  kept, as they may be class indices or colors.
+* ``number_of_classes``
+
+Run as ``python -m pytdml.io.tdml_statistics dataset.json`` to print the
+statistics of an encoding, and ``--output`` to write the updated encoding.
+"""
+
+import argparse
+import json
+import sys
+from collections import Counter
+from itertools import chain
+
+import numpy as np
+
+from pytdml.io.tdml_readers import read_from_json
+from pytdml.io.tdml_writers import write_to_json
+from pytdml.type import NamedValue
+
+STATISTICS_KEYS = (
+    "labelsPerClass",
+    "labelsPerImage",
+    "trainingTypes",
+    "bboxWidth",
+    "bboxHeight",
+    "bboxArea",
+)
+PERCENTILES = (5, 25, 50, 75, 95)
+
+
+def _field(obj, name, key):
+    # Items of a lazy dataset that were not accessed yet are still JSON dicts
+    if isinstance(obj, dict):
+        return obj.get(key)
+    return getattr(obj, name, None)
+
+
+def _set_number_of_labels(item, count):
+    if isinstance(item, dict):
+        item["numberOfLabels"] = count
+    else:
+        item.number_of_labels = count
+
+
+def _exterior_ring(feature):
+    """
+    Returns the exterior ring of the polygon geometry of a GeoJSON feature, or
+    None for other geometries
+    """
+    geometry = feature.get("geometry") if feature else None
+    if not geometry or geometry.get("type") != "Polygon":
+        return None
+    coordinates = geometry.get("coordinates")
+    if not coordinates or not coordinates[0]:
+        return None
+    return coordinates[0]
+
+
+class _Columns:
+    """
+    Flat columns extracted from the data items
+    """
+
+    def __init__(self, items, update_items):
+        self.label_counts = np.zeros(len(items), dtype=np.int64)
+        self.training_types = []
+        self.classes = []
+        # x, y of the points of all exterior rings and the number per ring
+        coordinates = []
+        ring_lengths = []
+        for position, item in enumerate(items):
+            labels = _field(item, "labels", "labels") or ()
+            self.label_counts[position] = len(labels)
+            self.training_types.append(_field(item, "training_type", "trainingType"))
+            for label in labels:
+                label_class = _field(label, "label_class", "class")
+                if label_class is not None:
+                    self.classes.append(label_class)
+                if _field(label, "type", "type") != "AI_ObjectLabel":
+                    continue
+                ring = _exterior_ring(_field(label, "object", "object"))
+                if ring is None:
+                    continue
+                if len(ring[0]) == 2:
+                    coordinates.extend(chain.from_iterable(ring))
+                else:
+                    coordinates.extend(chain.from_iterable(p[:2] for p in ring))
+                ring_lengths.append(len(ring))
+            if update_items:
+                _set_number_of_labels(item, len(labels))
+
+        points = np.array(coordinates, dtype=np.float64).reshape(-1, 2)
+        if ring_lengths:
+            starts = np.cumsum([0] + ring_lengths[:-1])
+            xs, ys = points[:, 0], points[:, 1]
+            self.widths = np.maximum.reduceat(xs, starts) - np.minimum.reduceat(
+                xs, starts
+            )
+            self.heights = np.maximum.reduceat(ys, starts) - np.minimum.reduceat(
+                ys, starts
+            )
+        else:
+            self.widths = self.heights = np.zeros(0)
+
+
+def _distribution(values, percentiles):
+    if not len(values):
+        return {"count": 0}
+    quantiles = np.percentile(values, percentiles)
+    distribution = {
+        "count": int(len(values)),
+        "min": float(values.min()),
+        "max": float(values.max()),
+        "mean": float(values.mean()),
+        "std": float(values.std()),
+    }
+    for percentile, quantile in zip(percentiles, quantiles):
+        distribution["p{}".format(percentile)] = float(quantile)
+    return distribution
+
+
+def _data_items(td):
+    from pytdml.type.lazy_types import LazyTrainingDataList
+
+    if isinstance(td.data, LazyTrainingDataList):
+        return td.data._items
+    return td.data or []
+
+
+def _update_classes(td, class_counts):
+    classes = list(td.classes or [])
+    known = set()
+    for position, named_value in enumerate(classes):
+        key = _field(named_value, "key", "key")
+        known.add(key)
+        if _field(named_value, "value", "value") is None and key in class_counts:
+            classes[position] = NamedValue(key=key, value=class_counts[key])
+    for key in sorted(set(class_counts) - known):
+        classes.append(NamedValue(key=key, value=class_counts[key]))
+    td.classes = classes
+    td.number_of_classes = len(classes)
+
+
+def compute_statistics(td, update=True, percentiles=PERCENTILES):
+    """
+    Computes the statistics of a training dataset and returns them as a dict
+    with the keys of ``STATISTICS_KEYS``:
+
+    * ``labelsPerClass``: number of labels of every class
+    * ``labelsPerImage``: ``histogram`` (number of items with 0, 1, ...
+      labels), ``mean`` and ``max``
+    * ``trainingTypes``: number of items per training type, items without
+      one are counted as ``"unspecified"``
+    * ``bboxWidth``, ``bboxHeight``, ``bboxArea``: ``count``, ``min``,
+      ``max``, ``mean``, ``std`` and the ``percentiles`` (``p5``, ...) of the
+      bounding boxes of the polygon geometries of object labels
+
+    If ``update`` is true the dataset is updated as described in the module
+    documentation.
+    """
+    items = _data_items(td)
+    columns = _Columns(items, update)
+
+    class_counts = dict(Counter(columns.classes).most_common())
+    histogram = np.bincount(columns.label_counts) if len(items) else np.zeros(0)
+    training_types = Counter(
+        "unspecified" if value is None else value for value in columns.training_types
+    )
+    statistics = {
+        "labelsPerClass": class_counts,
+        "labelsPerImage": {
+            "histogram": histogram.tolist(),
+            "mean": float(columns.label_counts.mean()) if len(items) else 0.0,
+            "max": int(columns.label_counts.max()) if len(items) else 0,
+        },
+        "trainingTypes": dict(sorted(training_types.items())),
+        "bboxWidth": _distribution(columns.widths, percentiles),
+        "bboxHeight": _distribution(columns.heights, percentiles),
+        "bboxArea": _distribution(columns.widths * columns.heights, percentiles),
+    }
+
+    if update:
+        td.amount_of_training_data = len(items)
+        kept = [
+            named_value
+            for named_value in td.statistics_info or []
+            if _field(named_value, "key", "key") not in statistics
+        ]
+        td.statistics_info = kept + [
+            NamedValue(key=key, value=value) for key, value in statistics.items()
+        ]
+        _update_classes(td, class_counts)
+    return statistics
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Compute the statistics of a TrainingDML-AI JSON encoding"
+    )
+    parser.add_argument("input", help="TrainingDML-AI JSON file path")
+    parser.add_argument(
+        "--output",
+        help="Write the encoding with the statistics filled in to this path",
+    )
+    parser.add_argument(
+        "--no-validate",
+        action="store_true",
+        help="Do not validate the encoding (for trusted files)",
+    )
+    args = parser.parse_args(argv)
+
+    # Without --output the data items are only counted, not validated
+    td = read_from_json(
+        args.input, lazy=args.output is None, validate=not args.no_validate
+    )
+    statistics = compute_statistics(td, update=args.output is not None)
+    json.dump(statistics, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    if args.output:
+        write_to_json(td, args.output)
+
+
+if __name__ == "__main__":
+    main()
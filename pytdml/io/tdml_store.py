@@ -0,0 +1,382 @@
+"""
+SQLite-backed store for querying the data items of TDML encodings.
+
+An encoding is loaded into the database once; data items are kept as their
+JSON text and indexed by id, label class, training type and dataset, so
+queries like "class in {...} and trainingType = 'training'" over a union of
+large datasets run in SQLite instead of over Python lists. Query results are
+parsed into training data objects one at a time.
+"""
+
+import json
+import sqlite3
+
+from pytdml.io._json_stream import ITEM, MEMBER, iter_members
+from pytdml.io.compression import open_tdml_file
+from pytdml.io.tdml_readers import parse_json, parse_training_data
+from pytdml.io.tdml_writers import _data_item_dict, remove_empty_values
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS datasets (
+    dataset INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    header TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS items (
+    item INTEGER PRIMARY KEY,
+    dataset INTEGER NOT NULL REFERENCES datasets,
+    id TEXT,
+    training_type TEXT,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS item_classes (
+    item INTEGER NOT NULL REFERENCES items,
+    class TEXT NOT NULL,
+    PRIMARY KEY (class, item)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS items_id ON items (id);
+CREATE INDEX IF NOT EXISTS items_training_type ON items (training_type, dataset);
+CREATE INDEX IF NOT EXISTS items_dataset ON items (dataset);
+CREATE INDEX IF NOT EXISTS item_classes_item ON item_classes (item);
+"""
+
+_BATCH_SIZE = 10000
+
+# Longer lists of values to match are passed as a JSON array
+_MAX_INLINE_VALUES = 100
+
+# Id of a dataset while it is being loaded
+_LOADING = "\x00loading"
+
+
+def _item_classes(json_item):
+    classes = set()
+    for label in json_item.get("labels") or ():
+        if isinstance(label, dict) and label.get("class") is not None:
+            classes.add(label["class"])
+    return classes
+
+
+def _as_list(values):
+    return [values] if isinstance(values, str) else list(values)
+
+
+def _in_list(values, parameters):
+    """
+    Returns the right-hand side of an ``IN`` for ``values`` and appends its
+    parameters. Long lists are passed as one JSON array, as the number of
+    parameters of a statement is limited (999 before SQLite 3.32).
+    """
+    values = _as_list(values)
+    if len(values) <= _MAX_INLINE_VALUES:
+        parameters.extend(values)
+        return "({})".format(", ".join("?" * len(values)))
+    parameters.append(json.dumps(values))
+    return "(SELECT value FROM json_each(?))"
+
+
+class TDMLStore:
+    """
+    Local SQLite database of the data items of one or more TDML encodings
+
+    ``path`` is the database file, ``":memory:"`` keeps it in memory. A store
+    file can be reopened later without loading the encodings again. Stores
+    backed by a file can be pickled, e.g. to DataLoader worker processes, and
+    reconnect on first use.
+    """
+
+    def __init__(self, path=":memory:"):
+        self.path = str(path)
+        self._connection = None
+        self._connect()
+
+    def _connect(self):
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.path)
+            self._connection.executescript(_SCHEMA)
+        return self._connection
+
+    def _new_dataset(self, dataset_id, header):
+        """
+        Inserts a dataset, replacing the dataset with the same id if any
+        """
+        connection = self._connect()
+        row = connection.execute(
+            "SELECT dataset FROM datasets WHERE id = ?", (dataset_id,)
+        ).fetchone()
+        if row is not None:
+            self._remove(row[0])
+        return connection.execute(
+            "INSERT INTO datasets (id, header) VALUES (?, ?)",
+            (dataset_id, json.dumps(header, ensure_ascii=False)),
+        ).lastrowid
+
+    def _insert(self, dataset_key, items):
+        """
+        Inserts (JSON dict, JSON text) pairs of data items in batches
+        """
+        connection = self._connect()
+        (last_item,) = connection.execute(
+            "SELECT COALESCE(MAX(item), 0) FROM items"
+        ).fetchone()
+        next_item = last_item + 1
+        item_rows = []
+        class_rows = []
+        for json_item, text in items:
+            item_rows.append(
+                (
+                    next_item,
+                    dataset_key,
+                    json_item.get("id"),
+                    json_item.get("trainingType"),
+                    text,
+                )
+            )
+            class_rows.extend(
+                (next_item, label_class) for label_class in _item_classes(json_item)
+            )
+            next_item += 1
+            if len(item_rows) == _BATCH_SIZE:
+                self._flush(item_rows, class_rows)
+        self._flush(item_rows, class_rows)
+
+    def _flush(self, item_rows, class_rows):
+        connection = self._connect()
+        connection.executemany(
+            "INSERT INTO items (item, dataset, id, training_type, data) "
+            "VALUES (?, ?, ?, ?, ?)",
+            item_rows,
+        )
+        connection.executemany(
+            "INSERT OR IGNORE INTO item_classes (item, class) VALUES (?, ?)",
+            class_rows,
+        )
+        item_rows.clear()
+        class_rows.clear()
+
+    def load(self, file_path, dataset_id=None):
+        """
+        Loads a TDML JSON file into the store and returns its dataset id (the
+        ``id`` of the encoding unless ``dataset_id`` is given). The file is
+        streamed, and the data items are stored as they are in the file
+        without being parsed into training data objects.
+        """
+        header = {}
+
+        def items(f):
+            for kind, key, value, raw, _, _ in iter_members(f):
+                if kind == ITEM:
+                    yield value, raw.decode("utf-8")
+                elif kind == MEMBER:
+                    header[key] = value
+
+        connection = self._connect()
+        with open_tdml_file(file_path) as f, connection:
+            # The id and header are only known once the whole file is read
+            dataset_key = self._new_dataset(_LOADING, {})
+            self._insert(dataset_key, items(f))
+            if dataset_id is None:
+                dataset_id = str(header.get("id", file_path))
+            row = connection.execute(
+                "SELECT dataset FROM datasets WHERE id = ?", (dataset_id,)
+            ).fetchone()
+            if row is not None:
+                self._remove(row[0])
+            connection.execute(
+                "UPDATE datasets SET id = ?, header = ? WHERE dataset = ?",
+                (dataset_id, json.dumps(header, ensure_ascii=False), dataset_key),
+            )
+        return dataset_id
+
+    def add(self, td, dataset_id=None):
+        """
+        Adds a TrainingDataset to the store and returns its dataset id
+        """
+        header = remove_empty_values(td.model_copy(update={"data": []}).to_dict())
+        header.pop("data", None)
+        dataset_id = td.id if dataset_id is None else dataset_id
+
+        def items():
+            for item in td.data:
+                json_item = remove_empty_values(_data_item_dict(td, item))
+                yield json_item, json.dumps(json_item, ensure_ascii=False)
+
+        with self._connect():
+            self._insert(self._new_dataset(dataset_id, header), items())
+        return dataset_id
+
+    def _remove(self, dataset_key):
+        connection = self._connect()
+        connection.execute(
+            "DELETE FROM item_classes WHERE item IN "
+            "(SELECT item FROM items WHERE dataset = ?)",
+            (dataset_key,),
+        )
+        connection.execute("DELETE FROM items WHERE dataset = ?", (dataset_key,))
+        connection.execute("DELETE FROM datasets WHERE dataset = ?", (dataset_key,))
+
+    def remove(self, dataset_id):
+        """
+        Removes a dataset and its data items from the store
+        """
+        connection = self._connect()
+        with connection:
+            row = connection.execute(
+                "SELECT dataset FROM datasets WHERE id = ?", (dataset_id,)
+            ).fetchone()
+            if row is None:
+                raise KeyError("No dataset with id {!r}".format(dataset_id))
+            self._remove(row[0])
+
+    @property
+    def datasets(self):
+        """
+        Ids of the datasets in the store
+        """
+        return [
+            row[0]
+            for row in self._connect().execute(
+                "SELECT id FROM datasets ORDER BY dataset"
+            )
+        ]
+
+    def header(self, dataset_id):
+        """
+        Returns the header of a dataset (every member except ``data``)
+        """
+        row = (
+            self._connect()
+            .execute("SELECT header FROM datasets WHERE id = ?", (dataset_id,))
+            .fetchone()
+        )
+        if row is None:
+            raise KeyError("No dataset with id {!r}".format(dataset_id))
+        return json.loads(row[0])
+
+    def __len__(self):
+        return self._connect().execute("SELECT COUNT(*) FROM items").fetchone()[0]
+
+    def _where(self, classes, training_type, dataset, ids):
+        conditions = []
+        parameters = []
+        if dataset is not None:
+            conditions.append(
+                "items.dataset IN (SELECT dataset FROM datasets WHERE id IN {})".format(
+                    _in_list(dataset, parameters)
+                )
+            )
+        if training_type is not None:
+            conditions.append(
+                "items.training_type IN {}".format(_in_list(training_type, parameters))
+            )
+        if classes is not None:
+            conditions.append(
+                "items.item IN (SELECT item FROM item_classes WHERE class IN {})".format(
+                    _in_list(classes, parameters)
+                )
+            )
+        if ids is not None:
+            conditions.append("items.id IN {}".format(_in_list(ids, parameters)))
+        where = " WHERE " + " AND ".join(conditions) if conditions else ""
+        return where, parameters
+
+    def count(self, classes=None, training_type=None, dataset=None, ids=None):
+        """
+        Returns the number of data items matching a query (see ``query``)
+        """
+        where, parameters = self._where(classes, training_type, dataset, ids)
+        return (
+            self._connect()
+            .execute("SELECT COUNT(*) FROM items" + where, parameters)
+            .fetchone()[0]
+        )
+
+    def query_dicts(self, classes=None, training_type=None, dataset=None, ids=None):
+        """
+        Iterates over the JSON dicts of the data items matching a query (see
+        ``query``)
+        """
+        where, parameters = self._where(classes, training_type, dataset, ids)
+        cursor = self._connect().execute(
+            "SELECT data FROM items" + where + " ORDER BY items.item", parameters
+        )
+        while True:
+            rows = cursor.fetchmany(1000)
+            if not rows:
+                return
+            for (data,) in rows:
+                yield json.loads(data)
+
+    def query(
+        self, classes=None, training_type=None, dataset=None, ids=None, validate=True
+    ):
+        """
+        Iterates over the training data objects matching a query, in the order
+        they were loaded. Every argument is a value or a list of values, and
+        None does not restrict the query:
+
+        - ``classes``: items with at least one label of one of the classes
+        - ``training_type``: items with one of the training types
+        - ``dataset``: items of one of the datasets
+        - ``ids``: items with one of the ids
+
+        ``validate=False`` trusts the stored items (see ``parse_json``).
+        """
+        for json_item in self.query_dicts(classes, training_type, dataset, ids):
+            yield parse_training_data(json_item, take_ownership=True, validate=validate)
+
+    def get(self, item_id, dataset=None, validate=True):
+        """
+        Returns the first data item with id ``item_id``
+        """
+        for item in self.query(ids=item_id, dataset=dataset, validate=validate):
+            return item
+        raise KeyError("No training data with id {!r}".format(item_id))
+
+    def classes(self, dataset=None):
+        """
+        Returns the number of data items per label class
+        """
+        where, parameters = self._where(None, None, dataset, None)
+        rows = self._connect().execute(
+            "SELECT class, COUNT(*) FROM item_classes JOIN items USING (item)"
+            + where
+            + " GROUP BY class ORDER BY class",
+            parameters,
+        )
+        return dict(rows)
+
+    def to_dataset(
+        self,
+        dataset_id,
+        classes=None,
+        training_type=None,
+        validate=True,
+    ):
+        """
+        Returns a dataset of the store as a TrainingDataset, restricted to the
+        items matching ``classes`` and ``training_type``
+        """
+        json_dict = self.header(dataset_id)
+        json_dict["data"] = list(
+            self.query_dicts(classes, training_type, dataset=dataset_id)
+        )
+        return parse_json(json_dict, take_ownership=True, validate=validate)
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __getstate__(self):
+        if self.path == ":memory:":
+            raise TypeError("An in-memory TDMLStore cannot be pickled")
+        state = self.__dict__.copy()
+        state["_connection"] = None
+        return state
@@ -0,0 +1,257 @@
+"""
+Temporal index over the acquisition times of data items.
+
+Every ``data_time`` of the data items (or ``date_time`` of their labels) is
+parsed once into int64 seconds since the epoch. The times are kept sorted
+together with the position of their data item, so range, before/after and
+seasonal queries are binary searches::
+
+    times      sorted int64 seconds (UTC, naive times are taken as UTC)
+    positions  position in ``data`` of the item of every time
+
+Dates without a time are midnight, a year-month is its first day and a year
+is January 1st. Times of day without a date cannot be placed on the time line
+and are skipped, like invalid strings.
+"""
+
+from datetime import date, datetime, timezone
+
+import numpy as np
+
+SOURCES = ("data", "labels")
+
+_SECONDS_PER_DAY = 86400
+
+
+def _parse_times(strings):
+    """
+    Parses TDML date strings to int64 seconds, with None for the ones that
+    cannot be parsed
+    """
+    try:
+        # One vectorized pass over the usual case of well-formed dates
+        return np.array(strings, dtype="datetime64[s]").astype(np.int64).tolist()
+    except ValueError:
+        pass
+    seconds = []
+    for value in strings:
+        try:
+            seconds.append(int(np.datetime64(value, "s").astype(np.int64)))
+        except ValueError:
+            seconds.append(None)
+    return seconds
+
+
+def to_seconds(value):
+    """
+    Returns the int64 seconds since the epoch of a TDML date string, a
+    datetime or date, a numpy datetime64 or a number of seconds
+    """
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        value = np.datetime64(value, "s")
+    elif isinstance(value, date):
+        value = np.datetime64(value, "D")
+    elif isinstance(value, str):
+        seconds = _parse_times([value])[0]
+        if seconds is None:
+            raise ValueError("Invalid date: {}".format(value))
+        return seconds
+    return int(np.datetime64(value, "s").astype(np.int64))
+
+
+def _field(item, name, key):
+    # Items are validated objects or JSON dicts
+    if isinstance(item, dict):
+        return item.get(key)
+    return getattr(item, name, None)
+
+
+def _item_times(items, source):
+    """
+    Yields (position, id, date strings) of the data items
+    """
+    for position, item in enumerate(items):
+        item_id = _field(item, "id", "id")
+        if source == "data":
+            times = _field(item, "data_time", "dataTime") or ()
+            if isinstance(times, str):
+                times = [times]
+        else:
+            times = []
+            for label in _field(item, "labels", "labels") or ():
+                label_times = _field(label, "date_time", "dateTime")
+                if isinstance(label_times, str):
+                    times.append(label_times)
+                elif label_times:
+                    times.extend(label_times)
+        yield position, item_id, times
+
+
+def _month_day(value):
+    month, day = (int(part) for part in value.split("-"))
+    if not (1 <= month <= 12 and 1 <= day <= 31):
+        raise ValueError("Invalid month-day: {}".format(value))
+    return month, day
+
+
+def _day_in_year(year, month, day):
+    # Days past the end of the month (e.g. 02-29) roll over to the next one
+    first = np.datetime64("{:04d}-{:02d}".format(year, month), "D")
+    return int((first + (day - 1)).astype("datetime64[s]").astype(np.int64))
+
+
+class TemporalIndex:
+    """
+    Sorted acquisition times of the data items of a training dataset
+
+    Queries return the positions of the matching data items in ``data`` in
+    ascending order, or their ids with ``ids=True``. An item is returned once
+    even if several of its times match. Bounds are TDML date strings,
+    datetimes, dates, numpy datetime64 values or seconds since the epoch.
+    """
+
+    def __init__(self, times, positions, ids=None, source="data"):
+        if source not in SOURCES:
+            raise ValueError(
+                "Unknown source: {}, expected one of {}".format(
+                    source, ", ".join(SOURCES)
+                )
+            )
+        times = np.asarray(times, dtype=np.int64)
+        positions = np.asarray(positions, dtype=np.int64)
+        order = np.lexsort((positions, times))
+        self.times = times[order]
+        self.positions = positions[order]
+        self.ids = ids
+        self.source = source
+
+    @classmethod
+    def from_items(cls, items, source="data"):
+        """
+        Builds the index over data items (objects or JSON dicts)
+        """
+        positions = []
+        strings = []
+        ids = []
+        for position, item_id, times in _item_times(items, source):
+            ids.append(item_id)
+            positions.extend([position] * len(times))
+            strings.extend(times)
+        seconds = _parse_times(strings) if strings else []
+        valid = [i for i, value in enumerate(seconds) if value is not None]
+        return cls(
+            [seconds[i] for i in valid],
+            [positions[i] for i in valid],
+            ids=ids,
+            source=source,
+        )
+
+    @classmethod
+    def from_dataset(cls, td, source="data"):
+        """
+        Builds the index over the data items of a training dataset
+        """
+        data = td.data or []
+        if hasattr(data, "_items"):
+            # Items of a lazy dataset are indexed without validating them
+            data = data._items
+        return cls.from_items(data, source)
+
+    def __len__(self):
+        return len(self.times)
+
+    @property
+    def start(self):
+        """
+        Earliest time as numpy datetime64, None if the index is empty
+        """
+        return self.times[0].astype("datetime64[s]") if len(self.times) else None
+
+    @property
+    def end(self):
+        """
+        Latest time as numpy datetime64, None if the index is empty
+        """
+        return self.times[-1].astype("datetime64[s]") if len(self.times) else None
+
+    def _result(self, entries, ids):
+        positions = np.unique(self.positions[entries])
+        if ids:
+            return [self.ids[position] for position in positions]
+        return positions
+
+    def _span(self, start, end):
+        first = 0 if start is None else np.searchsorted(self.times, to_seconds(start))
+        last = (
+            len(self.times)
+            if end is None
+            else np.searchsorted(self.times, to_seconds(end), side="left")
+        )
+        return first, max(first, last)
+
+    def range(self, start=None, end=None, ids=False):
+        """
+        Returns the data items with a time in [start, end). A bound that is
+        None is open.
+        """
+        first, last = self._span(start, end)
+        return self._result(slice(first, last), ids)
+
+    def before(self, time, ids=False):
+        """
+        Returns the data items with a time before ``time``
+        """
+        return self.range(None, time, ids)
+
+    def after(self, time, ids=False):
+        """
+        Returns the data items with a time at or after ``time``
+        """
+        return self.range(time, None, ids)
+
+    def season(self, start, end, years=None, ids=False):
+        """
+        Returns the data items with a time in a window of the year that
+        repeats every year, from ``start`` to ``end`` inclusive, both given
+        as "MM-DD". A window whose end is before its start spans new year
+        (e.g. "12-01" to "02-28"). ``years`` restricts the years in which
+        the windows start.
+        """
+        if not len(self.times):
+            return self._result(slice(0, 0), ids)
+        start_month, start_day = _month_day(start)
+        end_month, end_day = _month_day(end)
+        wraps = (end_month, end_day) < (start_month, start_day)
+        if years is None:
+            first_year = int(self.start.astype("datetime64[Y]").astype(int)) + 1970
+            last_year = int(self.end.astype("datetime64[Y]").astype(int)) + 1970
+            # A window spanning new year may start in the year before the data
+            years = range(first_year - 1 if wraps else first_year, last_year + 1)
+        entries = []
+        for year in years:
+            window_start = _day_in_year(year, start_month, start_day)
+            window_end = (
+                _day_in_year(year + 1 if wraps else year, end_month, end_day)
+                + _SECONDS_PER_DAY
+            )
+            first, last = self._span(window_start, window_end)
+            entries.append(np.arange(first, last))
+        return self._result(np.concatenate(entries), ids)
+
+    def batches(self, batch_size, start=None, end=None):
+        """
+        Yields the positions of the data items in time order, by their
+        earliest time in [start, end), in arrays of ``batch_size`` (the last
+        one may be shorter)
+        """
+        first, last = self._span(start, end)
+        positions = self.positions[first:last]
+        # Keep the first, i.e. earliest, time of every item
+        _, earliest = np.unique(positions, return_index=True)
+        ordered = positions[np.sort(earliest)]
+        for batch_start in range(0, len(ordered), batch_size):
+            yield ordered[batch_start : batch_start + batch_size]
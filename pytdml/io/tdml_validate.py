@@ -0,0 +1,467 @@
+"""
+Parallel validation of TDML JSON files that do not fit in memory.
+
+The data items are validated in chunks by a process pool, where every item is
+decoded and validated on its own: a plain file is split into byte ranges that
+the workers scan themselves, a compressed one is streamed with the top-level
+scanner and the raw bytes of its items sent to them. Only a bounded number of
+chunks is in flight, so memory use does not grow with the file. Every problem
+is reported as a ``ValidationIssue`` with a JSON pointer (RFC 6901) into the
+document, e.g. ``/data/12/labels/3/class``.
+
+Besides the schema of every item, the invariants that span items are checked:
+data item ids are unique, classes referenced by labels are listed in
+``classes``, and ``numberOfLabels`` matches the number of labels. The dataset
+header is validated at the end, as its members may follow ``data``.
+"""
+
+import heapq
+import json
+import os
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from pydantic import ValidationError
+
+from pytdml.io._json_stream import END, ITEM, MEMBER, iter_elements, iter_members
+from pytdml.io.compression import compression_of, open_tdml_file
+from pytdml.io.tdml_readers import _TRAINING_DATA_TYPES, parse_training_data
+from pytdml.type import EOTrainingDataset, TrainingDataset
+
+DEFAULT_CHUNK_SIZE = 1000
+
+_BLOCK_SIZE = 1 << 16
+_LOOKBACK = 1 << 12
+_WHITESPACE = b" \t\r\n"
+
+ValidationIssue = namedtuple("ValidationIssue", ["pointer", "message", "item_id"])
+ValidationIssue.__doc__ = """
+A validation problem: JSON pointer of the offending value, description, and
+id of the data item it belongs to (None for the dataset header)
+"""
+
+_DATASET_TYPES = {
+    "AI_TrainingDataset": TrainingDataset,
+    "AI_EOTrainingDataset": EOTrainingDataset,
+}
+
+
+def _escape(token):
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def _pointer(prefix, value, loc):
+    """
+    Returns the JSON pointer of a pydantic error location in ``value``.
+    Location parts that are not in the document, such as the tags of
+    discriminated unions, are skipped; a missing member is kept as the last
+    part.
+    """
+    tokens = []
+    for position, part in enumerate(loc):
+        if isinstance(value, dict):
+            if part in value:
+                value = value[part]
+            elif position < len(loc) - 1:
+                continue
+        elif isinstance(value, list) and isinstance(part, int):
+            value = value[part] if 0 <= part < len(value) else None
+        else:
+            continue
+        tokens.append(_escape(part))
+    return "".join("/" + token for token in [prefix] + tokens if token != "")
+
+
+def _validation_issues(error, prefix, value, item_id):
+    return [
+        ValidationIssue(_pointer(prefix, value, detail["loc"]), detail["msg"], item_id)
+        for detail in error.errors()
+    ]
+
+
+def _validate_item(index, json_item, issues, class_refs):
+    prefix = "data/{}".format(index)
+    item_id = json_item.get("id") if isinstance(json_item, dict) else None
+    if not isinstance(json_item, dict):
+        issues.append(ValidationIssue("/" + prefix, "Expected an object", None))
+        return item_id
+    try:
+        parse_training_data(json_item, validate=True)
+    except ValidationError as error:
+        issues.extend(_validation_issues(error, prefix, json_item, item_id))
+    except ValueError as error:
+        issues.append(ValidationIssue("/" + prefix + "/type", str(error), item_id))
+
+    labels = json_item.get("labels")
+    if not isinstance(labels, list):
+        return item_id
+    number_of_labels = json_item.get("numberOfLabels")
+    if number_of_labels is not None and number_of_labels != len(labels):
+        issues.append(
+            ValidationIssue(
+                "/{}/numberOfLabels".format(prefix),
+                "numberOfLabels is {} but the item has {} labels".format(
+                    number_of_labels, len(labels)
+                ),
+                item_id,
+            )
+        )
+    for label_index, label in enumerate(labels):
+        label_class = label.get("class") if isinstance(label, dict) else None
+        if isinstance(label_class, str):
+            ref = class_refs.get(label_class)
+            if ref is None:
+                pointer = "/{}/labels/{}/class".format(prefix, label_index)
+                class_refs[label_class] = [1, pointer, item_id]
+            else:
+                ref[0] += 1
+    return item_id
+
+
+def _validate_chunk(start, raws):
+    """
+    Validates the raw data items ``raws`` starting at position ``start``.
+    Returns the issues, the id of every item and, per referenced class, the
+    number of labels and the pointer and item id of the first one.
+    """
+    issues = []
+    ids = []
+    class_refs = {}
+    for index, raw in enumerate(raws, start=start):
+        ids.append(_validate_item(index, json.loads(raw), issues, class_refs))
+    return issues, ids, class_refs
+
+
+def _header_issues(header):
+    dataset_type = _DATASET_TYPES.get(header.get("type"))
+    if dataset_type is None:
+        return [
+            ValidationIssue(
+                "/type", "Unknown TDML type: {}".format(header.get("type")), None
+            )
+        ]
+    # The items were validated separately, only the header is checked here
+    json_dict = dict(header, data=[])
+    try:
+        dataset_type(**json_dict)
+    except ValidationError as error:
+        return [
+            issue
+            for issue in _validation_issues(error, "", json_dict, None)
+            if not issue.pointer.startswith("/data")
+        ]
+    return []
+
+
+def _class_keys(classes):
+    keys = set()
+    for named_value in classes or ():
+        if isinstance(named_value, dict):
+            keys.add(named_value.get("key"))
+    return keys
+
+
+class _Chunks:
+    """
+    Splits the data items of a compressed file into chunks of raw bytes and
+    collects the header on the way. The stream cannot be seeked, so the items
+    are decoded here by the scanner as well.
+    """
+
+    def __init__(self, file_path, chunk_size):
+        self.file_path = file_path
+        self.chunk_size = chunk_size
+        self.header = {}
+        self.has_data = False
+
+    def __iter__(self):
+        start = 0
+        raws = []
+        with open_tdml_file(self.file_path) as f:
+            for kind, key, value, raw, _, _ in iter_members(f):
+                if kind == MEMBER:
+                    self.header[key] = value
+                    continue
+                self.has_data = True
+                raws.append(bytes(raw))
+                if len(raws) == self.chunk_size:
+                    yield start, raws
+                    start += len(raws)
+                    raws = []
+        if raws:
+            yield start, raws
+
+    def results(self, workers):
+        """
+        Yields the results of ``_validate_chunk`` in order, with at most twice
+        ``workers`` chunks in flight
+        """
+        if workers <= 1:
+            for start, raws in self:
+                yield _validate_chunk(start, raws)
+            return
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            for start, raws in self:
+                pending.append(executor.submit(_validate_chunk, start, raws))
+                if len(pending) >= 2 * workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+
+def _is_item_start(data, i, f, offset):
+    """
+    Tells whether the ``{`` at ``data[i]``, at byte ``offset`` of ``f``, may
+    start a data item: it follows a comma and decodes to a training data
+    object
+    """
+    j = i - 1
+    while j >= 0 and data[j] in _WHITESPACE:
+        j -= 1
+    if j < 0 or data[j] != ord(","):
+        return False
+    try:
+        kind, value, _, _, _ = next(iter_elements(f, offset))
+    except ValueError:
+        return False
+    return isinstance(value, dict) and value.get("type") in _TRAINING_DATA_TYPES
+
+
+def _find_item_start(f, offset, stop):
+    """
+    Returns the byte offset of the first data item that seems to start in
+    ``[offset, stop)``, None if there is none
+    """
+    pos = offset
+    while pos < stop:
+        base = max(pos - _LOOKBACK, 0)
+        f.seek(base)
+        data = f.read(pos - base + _BLOCK_SIZE)
+        if len(data) <= pos - base:
+            return None
+        i = data.find(b"{", pos - base)
+        while i != -1:
+            if base + i >= stop:
+                return None
+            if _is_item_start(data, i, f, base + i):
+                return base + i
+            i = data.find(b"{", i + 1)
+        pos = base + len(data)
+    return None
+
+
+def _validate_region(file_path, begin, stop, verified):
+    """
+    Decodes and validates the data items of a plain file that start in
+    ``[begin, stop)``. ``begin`` is the start of an item if ``verified``,
+    otherwise the item start is searched from there and may be wrong, which
+    the caller detects by chaining the regions.
+
+    Returns the start of the first item (None if none was found), the
+    results of ``_validate_chunk`` with indexes from 0, the start of the next
+    item and the end of the data array (one of them is None).
+    """
+    issues = []
+    ids = []
+    class_refs = {}
+    with open(file_path, "rb") as f:
+        if not verified:
+            begin = _find_item_start(f, begin, stop)
+            if begin is None:
+                return None, None, None, None
+        next_pos = array_end = None
+        try:
+            for kind, value, _, start, end in iter_elements(f, begin, stop):
+                if kind == ITEM:
+                    ids.append(_validate_item(len(ids), value, issues, class_refs))
+                elif kind == END:
+                    array_end = end
+                else:
+                    next_pos = start
+        except ValueError:
+            if verified:
+                raise
+            return None, None, None, None
+    return begin, (issues, ids, class_refs), next_pos, array_end
+
+
+def _shift_pointer(pointer, offset):
+    _, data, index, rest = (pointer + "/").split("/", 3)
+    return "/{}/{}/{}".format(data, int(index) + offset, rest).rstrip("/")
+
+
+def _shift_results(results, offset):
+    """Moves the pointers of regional ``_validate_chunk`` results by ``offset``"""
+    issues, ids, class_refs = results
+    if offset:
+        issues = [
+            issue._replace(pointer=_shift_pointer(issue.pointer, offset))
+            for issue in issues
+        ]
+        class_refs = {
+            label_class: [count, _shift_pointer(pointer, offset), item_id]
+            for label_class, (count, pointer, item_id) in class_refs.items()
+        }
+    return issues, ids, class_refs
+
+
+def _header_tail(file_path, offset):
+    """Decodes the top-level members that follow the data array"""
+    with open(file_path, "rb") as f:
+        f.seek(offset)
+        tail = f.read().strip()
+    if tail == b"}":
+        return {}
+    if not tail.startswith(b","):
+        raise ValueError("Expected ',' or '}}' at byte {}".format(offset))
+    members = json.loads(b"{" + tail[1:])
+    if not isinstance(members, dict):
+        raise ValueError("Expected an object after byte {}".format(offset))
+    return members
+
+
+class _Regions:
+    """
+    Splits the data array of a plain file into byte regions of about
+    ``chunk_size`` items, sized by the first item. The header members before
+    the array are decoded here, the items only by ``_validate_region``: a
+    worker searches the first item of its region, and as the regions are
+    chained in order, a region whose first item was not found right is
+    validated again from the end of the previous one.
+    """
+
+    def __init__(self, file_path, chunk_size):
+        self.file_path = file_path
+        self.chunk_size = chunk_size
+        self.header = {}
+        self.has_data = False
+
+    def _regions(self, first):
+        with open(self.file_path, "rb") as f:
+            _, _, _, _, end = next(iter_elements(f, first, stop=None))
+            size = os.fstat(f.fileno()).st_size
+        region_size = max((end - first) * self.chunk_size, 1)
+        return [
+            (begin, min(begin + region_size, size))
+            for begin in range(first, size, region_size)
+        ]
+
+    def results(self, workers):
+        """
+        Yields the results of ``_validate_chunk`` in document order, with at
+        most twice ``workers`` regions in flight
+        """
+        first = None
+        with open(self.file_path, "rb") as f:
+            for kind, key, value, _, start, _ in iter_members(f, items=False):
+                if kind == MEMBER:
+                    self.header[key] = value
+                else:
+                    first = start
+        if first is None:
+            return
+        regions = self._regions(first)
+        pos, offset, array_end = first, 0, None
+        for (begin, stop), future in self._submitted(regions, workers):
+            if array_end is not None or pos >= stop:
+                if future is not None:
+                    future.cancel()
+                continue
+            found = future.result() if future is not None else None
+            if found is None or found[0] != pos:
+                found = _validate_region(self.file_path, pos, stop, True)
+            _, results, next_pos, array_end = found
+            issues, ids, class_refs = _shift_results(results, offset)
+            yield issues, ids, class_refs
+            offset += len(ids)
+            pos = next_pos
+        self.has_data = offset > 0
+        self.header.update(_header_tail(self.file_path, array_end))
+
+    def _submitted(self, regions, workers):
+        """
+        Yields every region with the future of its ``_validate_region`` call,
+        or None to validate it in this process
+        """
+        if workers <= 1:
+            for region in regions:
+                yield region, None
+            return
+        first = regions[0][0]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            for begin, stop in regions:
+                future = executor.submit(
+                    _validate_region, self.file_path, begin, stop, begin == first
+                )
+                pending.append(((begin, stop), future))
+                if len(pending) >= 2 * workers:
+                    yield pending.popleft()
+            while pending:
+                yield pending.popleft()
+
+
+def _item_index(issue):
+    return int(issue.pointer.split("/", 3)[2])
+
+
+def validate_file(file_path, workers=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Validates a TDML JSON file and yields a ValidationIssue for every problem:
+    the issues of the data items in document order, a duplicate id after the
+    other issues of its item, then the issues of the header and the unknown
+    classes.
+
+    The data items are validated in chunks of about ``chunk_size`` by
+    ``workers`` processes (default: the number of CPUs, 1 validates in this
+    process). For a plain file, the workers get byte ranges and decode the
+    items themselves; a compressed file is scanned here and the raw items
+    sent to them. A valid file yields nothing.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if compression_of(file_path) is None:
+        chunks = _Regions(file_path, chunk_size)
+    else:
+        chunks = _Chunks(file_path, chunk_size)
+    seen_ids = set()
+    class_refs = {}
+    index = 0
+    for issues, ids, chunk_class_refs in chunks.results(workers):
+        duplicates = []
+        for item_id in ids:
+            if item_id in seen_ids:
+                duplicates.append(
+                    ValidationIssue(
+                        "/data/{}/id".format(index),
+                        "Duplicate data item id {!r}".format(item_id),
+                        item_id,
+                    )
+                )
+            elif item_id is not None:
+                seen_ids.add(item_id)
+            index += 1
+        yield from heapq.merge(issues, duplicates, key=_item_index)
+        for label_class, (count, pointer, item_id) in chunk_class_refs.items():
+            ref = class_refs.get(label_class)
+            if ref is None:
+                class_refs[label_class] = [count, pointer, item_id]
+            else:
+                ref[0] += count
+
+    header = chunks.header
+    if not chunks.has_data:
+        yield ValidationIssue("/data", "The dataset has no data items", None)
+    yield from _header_issues(header)
+    if "classes" in header:
+        known = _class_keys(header["classes"])
+        for label_class, (count, pointer, item_id) in class_refs.items():
+            if label_class not in known:
+                yield ValidationIssue(
+                    pointer,
+                    "Class {!r} of {} labels is not in classes".format(
+                        label_class, count
+                    ),
+                    item_id,
+                )
@@ -29,10 +29,20 @@
 # SOFTWARE.
 #
 # ------------------------------------------------------------------------------
-import json
 from typing import Union, Any
 
+import os
+
+from pytdml.io.compression import open_tdml_file
+from pytdml.io.json_backend import get_json_backend
+from pytdml.io.tdml_readers import parse_training_data
 from pytdml.type import TrainingDataset, EOTrainingDataset
+from pytdml.type.basic_types import NamedValue
+
+_DATASET_TYPES = {
+    "AI_AbstractTrainingDataset": TrainingDataset,
+    "AI_EOTrainingDataset": EOTrainingDataset,
+}
 
 
 def _is_empty(obj):
@@ -59,16 +69,239 @@ def remove_empty_values(d):
         return d
 
 
+# Stands in for the data array while the dataset header is encoded
+_DATA_MARKER = "\x00pytdml-data\x00"
+
+
+def _array_layout(backend, indent):
+    """
+    Returns the bytes that open an array member of the top-level object,
+    separate its elements and close it, plus the padding of nested lines, as
+    written by ``backend`` with ``indent``.
+    """
+    probe = backend.dumps({"k": [0, 0]}, indent=indent)
+    start = probe.index(b"[")
+    first = probe.index(b"0", start)
+    second = probe.index(b"0", first + 1)
+    end = probe.index(b"]", second) + 1
+    opening = probe[start:first]
+    pad = opening[opening.rindex(b"\n") + 1 :] if b"\n" in opening else b""
+    return opening, probe[first + 1 : second], probe[second + 1 : end], pad
+
+
+def _encode_header(backend, td, indent):
+    """
+    Encodes the dataset without its data items. Returns the bytes before and
+    after the value of the data member.
+    """
+    header = td.model_copy(update={"data": []}).model_dump(
+        by_alias=True, exclude_none=True
+    )
+    header = {
+        k: v if k == "data" else remove_empty_values(v) for k, v in header.items()
+    }
+    header = {k: v for k, v in header.items() if k == "data" or not _is_empty(v)}
+    header["data"] = _DATA_MARKER
+    prefix, suffix = backend.dumps(header, indent=indent).split(
+        backend.dumps(_DATA_MARKER)
+    )
+    return prefix, suffix
+
+
+def _data_item_dict(td, item):
+    """
+    Serializes one data item of ``td`` exactly as ``td.to_dict()`` would
+    """
+    json_item = td.model_copy(update={"data": [item]}).model_dump(
+        include={"data"}, by_alias=True, exclude_none=True
+    )["data"][0]
+    if not isinstance(json_item, dict):
+        # data is not a typed list (e.g. LazyEOTrainingDataset)
+        json_item = item.to_dict()
+    return json_item
+
+
+def dump_json(
+    td: TrainingDataset or EOTrainingDataset,
+    fp,
+    indent: Union[int, str] = 4,
+    backend=None,
+):
+    """
+    Writes a TrainingDataset as JSON to the binary file object ``fp``.
+
+    The output is the same as encoding ``remove_empty_values(td.to_dict())``,
+    but the data items are serialized, cleaned and written one at a time, so
+    the extra memory is bounded by the largest data item.
+    """
+    backend = get_json_backend(backend, default="stdlib")
+    prefix, suffix = _encode_header(backend, td, indent)
+    opening, separator, closing, pad = _array_layout(backend, indent)
+
+    written = False
+    for item in td.data:
+        json_item = remove_empty_values(_data_item_dict(td, item))
+        if _is_empty(json_item):
+            continue
+        chunk = backend.dumps(json_item, indent=indent)
+        if pad:
+            chunk = chunk.replace(b"\n", b"\n" + pad)
+        if written:
+            fp.write(separator)
+        else:
+            fp.write(prefix)
+            fp.write(opening)
+            written = True
+        fp.write(chunk)
+
+    if written:
+        fp.write(closing)
+        fp.write(suffix)
+    else:
+        # Every data item was empty, so the data member is dropped
+        fp.write(
+            backend.dumps(
+                remove_empty_values(td.model_copy(update={"data": []}).to_dict()),
+                indent=indent,
+            )
+        )
+
+
 def write_to_json(
     td: TrainingDataset or EOTrainingDataset,
     file_path: str,
     indent: Union[int, str] = 4,
+    backend=None,
 ):
     """
     Writes a TrainingDataset to a JSON file.
+
+    ``backend`` selects the JSON backend (see ``get_json_backend``), the
+    standard library by default. The file is written incrementally, one data item at a time (see ``dump_json``).
+    """
+    with open_tdml_file(file_path, "wb") as f:
+        dump_json(td, f, indent=indent, backend=backend)
+
+
+class TDMLStreamWriter:
+    """
+    Writes a TDML JSON encoding one data item at a time
+
+    The dataset header is validated and written when the first item is added,
+    every ``add(item)`` call appends one serialized data item, and the totals
+    are written when the writer is closed:
+
+    * ``amountOfTrainingData`` is the number of added items,
+    * ``classes`` counts the labels of every class, unless the header sets it,
+    * ``numberOfClasses`` is the number of classes, unless the header sets it,
+    * ``numberOfLabels`` of an item is the number of its labels, unless set.
+
+    The totals come after ``data`` in the encoding, so the file is written
+    strictly sequentially and memory use is bounded by one data item::
+
+        with TDMLStreamWriter("dataset.json", header) as writer:
+            for item in items:
+                writer.add(item)
+
+    ``header`` is a dict of dataset fields (by field name or JSON key) or a
+    TrainingDataset whose data is ignored. ``file`` is a path or a binary
+    file object. If the ``with`` block raises, the file is closed without the
+    closing part and is left incomplete.
     """
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(
-            remove_empty_values(td.to_dict()), f, indent=indent, ensure_ascii=False
+
+    def __init__(self, file, header, indent: Union[int, str] = 4, backend=None):
+        if isinstance(header, TrainingDataset):
+            header = header.model_dump(exclude={"data"}, exclude_none=True)
+        self._header = {k: v for k, v in header.items() if k != "data"}
+        dataset_type = self._header.get("type")
+        if dataset_type not in _DATASET_TYPES:
+            raise ValueError("Unknown TDML type: {}".format(dataset_type))
+        self._dataset_type = _DATASET_TYPES[dataset_type]
+        self._backend = get_json_backend(backend, default="stdlib")
+        self._indent = indent
+        self._layout = _array_layout(self._backend, indent)
+        if isinstance(file, (str, os.PathLike)):
+            self._fp = open_tdml_file(file, "wb")
+            self._owns_fp = True
+        else:
+            self._fp = file
+            self._owns_fp = False
+        self._template = None
+        self._class_counts = {}
+        self._closed = False
+        self.count = 0
+
+    def add(self, item):
+        """
+        Appends a training data object (or its JSON dict) to the encoding
+        """
+        if self._closed:
+            raise ValueError("TDMLStreamWriter is closed")
+        if isinstance(item, dict):
+            item = parse_training_data(item)
+        labels = item.labels or []
+        if item.number_of_labels is None and labels:
+            item = item.model_copy(update={"number_of_labels": len(labels)})
+        for label in labels:
+            label_class = getattr(label, "label_class", None)
+            if label_class is not None:
+                self._class_counts[label_class] = (
+                    self._class_counts.get(label_class, 0) + 1
+                )
+
+        opening, separator, _, pad = self._layout
+        if self._template is None:
+            # Validates the header, the data item stands in for the whole list
+            self._template = self._dataset_type(**self._header, data=[item])
+            prefix, _ = _encode_header(self._backend, self._template, self._indent)
+            self._fp.write(prefix)
+            self._fp.write(opening)
+        else:
+            self._fp.write(separator)
+        chunk = self._backend.dumps(
+            remove_empty_values(_data_item_dict(self._template, item)),
+            indent=self._indent,
         )
-        # json.dump(remove_empty(td.dict()), f, indent=indent, ensure_ascii=False)
+        if pad:
+            chunk = chunk.replace(b"\n", b"\n" + pad)
+        self._fp.write(chunk)
+        self.count += 1
+
+    def close(self):
+        """
+        Writes the totals and the end of the encoding and closes the file
+        """
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            if self._template is None:
+                raise ValueError("No training data was added to the TDML encoding")
+            totals = {"amount_of_training_data": self.count}
+            classes = self._template.classes
+            if classes is None and self._class_counts:
+                classes = [
+                    NamedValue(key=key, value=value)
+                    for key, value in self._class_counts.items()
+                ]
+                totals["classes"] = classes
+            if self._template.number_of_classes is None and classes:
+                totals["number_of_classes"] = len(classes)
+            td = self._template.model_copy(update=totals)
+            _, suffix = _encode_header(self._backend, td, self._indent)
+            self._fp.write(self._layout[2])
+            self._fp.write(suffix)
+        finally:
+            if self._owns_fp:
+                self._fp.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self._closed = True
+            if self._owns_fp:
+                self._fp.close()
@@ -1,6 +1,7 @@
 import json
 
 from pytdml.io import write_to_json, read_from_json
+from pytdml.io.compression import open_tdml_file
 from pytdml.type import extended_types_old, extended_types, basic_types
 
 _IMAGE_FORMATS = {
@@ -115,7 +116,7 @@ def validate_image_format(image_format):
 
 
 def version_converter(old_v_path):
-    with open(old_v_path, "r", encoding="utf-8") as f:
+    with open_tdml_file(old_v_path) as f:
         json_dict = json.load(f)
     old_v_ds = extended_types_old.EOTrainingDataset.from_dict(json_dict).to_dict()
 
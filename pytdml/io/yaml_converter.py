@@ -41,7 +41,7 @@ def yaml_to_eo_tdml(yaml_path):
     """
     yaml_file = open(yaml_path, "r", encoding="utf-8")
     yaml_dict = yaml.load(yaml_file, Loader=yaml.FullLoader)
-    eo_training_dataset = EOTrainingDataset.from_dict(yaml_dict)
+    eo_training_dataset = EOTrainingDataset.from_dict(yaml_dict, take_ownership=True)
     return eo_training_dataset
 
 
@@ -51,7 +51,7 @@ def yaml_to_tdml(yaml_path):
     """
     yaml_file = open(yaml_path, "r", encoding="utf-8")
     yaml_dict = yaml.load(yaml_file, Loader=yaml.FullLoader)
-    eo_training_dataset = TrainingDataset.from_dict(yaml_dict)
+    eo_training_dataset = TrainingDataset.from_dict(yaml_dict, take_ownership=True)
     return eo_training_dataset
 
 
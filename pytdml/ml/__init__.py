@@ -28,15 +28,41 @@
 # SOFTWARE.
 #
 # ------------------------------------------------------------------------------
-from pytdml.ml.ml_operators import split_train_valid_test, create_class_map
-from pytdml.ml.tdml_torch import (
-    BaseTransform,
-    TorchEOImageSceneTD,
-    TorchEOImageObjectTD,
-    TorchEOImageSegmentationTD,
-)
-from pytdml.ml.tdml_tensorflow import (
-    TensorflowEOImageSceneTD,
-    TensorflowEOImageObjectTD,
-    TensorflowEOImageSegmentationTD,
-)
+"""
+Machine learning integrations of pytdml.
+
+The framework integrations are only imported on first access, so that
+``import pytdml`` does not load torch, tensorflow or their image libraries.
+"""
+
+import importlib
+
+_LAZY_ATTRIBUTES = {
+    "split_train_valid_test": "pytdml.ml.ml_operators",
+    "create_class_map": "pytdml.ml.ml_operators",
+    "BaseTransform": "pytdml.ml.tdml_torch",
+    "TorchEOImageSceneTD": "pytdml.ml.tdml_torch",
+    "TorchEOImageObjectTD": "pytdml.ml.tdml_torch",
+    "TorchEOImageSegmentationTD": "pytdml.ml.tdml_torch",
+    "TensorflowEOImageSceneTD": "pytdml.ml.tdml_tensorflow",
+    "TensorflowEOImageObjectTD": "pytdml.ml.tdml_tensorflow",
+    "TensorflowEOImageSegmentationTD": "pytdml.ml.tdml_tensorflow",
+    "TrainingDataFrame": "pytdml.ml.tdml_frame",
+    "BoundingBoxStore": "pytdml.ml.bbox_store",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache the attribute so that the module is only looked up once
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -0,0 +1,127 @@
+"""
+Packed NumPy arrays of the bounding boxes of object detection datasets.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+# Class value of the labels whose class is missing from the class map
+UNKNOWN_CLASS = -2
+
+ImageBoxes = namedtuple(
+    "ImageBoxes", ["boxes", "class_ids", "bbox_types", "is_negative"]
+)
+ImageBoxes.__doc__ = """
+Bounding boxes of the object labels of one image, as array slices of a
+BoundingBoxStore
+"""
+
+
+def _label_box(label):
+    """
+    Returns the box of an object label the same way as utils.get_bounding_box:
+    the first corner and the x of the third and the y of the fourth corner of
+    the exterior ring
+    """
+    ring = label.object["geometry"]["coordinates"][0]
+    return ring[0][0], ring[0][1], ring[2][0], ring[3][1]
+
+
+class BoundingBoxStore:
+    """
+    Packed bounding boxes of the object labels of a list of training data
+
+    The boxes of all images are stored in one contiguous float32 array of
+    shape (n, 4) together with the class value (from the class map) of every
+    box, and ``offsets[i]:offsets[i + 1]`` are the boxes of image ``i``.
+    Looking up the boxes of an image is then a slice instead of a loop over
+    its labels and their geojson geometries.
+    """
+
+    def __init__(self, boxes, class_ids, offsets, bbox_types, is_negative):
+        self.boxes = boxes
+        self.class_ids = class_ids
+        self.offsets = offsets
+        self.bbox_types = bbox_types
+        self.is_negative = is_negative
+
+    @classmethod
+    def from_items(cls, td_list, class_map):
+        """
+        Builds the store from training data with object labels. Labels with
+        an empty class get the class value -1 and labels whose class is
+        missing from ``class_map`` get UNKNOWN_CLASS.
+        """
+        boxes = []
+        class_ids = []
+        bbox_types = []
+        is_negative = []
+        offsets = np.empty(len(td_list) + 1, dtype=np.int64)
+        offsets[0] = 0
+        for i, item in enumerate(td_list):
+            for label in item.labels:
+                boxes.append(_label_box(label))
+                if label.label_class in class_map:
+                    class_ids.append(class_map[label.label_class])
+                elif label.label_class == "":
+                    class_ids.append(-1)
+                else:
+                    class_ids.append(UNKNOWN_CLASS)
+                bbox_types.append(label.bbox_type)
+                is_negative.append(label.is_negative)
+            offsets[i + 1] = len(boxes)
+        bbox_types_array = np.empty(len(bbox_types), dtype=object)
+        bbox_types_array[:] = bbox_types
+        return cls(
+            np.array(boxes, dtype=np.float32).reshape(-1, 4),
+            np.array(class_ids, dtype=np.int64),
+            offsets,
+            bbox_types_array,
+            np.array(is_negative, dtype=bool),
+        )
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("bounding box store index out of range")
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return ImageBoxes(
+            self.boxes[start:end],
+            self.class_ids[start:end],
+            self.bbox_types[start:end],
+            self.is_negative[start:end],
+        )
+
+    def normalized_boxes(self, index, img_width, img_height):
+        """
+        Returns the boxes of image ``index`` divided by the image size
+        """
+        scale = np.array(
+            [img_width, img_height, img_width, img_height], dtype=np.float32
+        )
+        return self[index].boxes / scale
+
+    def targets(self, index, img_width, img_height):
+        """
+        Returns the normalized boxes of image ``index`` with their class value
+        appended as an (n, 5) array. Raises KeyError if the class of one of
+        its labels is missing from the class map.
+        """
+        class_ids = self[index].class_ids
+        if (class_ids == UNKNOWN_CLASS).any():
+            raise KeyError(
+                "A label of image {} has a class missing from the class map".format(
+                    index
+                )
+            )
+        return np.hstack(
+            (
+                self.normalized_boxes(index, img_width, img_height),
+                class_ids[:, None].astype(np.float32),
+            )
+        )
@@ -29,7 +29,6 @@
 #
 # ------------------------------------------------------------------------------
 import random
-import torch
 import pytdml
 from pytdml.type import TrainingDataset, EOTrainingDataset, MD_Band
 from pytdml.type.basic_types import NamedValue
@@ -91,5 +90,7 @@ def create_classes_map_(classes):
 
 
 def collate_fn(batch):
+    import torch
+
     img, targets = list(zip(*batch))
     return torch.stack(img, 0), list(targets)
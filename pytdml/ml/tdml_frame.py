@@ -0,0 +1,249 @@
+"""
+Columnar NumPy view of the data items of a training dataset.
+"""
+
+import numpy as np
+
+_COLUMNS = (
+    "ids",
+    "data_urls",
+    "label_urls",
+    "class_codes",
+    "training_type_codes",
+    "label_counts",
+)
+
+
+def _first(values):
+    return values[0] if values else None
+
+
+def _item_row(item):
+    """
+    Returns (id, data URL, label URL, class, training type, label count) of a
+    training data model or JSON dict
+    """
+    if isinstance(item, dict):
+        labels = item.get("labels") or []
+        label = labels[0] if labels else {}
+        label_url = label.get("imageURL")
+        number_of_labels = item.get("numberOfLabels")
+        return (
+            item.get("id"),
+            _first(item.get("dataURL")),
+            _first(label_url) if isinstance(label_url, list) else label_url,
+            label.get("class"),
+            item.get("trainingType"),
+            len(labels) if number_of_labels is None else number_of_labels,
+        )
+    labels = item.labels or []
+    label = labels[0] if labels else None
+    label_url = getattr(label, "image_url", None)
+    return (
+        item.id,
+        _first(getattr(item, "data_url", None)),
+        _first(label_url) if isinstance(label_url, list) else label_url,
+        getattr(label, "label_class", None),
+        item.training_type,
+        len(labels) if item.number_of_labels is None else item.number_of_labels,
+    )
+
+
+def _encode(values, names=None):
+    """
+    Dictionary-encodes values as int32 codes into a list of names; None is -1
+    """
+    names = list(names or [])
+    lookup = {name: code for code, name in enumerate(names)}
+    codes = np.empty(len(values), dtype=np.int32)
+    for i, value in enumerate(values):
+        if value is None:
+            codes[i] = -1
+            continue
+        code = lookup.get(value)
+        if code is None:
+            code = lookup[value] = len(names)
+            names.append(value)
+        codes[i] = code
+    return names, codes
+
+
+def _object_array(values):
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+    return array
+
+
+class TrainingDataFrame:
+    """
+    Columnar view of the data items of a training dataset
+
+    Every data item is one row with its id, first data URL, first label image
+    URL, class of the first label, training type and number of labels. Classes
+    and training types are stored as int32 codes into ``class_names`` and
+    ``training_type_names`` (-1 if missing), so filtering and label lookups
+    are vectorized NumPy operations and the pydantic models can be released
+    once the frame is built.
+    """
+
+    def __init__(
+        self,
+        ids,
+        data_urls,
+        label_urls,
+        class_codes,
+        training_type_codes,
+        label_counts,
+        class_names,
+        training_type_names,
+    ):
+        self.ids = ids
+        self.data_urls = data_urls
+        self.label_urls = label_urls
+        self.class_codes = class_codes
+        self.training_type_codes = training_type_codes
+        self.label_counts = label_counts
+        self.class_names = list(class_names)
+        self.training_type_names = list(training_type_names)
+
+    @classmethod
+    def from_items(cls, items, class_names=None):
+        """
+        Builds a frame from training data models or their JSON dicts.
+        ``class_names`` fixes the order of the class codes, classes that are
+        not listed get codes in order of appearance.
+        """
+        rows = [_item_row(item) for item in items]
+        ids, data_urls, label_urls, classes, training_types, counts = (
+            zip(*rows) if rows else ((),) * 6
+        )
+        class_names, class_codes = _encode(classes, class_names)
+        training_type_names, training_type_codes = _encode(training_types)
+        return cls(
+            _object_array(ids),
+            _object_array(data_urls),
+            _object_array(label_urls),
+            class_codes,
+            training_type_codes,
+            np.asarray(counts, dtype=np.int32),
+            class_names,
+            training_type_names,
+        )
+
+    @classmethod
+    def from_dataset(cls, td):
+        """
+        Builds a frame from the data of a training dataset. The class codes
+        follow the order of the dataset classes.
+        """
+        class_names = []
+        for _class in td.classes or []:
+            if isinstance(_class, dict):
+                # A NamedValue as a JSON dict, or a map of names to values
+                if "key" in _class:
+                    class_names.append(_class["key"])
+                else:
+                    class_names.extend(_class)
+            elif hasattr(_class, "key"):
+                class_names.append(_class.key)
+            else:
+                class_names.append(_class)
+        return cls.from_items(td.data, class_names)
+
+    def __len__(self):
+        return len(self.ids)
+
+    @property
+    def classes(self):
+        """
+        Class of the first label of every row, None if it has none
+        """
+        return self._decode(self.class_codes, self.class_names)
+
+    @property
+    def training_types(self):
+        return self._decode(self.training_type_codes, self.training_type_names)
+
+    @staticmethod
+    def _decode(codes, names):
+        lookup = _object_array(list(names) + [None])
+        return lookup[codes]
+
+    def encode_classes(self, class_map):
+        """
+        Maps the class of every row through ``class_map`` (class name to
+        label value, see ``create_class_map``) and returns the values as an
+        int64 array. Rows without a class map to -1. Only the classes used by
+        the rows have to be in ``class_map``, a missing one raises KeyError.
+        """
+        used = np.zeros(len(self.class_names) + 1, dtype=bool)
+        used[self.class_codes] = True
+        lookup = np.full(len(self.class_names) + 1, -1, dtype=np.int64)
+        for code in np.flatnonzero(used[:-1]):
+            name = self.class_names[code]
+            if name not in class_map:
+                raise KeyError(
+                    "Class {!r} of the frame is missing from the class map".format(name)
+                )
+            lookup[code] = class_map[name]
+        return lookup[self.class_codes]
+
+    def take(self, indices):
+        """
+        Returns a new frame with the rows at ``indices`` (integer array, slice
+        or boolean mask)
+        """
+        return TrainingDataFrame(
+            *(getattr(self, column)[indices] for column in _COLUMNS),
+            self.class_names,
+            self.training_type_names,
+        )
+
+    def filter(self, training_type=None, label_class=None):
+        """
+        Returns the rows with the given training type(s) and class(es)
+        """
+        mask = np.ones(len(self), dtype=bool)
+        if training_type is not None:
+            mask &= self._isin(
+                self.training_type_codes, self.training_type_names, training_type
+            )
+        if label_class is not None:
+            mask &= self._isin(self.class_codes, self.class_names, label_class)
+        return self.take(mask)
+
+    @staticmethod
+    def _isin(codes, names, values):
+        if isinstance(values, str):
+            values = [values]
+        wanted = [names.index(value) for value in values if value in names]
+        return np.isin(codes, wanted)
+
+    def row(self, index):
+        """
+        Returns the row at ``index`` as a dict
+        """
+        class_code = self.class_codes[index]
+        training_type_code = self.training_type_codes[index]
+        return {
+            "id": self.ids[index],
+            "data_url": self.data_urls[index],
+            "label_url": self.label_urls[index],
+            "label_class": (self.class_names[class_code] if class_code >= 0 else None),
+            "training_type": (
+                self.training_type_names[training_type_code]
+                if training_type_code >= 0
+                else None
+            ),
+            "number_of_labels": int(self.label_counts[index]),
+        }
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return self.row(index)
+        return self.take(index)
+
+    def __repr__(self):
+        return "TrainingDataFrame({} rows, {} classes)".format(
+            len(self), len(self.class_names)
+        )
@@ -34,6 +34,7 @@ import tensorflow_io as tfio
 import numpy as np
 import pytdml.ml.utils as utils
 from datalibrary.downloader import *
+from pytdml.ml.tdml_frame import TrainingDataFrame
 
 
 def _parse_image(filename):
@@ -83,6 +84,8 @@ def _parse_function_segmentation(file_image, file_label_image, color_to_index):
 class TensorflowEOImageSceneTD:
     """
     TensorFlow Dataset for EO image scene classification training dataset
+
+    ``td_list`` is a list of training data or a TrainingDataFrame.
     """
 
     def __init__(self, td_list, class_map, resize=28):
@@ -96,11 +99,15 @@ class TensorflowEOImageSceneTD:
         """
         Create a tensorflow dataset
         """
-        img_list = []
-        label_list = []
-        for td in self.td_list:
-            img_list.append(td.data_url)
-            label_list.append(self.class_map[td.labels[0].label_class])
+        if isinstance(self.td_list, TrainingDataFrame):
+            img_list = self.td_list.data_urls.tolist()
+            label_list = self.td_list.encode_classes(self.class_map)
+        else:
+            img_list = []
+            label_list = []
+            for td in self.td_list:
+                img_list.append(td.data_url)
+                label_list.append(self.class_map[td.labels[0].label_class])
         tf_img_list = tf.constant(img_list)
         tf_label_list = tf.constant(label_list)
         dataset = tf.data.Dataset.from_tensor_slices((tf_img_list, tf_label_list))
@@ -144,6 +151,8 @@ class TensorflowEOImageObjectTD:
 class TensorflowEOImageSegmentationTD:
     """
     TensorFlow Dataset for EO image semantic segmentation training dataset
+
+    ``td_list`` is a list of training data or a TrainingDataFrame.
     """
 
     def __init__(self, td_list, class_map):
@@ -157,11 +166,15 @@ class TensorflowEOImageSegmentationTD:
         """
         Create a tensorflow dataset
         """
-        img_list = []
-        label_img_list = []
-        for td in self.td_list:
-            img_list.append(td.data_url)
-            label_img_list.append(td.labels[0].image_url)
+        if isinstance(self.td_list, TrainingDataFrame):
+            img_list = self.td_list.data_urls.tolist()
+            label_img_list = self.td_list.label_urls.tolist()
+        else:
+            img_list = []
+            label_img_list = []
+            for td in self.td_list:
+                img_list.append(td.data_url)
+                label_img_list.append(td.labels[0].image_url)
         tf_img_list = tf.constant(img_list)
         tf_label_img_list = tf.constant(label_img_list)
         tf_color_to_index = tf.constant(self.color_to_index)
@@ -197,10 +210,16 @@ class TensorSceneClassificationDataPipe:
         self.class_map = class_map
         self.root = root
 
-        self.td_list = tdml.data
+        # A TrainingDataFrame can be passed in place of the training dataset
+        self.td_list = tdml if isinstance(tdml, TrainingDataFrame) else tdml.data
         self.tf_imgs, self.tf_labels = self._load_data()
 
     def _load_data(self):
+        if isinstance(self.td_list, TrainingDataFrame):
+            return (
+                self.td_list.data_urls.tolist(),
+                self.td_list.encode_classes(self.class_map).tolist(),
+            )
         imgs = [item.data_url for item in self.td_list]
         labels = [self.class_map[item.labels[0].label_class] for item in self.td_list]
         return imgs, labels
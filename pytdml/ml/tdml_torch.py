@@ -40,26 +40,36 @@ from torch.utils.data import Dataset
 from torchvision.datasets.vision import VisionDataset
 
 from pytdml.config import BUCKET
+from pytdml.ml.bbox_store import BoundingBoxStore
+from pytdml.ml.tdml_frame import TrainingDataFrame
 
 
 class TorchEOImageSceneTD(Dataset):
     """
     Torch Dataset for EO image scene classification training dataset
+
+    ``td_list`` is a list of training data or a TrainingDataFrame.
     """
 
     def __init__(self, td_list, class_map, transform=None):
         self.td_list = td_list
         self.class_map = class_map
         self.transform = transform
+        if isinstance(td_list, TrainingDataFrame):
+            self._labels = td_list.encode_classes(class_map)
 
     def __len__(self):
         return len(self.td_list)
 
     def __getitem__(self, item):
-        img_path = self.td_list[item].data_url[0]
+        if isinstance(self.td_list, TrainingDataFrame):
+            img_path = self.td_list.data_urls[item]
+            label = int(self._labels[item])
+        else:
+            img_path = self.td_list[item].data_url[0]
+            label = self.class_map[self.td_list[item].labels[0].label_class]
         img = Image.open(img_path)
         img.load()
-        label = self.class_map[self.td_list[item].labels[0].label_class]
         if self.transform is not None:
             img = self.transform(img)
         return img, label
@@ -74,6 +84,15 @@ class TorchEOImageObjectTD(Dataset):
         self.td_list = td_list
         self.class_map = class_map
         self.transform = transform
+        self._boxes = None
+
+    @property
+    def boxes(self):
+        # Built on first access, so that the items of a lazy dataset are not
+        # all parsed when the dataset is created
+        if self._boxes is None:
+            self._boxes = BoundingBoxStore.from_items(self.td_list, self.class_map)
+        return self._boxes
 
     def __len__(self):
         return len(self.td_list)
@@ -82,19 +101,8 @@ class TorchEOImageObjectTD(Dataset):
         img_path = self.td_list[index].data_url[0]
         img = cv2.imread(img_path)
         img_height, img_width, channels = img.shape
-        targets = []
-        labels = self.td_list[index].labels
         # transform annotations
-        for label in labels:
-            class_value_ = self.class_map[label.label_class]
-            target_ = utils.get_bounding_box(label.object)
-            target_[0] = target_[0] / img_width
-            target_[1] = target_[1] / img_height
-            target_[2] = target_[2] / img_width
-            target_[3] = target_[3] / img_height
-            target_.append(class_value_)
-            targets.append(target_)
-        targets = np.array(targets)
+        targets = self.boxes.targets(index, img_width, img_height)
         img = img[:, :, (2, 1, 0)]
         if self.transform is not None:
             img, boxes, labels = self.transform(img, targets[:, :4], targets[:, 4])
@@ -117,12 +125,16 @@ class TorchEOImageSegmentationTD(Dataset):
         return len(self.td_list)
 
     def __getitem__(self, item):
-        img_path = self.td_list[item].data_url[0]
+        if isinstance(self.td_list, TrainingDataFrame):
+            img_path = self.td_list.data_urls[item]
+            label_path = self.td_list.label_urls[item]
+        else:
+            img_path = self.td_list[item].data_url[0]
+            label_path = self.td_list[item].labels[0].image_url
         img = Image.open(img_path)
         img.load()
         if self.transform is not None:
             img = self.transform(img)
-        label_path = self.td_list[item].labels[0].image_url
         label = cv2.imread(label_path, cv2.COLOR_BGR2RGB)
         index_label = utils.label_to_index(label, self.color_to_index)
         index_label = np.asarray(index_label, dtype=np.int64)
@@ -145,6 +157,8 @@ class TorchSceneClassificationTD(VisionDataset):
         self.class_map = class_map
 
     def _load_img_label(self):
+        if isinstance(self.td_list, TrainingDataFrame):
+            return self.td_list.data_urls, self.td_list.classes
         imgs = [item.data_url[0] for item in self.td_list]
         labels = [item.labels[0].label_class for item in self.td_list]
         return imgs, labels
@@ -161,7 +175,7 @@ class TorchSceneClassificationTD(VisionDataset):
         # single band check
         img = utils.channel_processing(img)
 
-        label = self.class_map[self.td_list[item].labels[0].label_class]
+        label = self.class_map[self.labels[item]]
         if self.transform is not None:
             img = self.transform(img)
         return img, label
@@ -184,6 +198,14 @@ class TorchObjectDetectionTD(VisionDataset):
 
         self.images = [item.data_url[0] for item in self.td_data_list]
         self.transform = transform
+        self._boxes = None
+
+    @property
+    def boxes(self):
+        # Built on first access, see TorchEOImageObjectTD.boxes
+        if self._boxes is None:
+            self._boxes = BoundingBoxStore.from_items(self.td_data_list, self.class_map)
+        return self._boxes
 
     def __len__(self):
         return len(self.td_data_list)
@@ -194,8 +216,9 @@ class TorchObjectDetectionTD(VisionDataset):
 
         img_height, img_width, channel = img.shape
         img = utils.channel_processing(img)
-        labels = self.td_data_list[index].labels
-        targets = utils.target_to_dict(labels, self.class_map, img_width, img_height)
+        targets = utils.target_to_dict(
+            self.boxes[index], self.class_map, img_width, img_height
+        )
 
         if self.transform is not None:
             img, targets = self.transform(img, targets)
@@ -42,6 +42,7 @@ import urllib3
 from PIL import Image
 from minio import S3Error
 from datalibrary.s3Client import minio_client as client
+from pytdml.ml.bbox_store import UNKNOWN_CLASS, ImageBoxes
 from pytdml.type import MD_Band, MD_Identifier
 from pytdml.type.basic_types import NamedValue
 
@@ -52,7 +53,6 @@ def get_bounding_box(geometry):
     """
     Get bbox from geojson geometry object
     """
-    print(geometry)
     coords = np.array(list(geometry["geometry"]["coordinates"][0]))
     return [coords[0][0], coords[0][1], coords[2][0], coords[3][1]]
 
@@ -348,7 +348,46 @@ def generate_cache_file_path(root, name, crop=None):
     return cache_file_path
 
 
+def dataset_cache_file_path(root, dataset, crop=None):
+    """
+    Generates a cache file path keyed on the content of a dataset.
+
+    Unlike ``generate_cache_file_path`` the name of the cache file is the
+    fingerprint of the data items and crop parameters, so editing the items
+    invalidates the cache while renaming the dataset keeps it.
+
+    Args:
+        root (str): The root directory.
+        dataset (TrainingDataset): The dataset whose items are cached.
+        crop (tuple or None): The crop parameters.
+
+    Returns:
+        str: The generated cache file path.
+
+    """
+    settings = None if crop is None else list(crop)
+    cache_name = dataset.fingerprint(settings) + ".pkl"
+    cache_file_path = os.path.join(root, "EOTrainingDataset", ".cache", cache_name)
+    if not os.path.exists(os.path.dirname(cache_file_path)):
+        os.makedirs(os.path.dirname(cache_file_path))
+    return cache_file_path
+
+
 def target_to_dict(labels, class_map, img_width, img_height):
+    if isinstance(labels, ImageBoxes):
+        # Packed boxes of a BoundingBoxStore, already mapped to class values.
+        # Classes missing from the class map are skipped, like below
+        scale = np.array(
+            [img_width, img_height, img_width, img_height], dtype=np.float32
+        )
+        class_ids = labels.class_ids[labels.class_ids != UNKNOWN_CLASS]
+        return {
+            "bbox": torch.from_numpy(labels.boxes / scale),
+            "class": torch.from_numpy(class_ids),
+            "bboxType": labels.bbox_types.tolist(),
+            "isDifficultlyDetectable": [],
+            "isNegative": labels.is_negative.tolist(),
+        }
     target_dict = {
         "bbox": [],
         "class": [],
@@ -93,3 +93,7 @@ from .extended_types import AI_SceneLabel
 from .extended_types import AI_EOTask
 from .extended_types import AI_EOTrainingData
 from .extended_types import EOTrainingDataset
+from .lazy_types import LazyTrainingDataList
+from .lazy_types import LazyEOTrainingDataset
+from ._changeset import apply_changesets
+from ._fingerprint import fingerprint
@@ -0,0 +1,131 @@
+"""
+Application of AI_TDChangeset objects to a training dataset.
+
+The data items are indexed by id once per call, so every added, modified or
+deleted item costs a dict lookup instead of a scan of ``data``. Deleted items
+are only marked while the changesets are applied and removed from ``data`` in
+a single pass at the end.
+"""
+
+from datetime import datetime
+
+_DELETED = object()
+
+
+def _item_id(item):
+    # Items of a lazy dataset that were not accessed yet are still JSON dicts
+    if isinstance(item, dict):
+        return item.get("id")
+    return item.id
+
+
+def _data_items(td):
+    """
+    Returns the list holding the data items of ``td``, to be changed in place
+    """
+    from pytdml.type.lazy_types import LazyTrainingDataList
+
+    if isinstance(td.data, LazyTrainingDataList):
+        # Counts as an edit of the lazy list, see its _version
+        td.data._version += 1
+        return td.data._items
+    if td.data is None:
+        td.data = []
+    return td.data
+
+
+class _DataIndex:
+    """
+    Positions of the data items by id
+    """
+
+    def __init__(self, items):
+        self.items = items
+        self.positions = {}
+        self.duplicates = set()
+        for position, item in enumerate(items):
+            item_id = _item_id(item)
+            if item_id in self.positions:
+                self.duplicates.add(item_id)
+            else:
+                self.positions[item_id] = position
+        self.deleted = 0
+
+    def position(self, item_id):
+        if item_id in self.duplicates:
+            raise ValueError(
+                "Training data id {!r} is not unique in the dataset".format(item_id)
+            )
+        try:
+            return self.positions[item_id]
+        except KeyError:
+            raise KeyError("No training data with id {!r}".format(item_id)) from None
+
+    def add(self, item):
+        item_id = _item_id(item)
+        if item_id in self.positions or item_id in self.duplicates:
+            raise ValueError(
+                "Training data with id {!r} already exists".format(item_id)
+            )
+        self.positions[item_id] = len(self.items)
+        self.items.append(item)
+
+    def modify(self, item):
+        self.items[self.position(_item_id(item))] = item
+
+    def delete(self, item):
+        item_id = _item_id(item)
+        self.items[self.position(item_id)] = _DELETED
+        del self.positions[item_id]
+        self.deleted += 1
+
+    def compact(self):
+        if self.deleted:
+            self.items[:] = [item for item in self.items if item is not _DELETED]
+            self.deleted = 0
+
+
+def apply_changesets(td, changesets=None):
+    """
+    Applies changesets to a training dataset in place and returns it.
+
+    ``changesets`` is a list of AI_TDChangeset applied in order, and defaults
+    to ``td.changesets``. Within a changeset the ``add``, ``modify`` and
+    ``delete`` items are applied in this order; items are matched by id.
+    Adding an existing id, or modifying or deleting a missing one, raises
+    an error. ``amount_of_training_data`` is set to the new number of items,
+    and ``updated_time`` and ``version`` are taken from the last changeset
+    (``updated_time`` is the current time if it has no ``created_time``).
+    The ``changesets`` of the dataset are left as they are. If a changeset
+    fails, the changes applied before it are kept.
+    """
+    if changesets is None:
+        changesets = td.changesets or []
+    for changeset in changesets:
+        if changeset.dataset_id is not None and changeset.dataset_id != td.id:
+            raise ValueError(
+                "Changeset {} is for dataset {}, not {}".format(
+                    changeset.id, changeset.dataset_id, td.id
+                )
+            )
+    index = _DataIndex(_data_items(td))
+    try:
+        for changeset in changesets:
+            for item in changeset.add or ():
+                index.add(item)
+            for item in changeset.modify or ():
+                index.modify(item)
+            for item in changeset.delete or ():
+                index.delete(item)
+    finally:
+        # Leave the dataset consistent even if a changeset failed halfway
+        index.compact()
+        td.amount_of_training_data = len(index.items)
+    if changesets:
+        last = changesets[-1]
+        td.updated_time = last.created_time or datetime.now().strftime(
+            "%Y-%m-%dT%H:%M:%S"
+        )
+        if last.version is not None:
+            td.version = last.version
+    return td
@@ -0,0 +1,273 @@
+"""
+Trusted construction of TDML models from JSON dicts without validation.
+
+``construct_model`` builds the same object graph as validating a JSON dict,
+but only converts the values: nested dicts become models, members of a model
+union are picked by their ``type`` literal and geojson objects are created
+without their coordinate cleaning. Field validators and constraints are not
+run, so it must only be used for encodings that are known to be valid, such
+as files written by pytdml itself, or checked otherwise: ``run_validators``
+runs the field and model validators on the constructed models afterwards.
+"""
+
+import sys
+import typing
+from typing import Annotated, ForwardRef, Literal, Union
+
+from geojson import Feature
+from pydantic import BaseModel
+
+from pytdml.type._geojson import trusted_feature
+from pytdml.type._utils import _gc_paused
+
+_object_setattr = object.__setattr__
+
+_NoneType = type(None)
+
+# Per model: list of (field name, JSON keys, converter, default, is_factory)
+_plans = {}
+
+_REQUIRED = object()
+
+
+def _identity(value):
+    return value
+
+
+def _resolve(annotation, model_type):
+    """
+    Resolves forward references against the pytdml type modules
+    """
+    if isinstance(annotation, str):
+        annotation = ForwardRef(annotation)
+    if isinstance(annotation, ForwardRef):
+        from pytdml.type import basic_types, extended_types
+
+        name = annotation.__forward_arg__
+        for module in (
+            sys.modules.get(model_type.__module__),
+            extended_types,
+            basic_types,
+        ):
+            if module is not None and hasattr(module, name):
+                return getattr(module, name)
+        raise NameError("Cannot resolve type {} of {}".format(name, model_type))
+    return annotation
+
+
+def _type_tag(model_type):
+    """
+    Returns the values of the ``type`` literal of a model, if it has one
+    """
+    field = model_type.model_fields.get("type")
+    if field is not None and typing.get_origin(field.annotation) is Literal:
+        return typing.get_args(field.annotation)
+    return ()
+
+
+def _model_converter(model_type):
+    def convert(value):
+        if isinstance(value, dict):
+            return _construct(model_type, value)
+        return value
+
+    return convert
+
+
+def _list_converter(convert_item):
+    if convert_item is _identity:
+        return _identity
+
+    def convert(value):
+        if isinstance(value, list):
+            return [convert_item(item) for item in value]
+        return value
+
+    return convert
+
+
+def _union_converter(annotation, members, model_type):
+    models = [m for m in members if isinstance(m, type) and issubclass(m, BaseModel)]
+    lists = [m for m in members if typing.get_origin(m) is list]
+    by_tag = {}
+    for member in models:
+        for tag in _type_tag(member):
+            by_tag.setdefault(tag, member)
+    convert_list = _converter(lists[0], model_type) if len(lists) == 1 else _identity
+    if not models and convert_list is _identity:
+        return _identity
+    fallback = None
+
+    def convert(value):
+        nonlocal fallback
+        if isinstance(value, dict) and models:
+            member = by_tag.get(value.get("type"))
+            if member is not None:
+                return _construct(member, value)
+            if len(models) == 1:
+                return _construct(models[0], value)
+            # No tag to go by, let pydantic pick the union member
+            if fallback is None:
+                from pydantic import TypeAdapter
+
+                fallback = TypeAdapter(annotation)
+            return fallback.validate_python(value)
+        if isinstance(value, list):
+            return convert_list(value)
+        return value
+
+    return convert
+
+
+def _converter(annotation, model_type):
+    annotation = _resolve(annotation, model_type)
+    origin = typing.get_origin(annotation)
+    if origin is Annotated:
+        return _converter(typing.get_args(annotation)[0], model_type)
+    if origin is Union:
+        members = [
+            _resolve(m, model_type)
+            for m in typing.get_args(annotation)
+            if m is not _NoneType
+        ]
+        if len(members) == 1:
+            return _converter(members[0], model_type)
+        return _union_converter(Union[tuple(members)], members, model_type)
+    if origin is list:
+        args = typing.get_args(annotation)
+        return _list_converter(_converter(args[0], model_type) if args else _identity)
+    if isinstance(annotation, type):
+        if issubclass(annotation, BaseModel):
+            return _model_converter(annotation)
+        if issubclass(annotation, Feature):
+            return trusted_feature
+    return _identity
+
+
+def _plan(model_type):
+    plan = _plans.get(model_type)
+    if plan is None:
+        alias_generator = model_type.model_config.get("alias_generator")
+        plan = []
+        for name, field in model_type.model_fields.items():
+            alias = field.alias
+            if alias is None and alias_generator is not None:
+                alias = alias_generator(name)
+            keys = (alias, name) if alias and alias != name else (name,)
+            if field.is_required():
+                default = _REQUIRED
+            elif field.default_factory is not None:
+                default = field.default_factory
+            else:
+                default = field.default
+            plan.append(
+                (
+                    name,
+                    keys,
+                    _converter(field.annotation, model_type),
+                    default,
+                    field.default_factory is not None,
+                )
+            )
+        _plans[model_type] = plan
+    return plan
+
+
+def _construct(model_type, json_dict):
+    values = {}
+    fields_set = set()
+    for name, keys, convert, default, is_factory in _plan(model_type):
+        for key in keys:
+            if key in json_dict:
+                values[name] = convert(json_dict[key])
+                fields_set.add(name)
+                break
+        else:
+            if default is _REQUIRED:
+                raise ValueError(
+                    "Missing required field {} of {}".format(
+                        keys[0], model_type.__name__
+                    )
+                )
+            values[name] = default() if is_factory else default
+    model = model_type.__new__(model_type)
+    _object_setattr(model, "__dict__", values)
+    _object_setattr(model, "__pydantic_fields_set__", fields_set)
+    _object_setattr(model, "__pydantic_extra__", None)
+    _object_setattr(model, "__pydantic_private__", None)
+    return model
+
+
+def construct_model(model_type, json_dict):
+    """
+    Builds a ``model_type`` instance from a trusted JSON dict without
+    validation. Nested models are constructed recursively and model unions
+    are resolved by the ``type`` member of the dict.
+    """
+    # The object graph has no reference cycles, collecting while it grows
+    # would only traverse it again and again
+    with _gc_paused():
+        return _construct(model_type, json_dict)
+
+
+def _validators(model_type):
+    decorators = model_type.__pydantic_decorators__
+    before = [
+        d.func for d in decorators.model_validators.values() if d.info.mode == "before"
+    ]
+    after = [
+        (field, d.func)
+        for d in decorators.field_validators.values()
+        if d.info.mode == "after"
+        for field in d.info.fields
+    ]
+    return before, after
+
+
+def _run_validators(model, cache):
+    model_type = type(model)
+    validators = cache.get(model_type)
+    if validators is None:
+        validators = cache[model_type] = _validators(model_type)
+    before, after = validators
+    values = model.__dict__
+    fields_set = model.__pydantic_fields_set__
+    if before:
+        json_dict = {
+            keys[0]: values[name]
+            for name, keys, _, _, _ in _plan(model_type)
+            if name in fields_set
+        }
+        for validator in before:
+            validator(json_dict)
+    for field, validator in after:
+        if field in fields_set:
+            try:
+                values[field] = validator(values[field])
+            except ValueError as e:
+                raise ValueError(
+                    "{}.{}: {}".format(model_type.__name__, field, e)
+                ) from None
+    for value in values.values():
+        _walk(value, cache)
+
+
+def _walk(value, cache):
+    # Geojson objects are dicts and are not walked
+    if isinstance(value, BaseModel):
+        _run_validators(value, cache)
+    elif isinstance(value, list):
+        for item in value:
+            _walk(item, cache)
+
+
+def run_validators(model):
+    """
+    Runs the field validators (``after`` mode) and the ``before`` model
+    validators of a model built by ``construct_model`` and of the models
+    nested in it, as validation would have. The values returned by the field
+    validators replace the field values, so the normalizations they apply
+    (e.g. dropping unknown training types) are applied as well. Raises
+    ValueError if a validator rejects a value.
+    """
+    _walk(model, {})
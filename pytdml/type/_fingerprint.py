@@ -0,0 +1,151 @@
+"""
+Content fingerprint of the data items of a training dataset.
+
+The items are serialized and hashed in chunks. The digests of the chunks are
+memoized per dataset object, so a later call only serializes the chunks whose
+items were replaced, added or removed since. Items are hashed in their JSON
+form as read: the raw dicts of a lazy dataset as they are, the models with
+the members that were set, so a lazy dataset has the fingerprint of the same
+dataset read eagerly, whichever of its items were accessed, and its items are
+hashed without being parsed.
+
+The memo does not keep the items alive: models are compared through weak
+references, and the raw dicts of a lazy dataset by id as long as its list was
+not edited. An item object that is changed in place is not detected, use
+``refresh=True`` after such changes.
+"""
+
+import hashlib
+import json
+import weakref
+
+CHUNK_SIZE = 1024
+
+# Changes whenever the serialized form of the items changes
+_VERSION = b"pytdml-fingerprint-3"
+
+# Memoized chunks by id() of the dataset, dropped when the dataset is collected
+_memos = {}
+
+
+def _serialize(item):
+    """
+    Serializes an item in the canonical form of the fingerprint: its JSON
+    members without empty values and with sorted keys, written by the
+    standard library so that it does not depend on the JSON backend
+    """
+    from pytdml.io.tdml_writers import remove_empty_values
+
+    if not isinstance(item, dict):
+        # The members that were set are those of the JSON item it was read
+        # from, without the defaults filled in by the model
+        item = item.model_dump(by_alias=True, exclude_unset=True, exclude_none=True)
+    return json.dumps(
+        remove_empty_values(item),
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        default=str,
+    ).encode("utf-8")
+
+
+def _chunk_digest(items):
+    digest = hashlib.blake2b(digest_size=16)
+    for item in items:
+        data = _serialize(item)
+        digest.update(len(data).to_bytes(8, "little"))
+        digest.update(data)
+    return digest.digest()
+
+
+def _item_key(item):
+    return id(item) if isinstance(item, dict) else weakref.ref(item)
+
+
+def _same_item(key, item, raw_valid):
+    if isinstance(key, weakref.ref):
+        return key() is item
+    # A raw dict is replaced in place by the model parsed from it, which has
+    # the same JSON form
+    return raw_valid and (id(item) == key or not isinstance(item, dict))
+
+
+def _same_items(keys, items, raw_valid):
+    return len(keys) == len(items) and all(
+        _same_item(key, item, raw_valid) for key, item in zip(keys, items)
+    )
+
+
+def _data_items(td):
+    """
+    Returns the data items of ``td`` (raw dicts for the items of a lazy
+    dataset that were not accessed yet) and the lazy list that holds them
+    """
+    from pytdml.type.lazy_types import LazyTrainingDataList
+
+    if isinstance(td.data, LazyTrainingDataList):
+        return td.data._items, td.data
+    return td.data or [], None
+
+
+def _memo(td, lazy):
+    """
+    Returns the memoized chunks of ``td`` and whether the ids of its raw
+    dicts are still valid, i.e. its lazy list was not replaced or edited
+    """
+    memo = _memos.get(id(td))
+    if memo is None or memo[0]() is not td:
+        return (), False
+    _, lazy_ref, lazy_version, chunks = memo
+    raw_valid = (
+        lazy is not None and lazy_ref() is lazy and lazy._version == lazy_version
+    )
+    return chunks, raw_valid
+
+
+def _store_memo(td, lazy, chunks):
+    key = id(td)
+    ref = weakref.ref(td, lambda _: _memos.pop(key, None))
+    if lazy is None:
+        _memos[key] = (ref, None, None, chunks)
+    else:
+        _memos[key] = (ref, weakref.ref(lazy), lazy._version, chunks)
+
+
+def forget_fingerprint(td):
+    """
+    Drops the memoized chunk digests of ``td``
+    """
+    _memos.pop(id(td), None)
+
+
+def fingerprint(td, settings=None, refresh=False):
+    """
+    Returns a hex digest of the data items of ``td`` and of ``settings``.
+
+    ``settings`` is any JSON serializable value that the result depends on as
+    well, e.g. the crop parameters of a cache. The header of the dataset (name,
+    description, ...) is not part of the fingerprint. The chunk digests are
+    memoized on ``td`` unless ``refresh`` is True.
+    """
+    items, lazy = _data_items(td)
+    old_chunks, raw_valid = ((), False) if refresh else _memo(td, lazy)
+    chunks = []
+    for index, start in enumerate(range(0, len(items), CHUNK_SIZE)):
+        chunk_items = items[start : start + CHUNK_SIZE]
+        if index < len(old_chunks) and _same_items(
+            old_chunks[index][0], chunk_items, raw_valid
+        ):
+            chunk_digest = old_chunks[index][1]
+        else:
+            chunk_digest = _chunk_digest(chunk_items)
+        # The keys are taken again, as accessed items are now models
+        chunks.append((tuple(map(_item_key, chunk_items)), chunk_digest))
+    _store_memo(td, lazy, tuple(chunks))
+
+    digest = hashlib.blake2b(_VERSION, digest_size=16)
+    digest.update(len(items).to_bytes(8, "little"))
+    for _, chunk_digest in chunks:
+        digest.update(chunk_digest)
+    digest.update(json.dumps(settings, sort_keys=True, default=str).encode("utf-8"))
+    return digest.hexdigest()
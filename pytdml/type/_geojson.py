@@ -0,0 +1,126 @@
+"""
+Fast construction of geojson Features from JSON dicts.
+
+``geojson.Feature(**d)`` re-creates the geometry through ``to_instance`` and
+cleans the coordinates with several abstract-base-class checks per number,
+which dominates the validation of object labels. ``parse_feature`` produces
+the same object for plain JSON input and falls back to geojson otherwise,
+``trusted_feature`` skips the coordinate cleaning altogether.
+"""
+
+import geojson
+from geojson import Feature
+from geojson.geometry import DEFAULT_PRECISION
+
+_SIMPLE_GEOMETRIES = {
+    name: getattr(geojson, name)
+    for name in (
+        "Point",
+        "MultiPoint",
+        "LineString",
+        "MultiLineString",
+        "Polygon",
+        "MultiPolygon",
+    )
+}
+
+
+def _clean_coordinates(coords, precision):
+    """
+    Same as ``Geometry.clean_coordinates`` for nested lists of JSON numbers.
+    Returns None for any other input.
+    """
+    cleaned = []
+    for coord in coords:
+        coord_type = type(coord)
+        if coord_type is float:
+            cleaned.append(round(coord, precision))
+        elif coord_type is int:
+            cleaned.append(coord)
+        elif coord_type is list or coord_type is tuple:
+            coord = _clean_coordinates(coord, precision)
+            if coord is None:
+                return None
+            cleaned.append(coord)
+        else:
+            return None
+    return cleaned
+
+
+def _new_feature(value, geometry):
+    # Same key order as Feature.__init__: type, extra members, id, geometry,
+    # properties
+    feature = Feature.__new__(Feature)
+    dict.__setitem__(feature, "type", "Feature")
+    for key, item in value.items():
+        if key not in ("id", "geometry", "properties"):
+            dict.__setitem__(feature, key, item)
+    if value.get("id") is not None:
+        dict.__setitem__(feature, "id", value["id"])
+    dict.__setitem__(feature, "geometry", geometry)
+    dict.__setitem__(feature, "properties", value.get("properties") or {})
+    return feature
+
+
+def parse_feature(value):
+    """
+    Returns ``Feature(**value)`` for a Feature JSON dict
+    """
+    if type(value) is not dict:
+        return Feature(**value)
+    geometry = value.get("geometry")
+    if not geometry:
+        return _new_feature(value, None)
+    if type(geometry) is not dict or not geometry.keys() <= {"type", "coordinates"}:
+        return Feature(**value)
+    geometry_type = _SIMPLE_GEOMETRIES.get(geometry.get("type"))
+    if geometry_type is None:
+        return Feature(**value)
+    coordinates = _clean_coordinates(
+        geometry.get("coordinates") or [], DEFAULT_PRECISION
+    )
+    if coordinates is None:
+        return Feature(**value)
+    new_geometry = geometry_type.__new__(geometry_type)
+    dict.__setitem__(new_geometry, "type", geometry_type.__name__)
+    dict.__setitem__(new_geometry, "coordinates", coordinates)
+    return _new_feature(value, new_geometry)
+
+
+def trusted_geometry(value):
+    """
+    Creates a geojson geometry from a trusted dict, keeping the coordinates
+    as they are
+    """
+    if not value:
+        return None
+    if isinstance(value, geojson.GeoJSON):
+        return value
+    geometry_type = getattr(geojson.factory, value.get("type", ""), None)
+    if geometry_type is None:
+        raise ValueError("Cannot construct geometry of type {}".format(value))
+    geometry = geometry_type.__new__(geometry_type)
+    # Same key order as geojson's own constructors
+    dict.__setitem__(geometry, "type", value["type"])
+    for key, item in value.items():
+        if key not in ("type", "coordinates", "geometries"):
+            dict.__setitem__(geometry, key, item)
+    if "geometries" in value or geometry_type is geojson.GeometryCollection:
+        dict.__setitem__(
+            geometry,
+            "geometries",
+            [trusted_geometry(item) for item in value.get("geometries") or []],
+        )
+    else:
+        dict.__setitem__(geometry, "coordinates", value.get("coordinates") or [])
+    return geometry
+
+
+def trusted_feature(value):
+    """
+    Creates a geojson Feature like ``Feature(**value)`` but takes the
+    coordinates as they are instead of cleaning and rounding them
+    """
+    if not isinstance(value, dict) or isinstance(value, geojson.GeoJSON):
+        return value
+    return _new_feature(value, trusted_geometry(value.get("geometry")))
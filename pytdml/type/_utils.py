@@ -30,8 +30,39 @@
 # ------------------------------------------------------------------------------
 
 
+from contextlib import contextmanager
 from datetime import datetime
+import gc
 import re
+import threading
+
+
+_gc_lock = threading.Lock()
+_gc_pauses = 0
+_gc_was_enabled = False
+
+
+@contextmanager
+def _gc_paused():
+    """
+    Pauses the cyclic garbage collector while building large acyclic object
+    graphs. Pauses are counted, so nested or concurrent pauses re-enable the
+    collector only when the last one ends, and only if it was enabled before
+    the first one.
+    """
+    global _gc_pauses, _gc_was_enabled
+    with _gc_lock:
+        if _gc_pauses == 0:
+            _gc_was_enabled = gc.isenabled()
+            gc.disable()
+        _gc_pauses += 1
+    try:
+        yield
+    finally:
+        with _gc_lock:
+            _gc_pauses -= 1
+            if _gc_pauses == 0 and _gc_was_enabled:
+                gc.enable()
 
 
 class InvalidDatetimeError(ValueError):
@@ -33,8 +33,11 @@
 
 import copy
 from typing_extensions import TypedDict
-from typing import List, Union, Optional, Literal
+from typing import Annotated, List, Union, Optional, Literal
 from pydantic import BaseModel, Field, field_validator, model_validator
+from pytdml.type._changeset import apply_changesets
+from pytdml.type._fingerprint import fingerprint
+from pytdml.type._construct import construct_model
 from pytdml.type._utils import (
     _validate_date,
     to_camel,
@@ -70,8 +73,10 @@ class KeyValuePair(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(KeyValuePair, new_dict)
         return KeyValuePair(**new_dict)
 
 
@@ -87,8 +92,10 @@ class NamedValue(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(NamedValue, new_dict)
         return NamedValue(**new_dict)
 
 
@@ -108,8 +115,10 @@ class CI_Date(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(CI_Date, new_dict)
         return CI_Date(**new_dict)
 
 
@@ -136,8 +145,10 @@ class CI_Citation(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(CI_Citation, new_dict)
         return CI_Citation(**new_dict)
 
 
@@ -152,8 +163,10 @@ class LinearRing(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(LinearRing, new_dict)
         return LinearRing(**new_dict)
 
 
@@ -168,8 +181,10 @@ class LinearRing_Object(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(LinearRing_Object, new_dict)
         return LinearRing_Object(**new_dict)
 
 
@@ -189,8 +204,10 @@ class Polygon(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(Polygon, new_dict)
         return Polygon(**new_dict)
 
 
@@ -209,8 +226,10 @@ class MD_Identifier(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(MD_Identifier, new_dict)
         return MD_Identifier(**new_dict)
 
 
@@ -226,8 +245,10 @@ class MemberName(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(MemberName, new_dict)
         return MemberName(**new_dict)
 
 
@@ -244,8 +265,10 @@ class MI_RangeElementDescription(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(MI_RangeElementDescription, new_dict)
         return MI_RangeElementDescription(**new_dict)
 
 
@@ -293,8 +316,10 @@ class MD_Band(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(MD_Band, new_dict)
         return MD_Band(**new_dict)
 
 
@@ -310,8 +335,10 @@ class EX_BoundingPolygon(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(EX_BoundingPolygon, new_dict)
         return EX_BoundingPolygon(**new_dict)
 
 
@@ -331,8 +358,10 @@ class EX_GeographicBoundingBox(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(EX_GeographicBoundingBox, new_dict)
         return EX_GeographicBoundingBox(**new_dict)
 
 
@@ -349,8 +378,10 @@ class EX_GeographicDescription(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(EX_GeographicDescription, new_dict)
         return EX_GeographicDescription(**new_dict)
 
 
@@ -371,8 +402,10 @@ class TimeInstant(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(TimeInstant, new_dict)
         return TimeInstant(**new_dict)
 
 
@@ -404,8 +437,10 @@ class TimePeriod(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(TimePeriod, new_dict)
         return TimePeriod(**new_dict)
 
 
@@ -420,8 +455,10 @@ class EX_TemporalExtent(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(EX_TemporalExtent, new_dict)
         return EX_TemporalExtent(**new_dict)
 
 
@@ -437,8 +474,10 @@ class EX_ReferenceSystem(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(EX_ReferenceSystem, new_dict)
         return EX_ReferenceSystem(**new_dict)
 
 
@@ -462,8 +501,10 @@ class VerticalCRS(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(VerticalCRS, new_dict)
         return VerticalCRS(**new_dict)
 
 
@@ -482,8 +523,10 @@ class EX_VerticalExtent(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(EX_VerticalExtent, new_dict)
         return EX_VerticalExtent(**new_dict)
 
 
@@ -503,8 +546,10 @@ class EX_SpatialTemporalExtent(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(EX_SpatialTemporalExtent, new_dict)
         return EX_SpatialTemporalExtent(**new_dict)
 
 
@@ -530,8 +575,10 @@ class EX_Extent(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(EX_Extent, new_dict)
         return EX_Extent(**new_dict)
 
 
@@ -566,8 +613,10 @@ class MD_ScopeDescription(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(MD_ScopeDescription, new_dict)
         return MD_ScopeDescription(**new_dict)
 
 
@@ -584,8 +633,10 @@ class MD_Scope(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(MD_Scope, new_dict)
         return MD_Scope(**new_dict)
 
 
@@ -598,8 +649,10 @@ class CI_Telephone(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(CI_Telephone, new_dict)
         return CI_Telephone(**new_dict)
 
 
@@ -616,8 +669,10 @@ class CI_Address(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(CI_Address, new_dict)
         return CI_Address(**new_dict)
 
 
@@ -635,8 +690,10 @@ class CI_OnlineResource(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(CI_OnlineResource, new_dict)
         return CI_OnlineResource(**new_dict)
 
 
@@ -653,8 +710,10 @@ class CI_Contact(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(CI_Contact, new_dict)
         return CI_Contact(**new_dict)
 
 
@@ -669,8 +728,10 @@ class CI_Individual(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(CI_Individual, new_dict)
         return CI_Individual(**new_dict)
 
 
@@ -686,8 +747,10 @@ class CI_Organisation(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(CI_Organisation, new_dict)
         return CI_Organisation(**new_dict)
 
 
@@ -702,8 +765,10 @@ class CI_Responsibility(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(CI_Responsibility, new_dict)
         return CI_Responsibility(**new_dict)
 
 
@@ -717,8 +782,10 @@ class MD_Releasability(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(MD_Releasability, new_dict)
         return MD_Releasability(**new_dict)
 
 
@@ -735,8 +802,10 @@ class MD_Constraints(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(MD_Constraints, new_dict)
         return MD_Constraints(**new_dict)
 
 
@@ -755,8 +824,10 @@ class MD_BrowseGraphic(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(MD_BrowseGraphic, new_dict)
         return MD_BrowseGraphic(**new_dict)
 
 
@@ -791,8 +862,10 @@ class AI_MetricsInLiterature(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(AI_MetricsInLiterature, new_dict)
         return AI_MetricsInLiterature(**new_dict)
 
 
@@ -811,8 +884,10 @@ class AI_Task(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(AI_Task, new_dict)
         return AI_Task(**new_dict)
 
 
@@ -829,8 +904,10 @@ class AI_Labeler(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(AI_Labeler, new_dict)
         return AI_Labeler(**new_dict)
 
 
@@ -853,8 +930,10 @@ class AI_LabelingProcedure(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(AI_LabelingProcedure, new_dict)
         return AI_LabelingProcedure(**new_dict)
 
 
@@ -874,8 +953,10 @@ class AI_Labeling(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(AI_Labeling, new_dict)
         return AI_Labeling(**new_dict)
 
 
@@ -889,8 +970,10 @@ class MeasureReference(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(MeasureReference, new_dict)
         return MeasureReference(**new_dict)
 
 
@@ -923,8 +1006,10 @@ class EvaluationMethod(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(EvaluationMethod, new_dict)
         return EvaluationMethod(**new_dict)
 
 
@@ -939,8 +1024,10 @@ class QuantitativeResult(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(QuantitativeResult, new_dict)
         return QuantitativeResult(**new_dict)
 
 
@@ -955,8 +1042,10 @@ class ConformanceResult(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(ConformanceResult, new_dict)
         return ConformanceResult(**new_dict)
 
 
@@ -968,8 +1057,10 @@ class DescriptiveResult(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(DescriptiveResult, new_dict)
         return DescriptiveResult(**new_dict)
 
 
@@ -986,8 +1077,10 @@ class MD_Dimension(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(MD_Dimension, new_dict)
         return MD_Dimension(**new_dict)
 
 
@@ -1004,8 +1097,10 @@ class MD_GridSpatialRepresentation(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(MD_GridSpatialRepresentation, new_dict)
         return MD_GridSpatialRepresentation(**new_dict)
 
 
@@ -1018,8 +1113,10 @@ class MD_GeometricObjects(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(MD_GeometricObjects, new_dict)
         return MD_GeometricObjects(**new_dict)
 
 
@@ -1033,8 +1130,10 @@ class MD_VectorSpatialRepresentation(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(MD_VectorSpatialRepresentation, new_dict)
         return MD_VectorSpatialRepresentation(**new_dict)
 
 
@@ -1048,8 +1147,10 @@ class MD_RangeDimension(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(MD_RangeDimension, new_dict)
         return MD_RangeDimension(**new_dict)
 
 
@@ -1067,8 +1168,10 @@ class CoverageResult(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(CoverageResult, new_dict)
         return CoverageResult(**new_dict)
 
 
@@ -1088,8 +1191,10 @@ class QualityElement(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(QualityElement, new_dict)
         return QualityElement(**new_dict)
 
 
@@ -1106,8 +1211,10 @@ class DataQuality(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(DataQuality, new_dict)
         return DataQuality(**new_dict)
 
 
@@ -1138,8 +1245,10 @@ class AI_Label(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(AI_Label, new_dict)
         return AI_Label(**new_dict)
 
 
@@ -1150,7 +1259,12 @@ class AI_TrainingData(BaseCamelModel):
 
     type: Literal["AI_AbstractTrainingData"]
     id: str
-    labels: List[Union[AI_Label, "AI_PixelLabel", "AI_ObjectLabel", "AI_SceneLabel"]]
+    labels: List[
+        Annotated[
+            Union[AI_Label, "AI_PixelLabel", "AI_ObjectLabel", "AI_SceneLabel"],
+            Field(discriminator="type"),
+        ]
+    ]
 
     dataSet_id: Optional[str] = None
     data_sources: Optional[List[CI_Citation]] = None
@@ -1168,11 +1282,20 @@ class AI_TrainingData(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(AI_TrainingData, new_dict)
         return AI_TrainingData(**new_dict)
 
 
+# Training data items are told apart by their ``type`` literal, so pydantic
+# dispatches on it directly instead of trying every member of the union
+_TrainingDataUnion = Annotated[
+    Union[AI_TrainingData, "AI_EOTrainingData"], Field(discriminator="type")
+]
+
+
 class AI_TDChangeset(BaseCamelModel):
     type: Literal["AI_TDChangeset"]
     id: str
@@ -1181,9 +1304,9 @@ class AI_TDChangeset(BaseCamelModel):
     dataset_id: Optional[str] = None
     version: Optional[str] = None
     created_time: Optional[str] = None
-    add: Optional[List[Union[AI_TrainingData, "AI_EOTrainingData"]]] = None
-    modify: Optional[List[Union[AI_TrainingData, "AI_EOTrainingData"]]] = None
-    delete: Optional[List[Union[AI_TrainingData, "AI_EOTrainingData"]]] = None
+    add: Optional[List[_TrainingDataUnion]] = None
+    modify: Optional[List[_TrainingDataUnion]] = None
+    delete: Optional[List[_TrainingDataUnion]] = None
 
     @field_validator("created_time")
     def validate_created_time(cls, v):
@@ -1193,8 +1316,10 @@ class AI_TDChangeset(BaseCamelModel):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(AI_TDChangeset, new_dict)
         return AI_TDChangeset(**new_dict)
 
 
@@ -1207,8 +1332,10 @@ class TrainingDataset(BaseCamelModel):
     name: str
     description: str
     license: str
-    tasks: List[Union[AI_Task, "AI_EOTask"]] = Field(min_length=1)
-    data: List[Union[AI_TrainingData, "AI_EOTrainingData"]] = Field(
+    tasks: List[Annotated[Union[AI_Task, "AI_EOTask"], Field(discriminator="type")]] = (
+        Field(min_length=1)
+    )
+    data: List[_TrainingDataUnion] = Field(
         min_length=1
     )  # That one should be uri-format
     type: Literal["AI_AbstractTrainingDataset"]
@@ -1247,10 +1374,29 @@ class TrainingDataset(BaseCamelModel):
         else:
             return v
 
+    def apply(self, changeset):
+        """
+        Applies a changeset, or a list of changesets in order, to this dataset
+        in place and returns it (see ``apply_changesets``)
+        """
+        if isinstance(changeset, AI_TDChangeset):
+            changeset = [changeset]
+        return apply_changesets(self, changeset)
+
+    def fingerprint(self, settings=None, refresh=False):
+        """
+        Returns a hex digest of the data items and of ``settings``, e.g. for
+        cache keys. It is memoized and only re-hashes the chunks of items that
+        were replaced since the last call (see ``fingerprint``).
+        """
+        return fingerprint(self, settings, refresh)
+
     def to_dict(self):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(TrainingDataset, new_dict)
         return TrainingDataset(**new_dict)
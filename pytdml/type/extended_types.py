@@ -34,14 +34,17 @@ import json
 import copy
 import geojson
 from geojson import Feature
-from typing import List, Union, Optional, Literal
+from typing import Annotated, List, Union, Optional, Literal
 from pydantic import Field, field_validator
 
+from pytdml.type._construct import construct_model
+from pytdml.type import _geojson
 from pytdml.type._utils import _validate_date, _validate_image_format
 from pytdml.type.basic_types import (
     AI_Label,
     TrainingDataset,
     AI_TrainingData,
+    AI_TDChangeset,
     MD_Band,
     EX_Extent,
     AI_Task,
@@ -72,8 +75,10 @@ class AI_PixelLabel(AI_Label):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(AI_PixelLabel, new_dict)
         return AI_PixelLabel(**new_dict)
 
 
@@ -92,7 +97,7 @@ class AI_ObjectLabel(AI_Label):
     @field_validator("object", mode="before")
     def parse_feature(cls, v):
         if isinstance(v, dict):
-            return Feature(**v)
+            return _geojson.parse_feature(v)
         return v
 
     @field_validator("date_time")
@@ -106,8 +111,10 @@ class AI_ObjectLabel(AI_Label):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(AI_ObjectLabel, new_dict)
         return AI_ObjectLabel(**new_dict)
 
 
@@ -123,8 +130,10 @@ class AI_SceneLabel(AI_Label):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(AI_SceneLabel, new_dict)
         return AI_SceneLabel(**new_dict)
 
 
@@ -140,8 +149,10 @@ class AI_EOTask(AI_Task):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(AI_EOTask, new_dict)
         return AI_EOTask(**new_dict)
 
 
@@ -152,7 +163,12 @@ class AI_EOTrainingData(AI_TrainingData):
 
     type: Literal["AI_EOTrainingData"]
     data_url: List[str] = Field(min_length=1, alias="dataURL")
-    labels: List[Union[AI_Label, AI_PixelLabel, AI_ObjectLabel, AI_SceneLabel]]
+    labels: List[
+        Annotated[
+            Union[AI_Label, AI_PixelLabel, AI_ObjectLabel, AI_SceneLabel],
+            Field(discriminator="type"),
+        ]
+    ]
 
     extent: Optional[Union[EX_Extent, List[Union[int, float]]]] = None
     data_time: Optional[List[str]] = None
@@ -171,8 +187,10 @@ class AI_EOTrainingData(AI_TrainingData):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(AI_EOTrainingData, new_dict)
         return AI_EOTrainingData(**new_dict)
 
 
@@ -194,6 +212,15 @@ class EOTrainingDataset(TrainingDataset):
         return self.model_dump(by_alias=True, exclude_none=True)
 
     @staticmethod
-    def from_dict(json_dict):
-        new_dict = copy.deepcopy(json_dict)
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            return construct_model(EOTrainingDataset, new_dict)
         return EOTrainingDataset(**new_dict)
+
+
+# The basic types refer to the extended types by name, resolve them now that
+# they are defined
+AI_TrainingData.model_rebuild()
+AI_TDChangeset.model_rebuild()
+TrainingDataset.model_rebuild()
@@ -0,0 +1,115 @@
+import copy
+from collections.abc import MutableSequence
+from pydantic import field_validator
+
+from pytdml.type._construct import construct_model, run_validators
+from pytdml.type.extended_types import AI_EOTrainingData, EOTrainingDataset
+
+
+class LazyTrainingDataList(MutableSequence):
+    """
+    List of training data items that are validated on first access
+
+    Items are kept as raw JSON dicts until they are indexed (or iterated), then
+    parsed with ``item_type.from_dict`` and cached in place, so every item is
+    validated at most once. Slicing returns a new lazy list over the same items.
+    With ``validate=False`` the items are constructed without validation, and
+    with ``check=True`` as well the field and model validators are run on them
+    after construction (see ``run_validators``).
+    """
+
+    def __init__(
+        self, items=(), item_type=AI_EOTrainingData, validate=True, check=False
+    ):
+        self._items = list(items)
+        self._item_type = item_type
+        self._validate = validate
+        self._check = check
+        # Counts the edits of the list, parsing an item in place is not one
+        self._version = 0
+
+    def _parse(self, index):
+        item = self._items[index]
+        if isinstance(item, dict):
+            # The raw dict is owned by this list, no need to copy it
+            item = self._item_type.from_dict(
+                item, take_ownership=True, validate=self._validate
+            )
+            if self._check and not self._validate:
+                run_validators(item)
+            self._items[index] = item
+        return item
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return LazyTrainingDataList(
+                self._items[index], self._item_type, self._validate, self._check
+            )
+        return self._parse(index)
+
+    def __setitem__(self, index, value):
+        self._items[index] = value
+        self._version += 1
+
+    def __delitem__(self, index):
+        del self._items[index]
+        self._version += 1
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        for index in range(len(self._items)):
+            yield self._parse(index)
+
+    def __eq__(self, other):
+        if isinstance(other, (LazyTrainingDataList, list)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self):
+        return "LazyTrainingDataList({} items, {} parsed)".format(
+            len(self._items), self.parsed_count()
+        )
+
+    def insert(self, index, value):
+        self._items.insert(index, value)
+        self._version += 1
+
+    def parsed_count(self):
+        """
+        Number of items that have been validated so far
+        """
+        return sum(1 for item in self._items if not isinstance(item, dict))
+
+
+class LazyEOTrainingDataset(EOTrainingDataset):
+    """
+    EO training dataset whose header is validated eagerly and whose data items
+    are validated on first access
+    """
+
+    data: LazyTrainingDataList
+
+    @field_validator("data", mode="before")
+    def wrap_data(cls, v):
+        if isinstance(v, LazyTrainingDataList):
+            return v
+        if not v:
+            raise ValueError("data should have at least 1 item")
+        return LazyTrainingDataList(v, AI_EOTrainingData)
+
+    def to_dict(self):
+        json_dict = self.model_dump(by_alias=True, exclude_none=True)
+        json_dict["data"] = [item.to_dict() for item in self.data]
+        return json_dict
+
+    @staticmethod
+    def from_dict(json_dict, take_ownership=False, validate=True):
+        new_dict = json_dict if take_ownership else copy.deepcopy(json_dict)
+        if not validate:
+            new_dict["data"] = LazyTrainingDataList(
+                new_dict.get("data") or [], AI_EOTrainingData, validate=False
+            )
+            return construct_model(LazyEOTrainingDataset, new_dict)
+        return LazyEOTrainingDataset(**new_dict)
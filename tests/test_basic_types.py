@@ -137,3 +137,88 @@ def test_valid_datatime():
     response = requests.get(remote_schema_url)
     remote_schema = response.json()
     jsonschema.validate(instance="2023-10-27T14:30:00", schema=remote_schema)
+
+
+# Test from_dict keeps the input intact by default
+def test_from_dict_copies_input():
+    data = {"type": "AI_Labeler", "id": "1", "name": "zhaoyan"}
+    labeler = AI_Labeler.from_dict(data)
+    labeler.name = "changed"
+    assert data == {"type": "AI_Labeler", "id": "1", "name": "zhaoyan"}
+
+
+# Test from_dict with ownership transfer builds the same object
+def test_from_dict_take_ownership():
+    data = {"type": "AI_Labeler", "id": "1", "name": "zhaoyan"}
+    assert AI_Labeler.from_dict(
+        dict(data), take_ownership=True
+    ) == AI_Labeler.from_dict(data)
+
+
+# Test labels are dispatched on their type
+def test_label_union_dispatch():
+    from geojson import Feature
+    from pytdml.type import AI_EOTrainingData, AI_ObjectLabel, AI_SceneLabel
+
+    item = AI_EOTrainingData.from_dict(
+        {
+            "type": "AI_EOTrainingData",
+            "id": "1",
+            "dataURL": ["1.tif"],
+            "labels": [
+                {"type": "AI_SceneLabel", "class": "Forest"},
+                {
+                    "type": "AI_ObjectLabel",
+                    "class": "Bridge",
+                    "object": {
+                        "type": "Feature",
+                        "properties": {},
+                        "geometry": {"type": "Point", "coordinates": [1.5, 2]},
+                    },
+                },
+            ],
+        }
+    )
+    assert isinstance(item.labels[0], AI_SceneLabel)
+    assert isinstance(item.labels[1], AI_ObjectLabel)
+    assert isinstance(item.labels[1].object, Feature)
+    assert item.labels[1].object == Feature(
+        geometry={"type": "Point", "coordinates": [1.5, 2]}, properties={}
+    )
+
+
+# Test an unknown label type is rejected
+def test_label_union_unknown_type():
+    from pytdml.type import AI_EOTrainingData
+
+    with pytest.raises(ValidationError):
+        AI_EOTrainingData.from_dict(
+            {
+                "type": "AI_EOTrainingData",
+                "id": "1",
+                "dataURL": ["1.tif"],
+                "labels": [{"type": "AI_UnknownLabel", "class": "Forest"}],
+            }
+        )
+
+
+# Test changesets accept EO training data
+def test_changeset_with_eo_training_data():
+    from pytdml.type import AI_EOTrainingData, AI_TDChangeset
+
+    changeset = AI_TDChangeset.from_dict(
+        {
+            "type": "AI_TDChangeset",
+            "id": "c1",
+            "changeCount": 1,
+            "add": [
+                {
+                    "type": "AI_EOTrainingData",
+                    "id": "1",
+                    "dataURL": ["1.tif"],
+                    "labels": [{"type": "AI_SceneLabel", "class": "Forest"}],
+                }
+            ],
+        }
+    )
+    assert isinstance(changeset.add[0], AI_EOTrainingData)
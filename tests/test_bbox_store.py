@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+from pytdml.io import read_from_json
+from pytdml.ml import BoundingBoxStore, create_class_map
+from pytdml.ml.bbox_store import UNKNOWN_CLASS
+
+COWC = "tests/data/object-detection/COWC_partial.json"
+
+
+@pytest.fixture(scope="module")
+def dataset():
+    return read_from_json(COWC)
+
+
+def test_store_matches_labels(dataset):
+    class_map = create_class_map(dataset)
+    store = BoundingBoxStore.from_items(dataset.data, class_map)
+    assert len(store) == len(dataset.data)
+    assert store.boxes.dtype == np.float32
+    assert store.offsets[-1] == sum(len(item.labels) for item in dataset.data)
+    for index in (0, len(dataset.data) - 1):
+        labels = dataset.data[index].labels
+        image_boxes = store[index]
+        assert len(image_boxes.boxes) == len(labels)
+        for i, label in enumerate(labels):
+            ring = label.object["geometry"]["coordinates"][0]
+            expected = [ring[0][0], ring[0][1], ring[2][0], ring[3][1]]
+            assert np.allclose(image_boxes.boxes[i], expected)
+            assert image_boxes.class_ids[i] == class_map[label.label_class]
+            assert image_boxes.bbox_types[i] == label.bbox_type
+
+
+def test_store_targets(dataset):
+    class_map = create_class_map(dataset)
+    store = BoundingBoxStore.from_items(dataset.data, class_map)
+    targets = store.targets(0, 200, 100)
+    assert targets.shape == (len(dataset.data[0].labels), 5)
+    assert np.allclose(targets[:, :4], store[0].boxes / [200, 100, 200, 100])
+    assert np.array_equal(targets[:, 4], store[0].class_ids)
+    with pytest.raises(IndexError):
+        store[len(store)]
+
+
+def test_store_unknown_class():
+    dataset = read_from_json(COWC)
+    store = BoundingBoxStore.from_items(dataset.data[:1], {})
+    assert (store.class_ids == UNKNOWN_CLASS).all()
+    with pytest.raises(KeyError):
+        store.targets(0, 200, 100)
+
+
+def test_torch_datasets_use_store():
+    pytest.importorskip("torch")
+    pytest.importorskip("torchvision")
+    pytest.importorskip("cv2")
+    from pytdml.ml import TorchEOImageObjectTD, TorchObjectDetectionTD
+
+    dataset = read_from_json(COWC, lazy=True)
+    class_map = create_class_map(read_from_json(COWC))
+    object_td = TorchEOImageObjectTD(dataset.data, class_map)
+    # The store is only built on the first item
+    assert object_td._boxes is None
+    img, targets, img_height, img_width = object_td[0]
+    assert targets.shape == (len(dataset.data[0].labels), 5)
+    assert np.array_equal(targets[:, 4], object_td.boxes[0].class_ids)
+
+    # Labels of classes missing from the class map are skipped
+    detection_td = TorchObjectDetectionTD(dataset.data, ".", {})
+    assert detection_td._boxes is None
+    img, targets = detection_td[0]
+    assert len(targets["bbox"]) == len(dataset.data[0].labels)
+    assert len(targets["class"]) == 0
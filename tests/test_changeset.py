@@ -0,0 +1,81 @@
+import pytest
+
+from pytdml.io import read_from_json
+from pytdml.type import AI_TDChangeset, apply_changesets
+
+AIROUND = "tests/data/json/AiRound-aerial.json"
+
+
+def _changeset(changeset_id, add=(), modify=(), delete=(), **kwargs):
+    return AI_TDChangeset(
+        type="AI_TDChangeset",
+        id=changeset_id,
+        change_count=len(add) + len(modify) + len(delete),
+        add=[item.to_dict() for item in add],
+        modify=[item.to_dict() for item in modify],
+        delete=[item.to_dict() for item in delete],
+        **kwargs,
+    )
+
+
+def _copy(item, **update):
+    return item.model_copy(update=update)
+
+
+def test_apply_changeset():
+    td = read_from_json(AIROUND)
+    n_items = len(td.data)
+    first, second, third = td.data[0], td.data[1], td.data[2]
+    changeset = _changeset(
+        "c1",
+        add=[_copy(first, id="new-item")],
+        modify=[_copy(second, training_type="validation")],
+        delete=[third],
+        created_time="2024-05-01",
+        version="2.0",
+    )
+    assert td.apply(changeset) is td
+    assert len(td.data) == n_items
+    assert td.amount_of_training_data == n_items
+    assert td.updated_time == "2024-05-01"
+    assert td.version == "2.0"
+    ids = [item.id for item in td.data]
+    assert third.id not in ids
+    assert ids[-1] == "new-item"
+    assert td.data[ids.index(second.id)].training_type == "validation"
+
+
+def test_apply_changeset_chain():
+    td = read_from_json(AIROUND)
+    first = td.data[0]
+    td.changesets = [
+        _changeset("c1", add=[_copy(first, id="new-item")]),
+        _changeset("c2", modify=[_copy(first, id="new-item", training_type="test")]),
+        _changeset("c3", delete=[first]),
+    ]
+    apply_changesets(td)
+    assert td.data[-1].id == "new-item"
+    assert td.data[-1].training_type == "test"
+    assert first.id not in {item.id for item in td.data}
+    assert td.updated_time is not None
+
+
+def test_apply_changeset_errors():
+    td = read_from_json(AIROUND)
+    first = td.data[0]
+    with pytest.raises(ValueError):
+        td.apply(_changeset("c1", add=[first]))
+    with pytest.raises(KeyError):
+        td.apply(_changeset("c2", modify=[_copy(first, id="missing")]))
+    with pytest.raises(ValueError):
+        td.apply(_changeset("c3", delete=[first], dataset_id="other dataset"))
+
+
+def test_apply_changeset_lazy():
+    td = read_from_json(AIROUND, lazy=True)
+    n_items = len(td.data)
+    first = td.data[0]
+    td.apply(_changeset("c1", delete=[first]))
+    assert len(td.data) == n_items - 1
+    assert td.data.parsed_count() == 0
+    assert td.data[0].id != first.id
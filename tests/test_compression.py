@@ -0,0 +1,73 @@
+import gzip
+import lzma
+
+import pytest
+
+from pytdml.io import (
+    TrainingDataStream,
+    TDMLStreamWriter,
+    build_index,
+    get_json_backend,
+    read_from_json,
+    validate_file,
+    write_to_json,
+)
+from pytdml.io.compression import compression_of
+
+AIROUND = "tests/data/json/AiRound-aerial.json"
+
+
+def _zstd_decompress(data):
+    zstandard = pytest.importorskip("zstandard")
+    return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+
+
+DECOMPRESS = {
+    "gz": gzip.decompress,
+    "zst": _zstd_decompress,
+    "xz": lzma.decompress,
+}
+
+
+def test_compression_of():
+    assert compression_of("dataset.json.gz") == "gzip"
+    assert compression_of("dataset.json.ZST") == "zstd"
+    assert compression_of("dataset.json.xz") == "xz"
+    assert compression_of("dataset.json") is None
+
+
+@pytest.mark.parametrize("extension", ["gz", "zst", "xz"])
+def test_compressed_round_trip(tmp_path, extension):
+    if extension == "zst":
+        pytest.importorskip("zstandard")
+    dataset = read_from_json(AIROUND)
+    plain = tmp_path / "dataset.json"
+    compressed = tmp_path / "dataset.json.{}".format(extension)
+    write_to_json(dataset, str(plain))
+    write_to_json(dataset, str(compressed))
+    # The same encoding, compressed
+    assert DECOMPRESS[extension](compressed.read_bytes()) == plain.read_bytes()
+    assert compressed.stat().st_size * 10 < plain.stat().st_size
+
+    assert read_from_json(str(compressed)) == dataset
+    assert read_from_json(str(compressed), lazy=True).data[5] == dataset.data[5]
+    assert list(TrainingDataStream(str(compressed))) == dataset.data
+    assert list(validate_file(str(compressed), workers=1)) == []
+    assert get_json_backend("stdlib").load(str(compressed))["id"] == dataset.id
+    assert read_from_json(str(compressed), backend="stdlib") == dataset
+
+
+def test_compressed_stream_writer(tmp_path):
+    dataset = read_from_json(AIROUND)
+    path = str(tmp_path / "dataset.json.gz")
+    with TDMLStreamWriter(path, dataset) as writer:
+        for item in dataset.data:
+            writer.add(item)
+    assert read_from_json(path).data == dataset.data
+
+
+def test_compressed_index(tmp_path):
+    path = str(tmp_path / "dataset.json.gz")
+    write_to_json(read_from_json(AIROUND), path)
+    with pytest.raises(ValueError):
+        build_index(path)
@@ -0,0 +1,101 @@
+import gc
+import weakref
+
+from pytdml.io import read_from_json
+from pytdml.type import _fingerprint
+
+AIROUND = "tests/data/json/AiRound-aerial.json"
+
+
+def test_fingerprint_stable():
+    td = read_from_json(AIROUND)
+    key = td.fingerprint()
+    assert len(key) == 32
+    assert td.fingerprint() == key
+    assert read_from_json(AIROUND).fingerprint() == key
+    lazy = read_from_json(AIROUND, lazy=True).fingerprint()
+    assert read_from_json(AIROUND, lazy=True).fingerprint() == lazy
+    td.name = "renamed"
+    assert td.fingerprint() == key
+    assert td.fingerprint([256, 0.2, 0.5]) != key
+
+
+def test_fingerprint_lazy_matches_eager():
+    key = read_from_json(AIROUND).fingerprint()
+    td = read_from_json(AIROUND, lazy=True)
+    assert td.fingerprint() == key
+
+    # Accessing items parses them in place, the fingerprint stays the same
+    td.data[0]
+    td.data[len(td.data) - 1]
+    assert td.fingerprint() == key
+    assert td.fingerprint(refresh=True) == key
+
+
+def test_fingerprint_changes_with_items():
+    td = read_from_json(AIROUND)
+    key = td.fingerprint()
+    td.data[10] = td.data[10].model_copy(update={"training_type": "validation"})
+    modified = td.fingerprint()
+    assert modified != key
+    td.data.pop()
+    assert td.fingerprint() not in (key, modified)
+
+
+def test_fingerprint_incremental(monkeypatch):
+    td = read_from_json(AIROUND)
+    td.fingerprint()
+    hashed = []
+    chunk_digest = _fingerprint._chunk_digest
+
+    def counting_chunk_digest(items):
+        hashed.append(len(items))
+        return chunk_digest(items)
+
+    monkeypatch.setattr(_fingerprint, "_chunk_digest", counting_chunk_digest)
+    td.data[-1] = td.data[-1].model_copy(update={"training_type": "test"})
+    key = td.fingerprint()
+    assert hashed == [len(td.data) - _fingerprint.CHUNK_SIZE]
+
+    # Changes made in place are only seen after a refresh
+    td.data[0].training_type = "test"
+    assert td.fingerprint() == key
+    assert td.fingerprint(refresh=True) != key
+
+
+def test_fingerprint_lazy_without_parsing(monkeypatch):
+    td = read_from_json(AIROUND, lazy=True)
+    key = td.fingerprint()
+    assert td.data.parsed_count() == 0
+
+    hashed = []
+    chunk_digest = _fingerprint._chunk_digest
+
+    def counting_chunk_digest(items):
+        hashed.append(len(items))
+        return chunk_digest(items)
+
+    monkeypatch.setattr(_fingerprint, "_chunk_digest", counting_chunk_digest)
+    # Accessing items does not change their JSON form
+    td.data[0]
+    assert td.fingerprint() == key
+    assert hashed == []
+    # Edits of the lazy list are seen
+    td.data[1] = td.data[1].model_copy(update={"training_type": "test"})
+    assert td.fingerprint() != key
+    assert hashed == [_fingerprint.CHUNK_SIZE, len(td.data) - _fingerprint.CHUNK_SIZE]
+
+
+def test_fingerprint_memo_holds_no_items():
+    td = read_from_json(AIROUND)
+    td.fingerprint()
+    replaced = weakref.ref(td.data[0])
+    td.data[0] = td.data[0].model_copy()
+    gc.collect()
+    assert replaced() is None
+
+    lazy = read_from_json(AIROUND, lazy=True)
+    lazy.fingerprint()
+    memo = _fingerprint._memos[id(lazy)]
+    keys = [key for chunk_keys, _ in memo[-1] for key in chunk_keys]
+    assert not any(isinstance(key, dict) for key in keys)
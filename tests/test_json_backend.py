@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+from pytdml.io import (
+    available_backends,
+    get_json_backend,
+    read_from_json,
+    write_to_json,
+)
+from pytdml.io.json_backend import JSON_BACKEND_ENV
+
+tdml_path = r"tests/data/json/AiRound-aerial.json"
+
+
+@pytest.mark.parametrize("name", ["stdlib", "orjson", "ujson"])
+def test_backend_round_trip(name, tmp_path):
+    pytest.importorskip(name if name != "stdlib" else "json")
+    backend = get_json_backend(name)
+    with open(tdml_path, "rb") as f:
+        raw = f.read()
+    expected = json.loads(raw)
+    assert backend.loads(raw) == expected
+    for indent in (None, 2, 4):
+        assert json.loads(backend.dumps(expected, indent=indent)) == expected
+    obj = {"name": "é/ü", "values": [1, 2.5, None, True]}
+    assert json.loads(backend.dumps(obj)) == obj
+    assert "é/ü" in backend.dumps(obj, indent=4).decode("utf-8")
+    data = backend.dumps({"b": {"d": 1, "c": 2}, "a": 0}, sort_keys=True)
+    assert data.replace(b" ", b"") == b'{"a":0,"b":{"c":2,"d":1}}'
+
+
+def test_orjson_indent_matches_stdlib():
+    pytest.importorskip("orjson")
+    with open(tdml_path, "rb") as f:
+        expected = json.loads(f.read())
+    for indent in (2, 4, "\t"):
+        assert get_json_backend("orjson").dumps(
+            expected, indent=indent
+        ) == get_json_backend("stdlib").dumps(expected, indent=indent)
+
+
+def test_backend_selection(monkeypatch):
+    monkeypatch.setenv(JSON_BACKEND_ENV, "stdlib")
+    assert get_json_backend().name == "stdlib"
+    monkeypatch.delenv(JSON_BACKEND_ENV)
+    assert get_json_backend().name == available_backends()[0]
+    assert get_json_backend(default="stdlib").name == "stdlib"
+    assert get_json_backend("STDLIB").name == "stdlib"
+    with pytest.raises(ValueError):
+        get_json_backend("simplejson")
+
+
+@pytest.mark.parametrize("name", available_backends())
+def test_read_write_with_backend(name, tmp_path):
+    td = read_from_json(tdml_path, backend=name)
+    out_path = str(tmp_path / "out.json")
+    write_to_json(td, out_path, backend=name)
+    assert read_from_json(out_path, backend="stdlib") == td
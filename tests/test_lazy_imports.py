@@ -0,0 +1,32 @@
+import subprocess
+import sys
+
+import pytest
+
+_HEAVY_MODULES = ["torch", "torchvision", "tensorflow", "tensorflow_io", "cv2", "minio"]
+
+
+def _imported_after(statement):
+    code = "import sys\n{}\nprint(' '.join(sorted(sys.modules)))".format(statement)
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    return set(output.split())
+
+
+@pytest.mark.parametrize("statement", ["import pytdml.io", "import pytdml"])
+def test_import_does_not_load_ml_frameworks(statement):
+    modules = _imported_after(statement)
+    assert not modules & set(_HEAVY_MODULES)
+    assert "pytdml.ml.tdml_torch" not in modules
+    assert "pytdml.ml.tdml_tensorflow" not in modules
+
+
+def test_ml_names_are_public():
+    import pytdml.ml
+
+    assert "TorchEOImageSceneTD" in dir(pytdml.ml)
+    assert "TensorflowEOImageSceneTD" in pytdml.ml.__all__
+    assert pytdml.ml.create_class_map is not None
+    with pytest.raises(AttributeError):
+        pytdml.ml.NotAnAttribute
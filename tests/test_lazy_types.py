@@ -0,0 +1,34 @@
+import json
+import random
+
+from pytdml.io.tdml_readers import read_from_json
+from pytdml.type import AI_EOTrainingData, LazyEOTrainingDataset, LazyTrainingDataList
+
+tdml_path = r"tests/data/object-detection/COWC_partial.json"
+
+
+def test_lazy_read_validates_on_access():
+    td = read_from_json(tdml_path, lazy=True)
+    assert isinstance(td, LazyEOTrainingDataset)
+    assert td.data.parsed_count() == 0
+    assert isinstance(td.data[1], AI_EOTrainingData)
+    assert td.data.parsed_count() == 1
+    assert td.data[1] is td.data[1]
+
+
+def test_lazy_read_matches_eager_read():
+    lazy_td = read_from_json(tdml_path, lazy=True)
+    eager_td = read_from_json(tdml_path)
+    assert len(lazy_td.data) == len(eager_td.data)
+    assert list(lazy_td.data) == eager_td.data
+    assert lazy_td.data[1:3] == eager_td.data[1:3]
+    assert isinstance(lazy_td.data[1:3], LazyTrainingDataList)
+    with open(tdml_path, "r") as f:
+        assert lazy_td.to_dict() == json.load(f)
+
+
+def test_lazy_list_supports_shuffle():
+    td = read_from_json(tdml_path, lazy=True)
+    ids = sorted(item.id for item in td.data)
+    random.shuffle(td.data)
+    assert sorted(item.id for item in td.data) == ids
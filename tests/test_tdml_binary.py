@@ -0,0 +1,56 @@
+import pytest
+
+pytest.importorskip("msgpack")
+
+from pytdml.io import read_from_binary, read_from_json, write_to_binary, write_to_json
+from pytdml.io.tdml_binary import dumps_binary, loads_binary
+
+
+@pytest.mark.parametrize(
+    "tdml_path",
+    [
+        "tests/data/json/AiRound-aerial.json",
+        "tests/data/object-detection/COWC_partial.json",
+        "tests/data/semantic_segmentation/GID-5C.json",
+    ],
+)
+def test_binary_round_trip(tmp_path, tdml_path):
+    td = read_from_json(tdml_path)
+    write_to_json(td, tmp_path / "expected.json")
+    write_to_binary(td, tmp_path / "td.tdmlb")
+    assert (tmp_path / "td.tdmlb").stat().st_size < (
+        tmp_path / "expected.json"
+    ).stat().st_size
+    write_to_json(read_from_binary(tmp_path / "td.tdmlb"), tmp_path / "actual.json")
+    assert (tmp_path / "actual.json").read_bytes() == (
+        tmp_path / "expected.json"
+    ).read_bytes()
+
+
+def test_binary_zstd(tmp_path):
+    pytest.importorskip("zstandard")
+    td = read_from_json("tests/data/json/AiRound-aerial.json")
+    write_to_binary(td, tmp_path / "td.tdmlb", compression="zstd")
+    assert read_from_binary(tmp_path / "td.tdmlb", validate=False) == td
+
+
+def test_binary_string_tables():
+    json_dict = {
+        "type": "AI_EOTrainingDataset",
+        "data": [
+            {"type": "AI_EOTrainingData", "dataURL": ["s3://bucket/a/1.tif"]},
+            {"type": "AI_EOTrainingData", "dataURL": ["s3://bucket/a/2.tif"]},
+            {"type": 1, "dataURL": ["s3://bucket/a/", "/", "ünïcode/ü"]},
+        ],
+        "value": 1.5,
+    }
+    data = dumps_binary(json_dict)
+    assert data.count(b"s3://bucket/a/") == 1
+    assert loads_binary(data) == json_dict
+
+
+def test_binary_invalid():
+    with pytest.raises(ValueError):
+        loads_binary(b"not a binary TDML file")
+    with pytest.raises(ValueError):
+        dumps_binary({}, compression="lz4")
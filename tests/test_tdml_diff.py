@@ -0,0 +1,71 @@
+import pytest
+
+from pytdml.io import diff, read_from_json, write_to_json
+from pytdml.type import apply_changesets
+
+AIROUND = "tests/data/json/AiRound-aerial.json"
+
+
+def _changed_version():
+    td = read_from_json(AIROUND)
+    first, second = td.data[0], td.data[1]
+    td.data = td.data[2:]
+    td.data[0] = td.data[0].model_copy(update={"training_type": "validation"})
+    td.data.append(first.model_copy(update={"id": "new-item"}))
+    td.version = "2.0"
+    return td, second.id
+
+
+def _items_by_id(td):
+    return {item.id: item.to_dict() for item in td.data}
+
+
+def test_diff_datasets():
+    old = read_from_json(AIROUND)
+    new, removed_id = _changed_version()
+    changeset = diff(old, new)
+    assert changeset.dataset_id == old.id
+    assert changeset.version == "2.0"
+    assert changeset.change_count == 4
+    assert [item.id for item in changeset.add] == ["new-item"]
+    assert [item.id for item in changeset.modify] == [new.data[0].id]
+    assert sorted(item.id for item in changeset.delete) == sorted(
+        [old.data[0].id, removed_id]
+    )
+    apply_changesets(old, [changeset])
+    assert _items_by_id(old) == _items_by_id(new)
+
+
+def test_diff_files(tmp_path):
+    new, _ = _changed_version()
+    new_path = str(tmp_path / "new.json")
+    write_to_json(new, new_path)
+    changeset = diff(AIROUND, new_path)
+    assert changeset.change_count == 4
+    expected = diff(read_from_json(AIROUND), new)
+    no_time = {"created_time": None}
+    assert changeset.model_copy(update=no_time) == expected.model_copy(update=no_time)
+    old = read_from_json(AIROUND)
+    apply_changesets(old, [changeset])
+    assert _items_by_id(old) == _items_by_id(new)
+
+
+def test_diff_identical():
+    changeset = diff(AIROUND, read_from_json(AIROUND))
+    assert changeset.change_count == 0
+    assert changeset.add is None and changeset.delete is None
+
+
+def test_diff_duplicate_ids():
+    with pytest.raises(ValueError):
+        diff("tests/data/object-detection/COWC_partial.json", AIROUND)
+
+
+def test_diff_lazy_dataset():
+    new, _ = _changed_version()
+    old = read_from_json(AIROUND, lazy=True)
+    old.data[5]
+    changeset = diff(old, new)
+    assert changeset.change_count == 4
+    apply_changesets(old, [changeset])
+    assert _items_by_id(old) == _items_by_id(new)
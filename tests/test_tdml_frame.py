@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+from pytdml.io import read_from_json
+from pytdml.ml import TrainingDataFrame, create_class_map
+
+
+@pytest.fixture(scope="module")
+def dataset():
+    return read_from_json("tests/data/json/AiRound-aerial.json")
+
+
+def test_frame_columns(dataset):
+    frame = TrainingDataFrame.from_dataset(dataset)
+    assert len(frame) == len(dataset.data)
+    for i in (0, len(frame) // 2, len(frame) - 1):
+        item = dataset.data[i]
+        row = frame[i]
+        assert row["id"] == item.id
+        assert row["data_url"] == item.data_url[0]
+        assert row["label_class"] == item.labels[0].label_class
+        assert row["training_type"] == item.training_type
+        assert row["number_of_labels"] == len(item.labels)
+    assert list(frame.classes) == [item.labels[0].label_class for item in dataset.data]
+
+
+def test_frame_from_dicts_matches_models(dataset):
+    frame = TrainingDataFrame.from_dataset(dataset)
+    from_dicts = TrainingDataFrame.from_items(
+        [item.to_dict() for item in dataset.data], frame.class_names
+    )
+    assert np.array_equal(from_dicts.ids, frame.ids)
+    assert np.array_equal(from_dicts.class_codes, frame.class_codes)
+    assert np.array_equal(from_dicts.training_type_codes, frame.training_type_codes)
+
+
+def test_frame_encode_classes(dataset):
+    frame = TrainingDataFrame.from_dataset(dataset)
+    class_map = create_class_map(dataset)
+    expected = [class_map[item.labels[0].label_class] for item in dataset.data]
+    assert frame.encode_classes(class_map).tolist() == expected
+
+    # Classes no row uses do not have to be mapped
+    subset = frame.filter(label_class=frame.row(0)["label_class"])
+    only_used = {frame.row(0)["label_class"]: 7}
+    assert set(subset.encode_classes(only_used).tolist()) == {7}
+    with pytest.raises(KeyError):
+        frame.encode_classes(only_used)
+
+
+def test_frame_dict_classes(dataset):
+    td = dataset.model_copy(
+        update={
+            "classes": [
+                {"key": named_value.key, "value": named_value.value}
+                for named_value in dataset.classes
+            ]
+        }
+    )
+    frame = TrainingDataFrame.from_dataset(td)
+    assert frame.class_names == [named_value.key for named_value in dataset.classes]
+    assert frame.class_names == TrainingDataFrame.from_dataset(dataset).class_names
+
+
+def test_frame_filter_and_take(dataset):
+    frame = TrainingDataFrame.from_dataset(dataset)
+    label_class = frame.row(0)["label_class"]
+    selected = frame.filter(label_class=label_class)
+    assert len(selected) == sum(
+        item.labels[0].label_class == label_class for item in dataset.data
+    )
+    assert set(selected.classes) == {label_class}
+    assert len(frame.filter(label_class="not a class")) == 0
+    assert len(frame.filter(training_type=frame.training_type_names)) == sum(
+        item.training_type is not None for item in dataset.data
+    )
+    subset = frame[np.array([2, 0])]
+    assert list(subset.ids) == [frame.ids[2], frame.ids[0]]
+    assert len(frame[:10]) == 10
@@ -0,0 +1,71 @@
+import os
+import pickle
+
+import pytest
+
+from pytdml.io import build_index, open_indexed, read_from_json
+
+tdml_path = r"tests/data/json/AiRound-aerial.json"
+
+
+def test_indexed_items_match_read_from_json(tmp_path):
+    index_path = build_index(tdml_path, str(tmp_path / "AiRound-aerial.json.idx"))
+    td = read_from_json(tdml_path)
+    with open_indexed(tdml_path, index_path) as reader:
+        assert len(reader) == len(td.data)
+        assert reader.ids == [item.id for item in td.data]
+        assert reader[0] == td.data[0]
+        assert reader[-1] == td.data[-1]
+        assert reader[10:13] == td.data[10:13]
+        assert reader.get(td.data[500].id) == td.data[500]
+        with pytest.raises(IndexError):
+            reader[len(td.data)]
+        with pytest.raises(KeyError):
+            reader.get("no-such-id")
+
+
+def test_indexed_reader_pickles(tmp_path):
+    index_path = build_index(tdml_path, str(tmp_path / "AiRound-aerial.json.idx"))
+    with open_indexed(tdml_path, index_path) as reader:
+        copied = pickle.loads(pickle.dumps(reader))
+        assert copied[7] == reader[7]
+        copied.close()
+
+
+def test_stale_index_is_rejected(tmp_path):
+    json_path = tmp_path / "AiRound-aerial.json"
+    with open(tdml_path, "rb") as f:
+        json_path.write_bytes(f.read())
+    index_path = build_index(str(json_path))
+    with open(json_path, "ab") as f:
+        f.write(b"\n")
+    with pytest.raises(ValueError):
+        open_indexed(str(json_path), index_path, build=False)
+    # With build=True the stale index is rebuilt
+    with open_indexed(str(json_path), index_path) as reader:
+        assert reader[0] == read_from_json(tdml_path).data[0]
+    open_indexed(str(json_path), index_path, build=False).close()
+
+
+def test_index_of_file_with_trailing_bytes(tmp_path):
+    json_path = tmp_path / "AiRound-aerial.json"
+    with open(tdml_path, "rb") as f:
+        json_path.write_bytes(f.read().rstrip() + b"\n\n  \n")
+    index_path = build_index(str(json_path))
+    with open_indexed(str(json_path), index_path, build=False) as reader:
+        assert len(reader) == len(read_from_json(tdml_path).data)
+
+
+def test_index_of_rewritten_file_is_rejected(tmp_path):
+    json_path = tmp_path / "AiRound-aerial.json"
+    with open(tdml_path, "rb") as f:
+        data = f.read()
+    json_path.write_bytes(data)
+    index_path = build_index(str(json_path))
+    # Same size, different content and modification time
+    stat = os.stat(json_path)
+    json_path.write_bytes(data.replace(b"train", b"TRAIN"))
+    os.utime(json_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+    assert os.path.getsize(json_path) == len(data)
+    with pytest.raises(ValueError):
+        open_indexed(str(json_path), index_path, build=False)
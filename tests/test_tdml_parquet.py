@@ -0,0 +1,74 @@
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from pytdml.io import (
+    from_parquet,
+    read_from_json,
+    read_parquet_columns,
+    to_parquet,
+    write_to_json,
+)
+
+
+@pytest.mark.parametrize(
+    "tdml_path",
+    [
+        "tests/data/json/AiRound-aerial.json",
+        "tests/data/object-detection/COWC_partial.json",
+        "tests/data/semantic_segmentation/GID-5C.json",
+    ],
+)
+def test_parquet_round_trip(tmp_path, tdml_path):
+    td = read_from_json(tdml_path)
+    write_to_json(td, tmp_path / "expected.json")
+    to_parquet(td, tmp_path / "td.parquet", row_group_size=100)
+    write_to_json(from_parquet(tmp_path / "td.parquet"), tmp_path / "actual.json")
+    assert (tmp_path / "actual.json").read_bytes() == (
+        tmp_path / "expected.json"
+    ).read_bytes()
+
+
+def test_parquet_projection(tmp_path):
+    td = read_from_json("tests/data/object-detection/COWC_partial.json")
+    to_parquet(td, tmp_path / "td.parquet")
+    table = read_parquet_columns(tmp_path / "td.parquet")
+    assert table.column_names == ["id", "dataURL", "labels"]
+    first = table.slice(0, 1).to_pylist()[0]
+    assert first["dataURL"] == td.data[0].data_url
+    assert first["labels"] == [
+        {"class": label.label_class} for label in td.data[0].labels
+    ]
+
+    bboxes = read_parquet_columns(tmp_path / "td.parquet", ["labels.bbox"])
+    label = td.data[0].labels[0]
+    ring = label.object["geometry"]["coordinates"][0]
+    xs = [point[0] for point in ring]
+    ys = [point[1] for point in ring]
+    assert bboxes.slice(0, 1).to_pylist()[0]["labels"][0]["bbox"] == [
+        min(xs),
+        min(ys),
+        max(xs),
+        max(ys),
+    ]
+
+
+def test_parquet_row_groups(tmp_path):
+    td = read_from_json("tests/data/json/AiRound-aerial.json")
+    to_parquet(td, tmp_path / "td.parquet", row_group_size=500)
+    shards = [from_parquet(tmp_path / "td.parquet", row_groups=i) for i in range(3)]
+    assert [len(shard.data) for shard in shards] == [500, 500, len(td.data) - 1000]
+    assert [item.id for shard in shards for item in shard.data] == [
+        item.id for item in td.data
+    ]
+    ids = read_parquet_columns(tmp_path / "td.parquet", ["id"], row_groups=[1])
+    assert ids.column("id").to_pylist() == [item.id for item in td.data[500:1000]]
+
+
+def test_parquet_not_tdml(tmp_path):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    pq.write_table(pa.table({"id": ["1"]}), tmp_path / "other.parquet")
+    with pytest.raises(ValueError):
+        from_parquet(tmp_path / "other.parquet")
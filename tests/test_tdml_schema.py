@@ -0,0 +1,171 @@
+import copy
+import json
+
+import jsonschema
+import pytest
+
+from pytdml.io import tdml_schema
+from pytdml.io import (
+    SchemaValidationError,
+    SchemaValidator,
+    parse_json,
+    read_from_json,
+    tdml_json_schema,
+)
+
+AIROUND = "tests/data/json/AiRound-aerial.json"
+COWC = "tests/data/object-detection/COWC_partial.json"
+WHU_RS19 = "tests/data/scene-classification/WHU-RS19.json"
+
+
+@pytest.fixture(scope="module")
+def validator(tmp_path_factory):
+    return SchemaValidator(cache_dir=str(tmp_path_factory.mktemp("schema")))
+
+
+def _load(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def _error(validator, json_dict):
+    with pytest.raises(SchemaValidationError) as info:
+        validator.validate(json_dict)
+    return info.value
+
+
+def test_valid_encodings(validator):
+    for path in (AIROUND, COWC):
+        json_dict = _load(path)
+        validator.validate(json_dict)
+        # Same verdict as the reference implementation
+        jsonschema.validate(json_dict, validator.schema)
+
+
+def test_invalid_encodings(validator):
+    json_dict = _load(AIROUND)
+
+    invalid = copy.deepcopy(json_dict)
+    invalid["data"][5]["labels"][0]["confidence"] = "high"
+    error = _error(validator, invalid)
+    assert error.pointer == "/data/5/labels/0/confidence"
+    assert "'high' is not of type 'number'" in str(error)
+    with pytest.raises(jsonschema.ValidationError):
+        jsonschema.validate(invalid, validator.schema)
+
+    invalid = copy.deepcopy(json_dict)
+    del invalid["data"][3]["dataURL"]
+    assert _error(validator, invalid).pointer == "/data/3/dataURL"
+
+    invalid = copy.deepcopy(json_dict)
+    invalid["data"][3]["labels"][0]["type"] = "AI_UnknownLabel"
+    assert _error(validator, invalid).pointer == "/data/3/labels/0/type"
+
+    invalid = copy.deepcopy(json_dict)
+    invalid["data"][2]["labels"][0]["confidence"] = 1.5
+    assert _error(validator, invalid).pointer == "/data/2/labels/0/confidence"
+
+    invalid = copy.deepcopy(json_dict)
+    invalid["data"] = []
+    assert _error(validator, invalid).pointer == "/data"
+
+
+def test_definitions(validator):
+    item = _load(COWC)["data"][0]
+    validator.validate(item, "AI_EOTrainingData")
+    assert not validator.is_valid(dict(item, labels=None), "AI_EOTrainingData")
+    with pytest.raises(ValueError):
+        validator.validate(item, "AI_Unknown")
+
+
+def test_cached_module(tmp_path):
+    SchemaValidator(cache_dir=str(tmp_path))
+    files = [path for path in tmp_path.iterdir() if path.suffix == ".py"]
+    assert len(files) == 1
+    assert SchemaValidator(cache_dir=str(tmp_path)).hash in files[0].name
+
+    # A modified module is not executed but regenerated
+    source = files[0].read_text()
+    files[0].write_text("raise RuntimeError('tampered')\n")
+    validator = SchemaValidator(cache_dir=str(tmp_path))
+    assert files[0].read_text() == source
+    validator.validate(_load(AIROUND))
+
+
+def test_custom_schema():
+    schema = {
+        "type": "object",
+        "properties": {
+            "name": {"type": "string", "pattern": "^[a-z]+$"},
+            "sizes": {"type": "array", "items": {"$ref": "#/$defs/size"}},
+        },
+        "required": ["name"],
+        "additionalProperties": False,
+        "$defs": {"size": {"type": "integer", "minimum": 0}},
+    }
+    validator = SchemaValidator(schema, cache_dir=False)
+    validator.validate({"name": "abc", "sizes": [1, 2]})
+    assert _error(validator, {"name": "abc", "sizes": [1, -2]}).pointer == "/sizes/1"
+    assert _error(validator, {"name": "ABC"}).pointer == "/name"
+    assert not validator.is_valid({"name": "abc", "extra": 1})
+    with pytest.raises(ValueError):
+        SchemaValidator({"$ref": "https://example.com/schema.json"}, cache_dir=False)
+    with pytest.raises(ValueError):
+        SchemaValidator({"uniqueItems": True}, cache_dir=False)
+
+
+def test_parse_json_validator(validator):
+    json_dict = _load(AIROUND)
+    expected = read_from_json(AIROUND)
+    assert parse_json(json_dict, validator=validator) == expected
+    assert read_from_json(AIROUND, validator="none") == expected
+
+    invalid = copy.deepcopy(json_dict)
+    invalid["data"][5]["labels"][0]["confidence"] = "high"
+    for engine in (validator, "pydantic"):
+        with pytest.raises(ValueError):
+            parse_json(invalid, validator=engine)
+    # The validator overrides validate
+    with pytest.raises(SchemaValidationError):
+        parse_json(invalid, validate=False, validator=validator)
+    with pytest.raises(ValueError):
+        parse_json(json_dict, validator="fast")
+
+
+def test_parse_json_schema_validator_by_name(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.setattr(tdml_schema, "_validators", {})
+    expected = read_from_json(AIROUND)
+    assert parse_json(_load(AIROUND), validator="schema") == expected
+    # Compiled in memory, nothing is written
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_schema_validator_runs_model_validators(validator, lazy):
+    # The labeling methods and training types are normalized like pydantic does
+    json_dict = _load(WHU_RS19)
+    expected = parse_json(json_dict, validator="pydantic")
+    td = parse_json(json_dict, lazy=lazy, validator=validator)
+    assert td.labeling == expected.labeling
+    assert list(td.data) == expected.data
+
+    invalid = copy.deepcopy(json_dict)
+    invalid["createdTime"] = "2020-13-45"
+    with pytest.raises(ValueError, match="created_time"):
+        parse_json(invalid, lazy=lazy, validator=validator)
+
+    invalid = copy.deepcopy(json_dict)
+    invalid["data"][3]["dataTime"] = ["yesterday"]
+    with pytest.raises(ValueError, match="data_time"):
+        # Items of a lazy dataset are checked on access
+        parse_json(invalid, lazy=lazy, validator=validator).data[3]
+
+
+def test_tdml_json_schema():
+    schema = tdml_json_schema()
+    assert {"EOTrainingDataset", "AI_EOTrainingData", "AI_ObjectLabel"} <= set(
+        schema["$defs"]
+    )
+    jsonschema.Draft202012Validator.check_schema(schema)
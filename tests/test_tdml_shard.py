@@ -0,0 +1,69 @@
+import json
+import os
+
+import pytest
+
+from pytdml.io import open_sharded, read_from_json, read_sharded, write_sharded
+
+AIROUND = "tests/data/json/AiRound-aerial.json"
+
+
+def test_sharded_round_trip(tmp_path):
+    dataset = read_from_json(AIROUND)
+    encoding = write_sharded(dataset, str(tmp_path), shard_size=300)
+    assert [shard.count for shard in encoding.shards] == [300, 300, 300, 265]
+    assert [shard.start for shard in encoding.shards] == [0, 300, 600, 900]
+    assert len(encoding) == len(dataset.data)
+    with open(tmp_path / "manifest.json") as f:
+        manifest = json.load(f)
+    assert manifest["count"] == len(dataset.data)
+    assert "data" not in manifest["header"]
+    assert manifest["header"]["name"] == dataset.name
+
+    assert read_sharded(str(tmp_path), workers=1) == dataset
+    assert read_sharded(str(tmp_path), workers=2) == dataset
+    assert read_sharded(str(tmp_path), workers=1, validate=False) == dataset
+
+
+def test_reshard_file(tmp_path):
+    write_sharded(read_from_json(AIROUND), str(tmp_path), shard_size=100)
+    # Files that are not shards of the manifest are not touched
+    (tmp_path / "data-99999.json").write_text("[]")
+    (tmp_path / "data-notes.json").write_text("{}")
+    # A JSON file is resharded from its raw items, stale shards are removed
+    encoding = write_sharded(AIROUND, str(tmp_path), shard_size=1000)
+    assert [shard.count for shard in encoding.shards] == [1000, 165]
+    assert sorted(os.listdir(tmp_path)) == [
+        "data-00000.json",
+        "data-00001.json",
+        "data-99999.json",
+        "data-notes.json",
+        "manifest.json",
+    ]
+    assert read_sharded(str(tmp_path), workers=1) == read_from_json(AIROUND)
+
+
+def test_independent_shards(tmp_path):
+    dataset = read_from_json(AIROUND)
+    write_sharded(dataset, str(tmp_path), shard_size=200)
+    encoding = open_sharded(str(tmp_path))
+    assigned = [encoding.shards_for(rank, 2) for rank in range(2)]
+    assert sorted(shard.start for shards in assigned for shard in shards) == [
+        shard.start for shard in encoding.shards
+    ]
+    shard = assigned[1][0]
+    assert shard.load() == dataset.data[shard.start : shard.start + shard.count]
+    assert shard.load_dicts()[0]["id"] == dataset.data[shard.start].id
+    with pytest.raises(ValueError):
+        encoding.shards_for(2, 2)
+
+
+def test_corrupted_shard(tmp_path):
+    write_sharded(AIROUND, str(tmp_path), shard_size=500)
+    path = tmp_path / "data-00001.json"
+    # Still valid JSON, but not the shard of the manifest
+    path.write_bytes(path.read_bytes() + b"\n")
+    with pytest.raises(ValueError):
+        read_sharded(str(tmp_path), workers=1)
+    # Without verification the modified shard is read as is
+    assert len(read_sharded(str(tmp_path), workers=1, verify=False).data) == 1165
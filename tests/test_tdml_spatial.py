@@ -0,0 +1,122 @@
+import json
+import os
+
+import numpy as np
+import pytest
+
+from pytdml.io import (
+    SpatialIndex,
+    build_spatial_index,
+    open_spatial_index,
+    read_from_json,
+)
+
+COWC = "tests/data/object-detection/COWC_partial.json"
+
+
+def _grid_items(size=30):
+    # One 1x1 extent per cell of a size x size grid, item i at (i % size, i // size)
+    return [
+        {
+            "id": "cell-{}".format(i),
+            "extent": [i % size, i // size, i % size + 1, i // size + 1],
+        }
+        for i in range(size * size)
+    ]
+
+
+def _grid_position(x, y, size=30):
+    return y * size + x
+
+
+def test_query_bbox():
+    items = _grid_items()
+    index = SpatialIndex.from_items(items)
+    assert len(index) == len(items)
+    assert index.height > 1
+    result = index.query_bbox((2.5, 3.5, 4.5, 4.5))
+    expected = sorted(_grid_position(x, y) for x in (2, 3, 4) for y in (3, 4))
+    assert result.tolist() == expected
+    assert index.query_bbox((2.5, 3.5, 2.6, 3.6), ids=True) == ["cell-92"]
+    assert len(index.query_bbox((100, 100, 200, 200))) == 0
+
+
+def test_query_polygon():
+    index = SpatialIndex.from_items(_grid_items())
+    triangle = {
+        "type": "Polygon",
+        "coordinates": [[[0.5, 0.5], [5.5, 0.5], [0.5, 5.5], [0.5, 0.5]]],
+    }
+    result = set(index.query_polygon(triangle).tolist())
+    assert _grid_position(0, 0) in result
+    assert _grid_position(2, 2) in result
+    # Inside the bounding box of the triangle but beyond its hypotenuse
+    assert _grid_position(4, 4) not in result
+    assert _grid_position(5, 5) not in result
+
+    ring = [[0.5, 0.5], [9.5, 0.5], [9.5, 9.5], [0.5, 9.5], [0.5, 0.5]]
+    hole = [[3.2, 3.2], [6.8, 3.2], [6.8, 6.8], [3.2, 6.8], [3.2, 3.2]]
+    result = set(index.query_polygon({"type": "Polygon", "coordinates": [ring, hole]}))
+    assert _grid_position(5, 5) not in result
+    assert _grid_position(3, 3) in result
+    assert _grid_position(1, 1) in result
+
+
+def test_nearest():
+    index = SpatialIndex.from_items(_grid_items())
+    assert index.nearest(10.5, 12.5).tolist() == [_grid_position(10, 12)]
+    # Cells of the first column are nearer than the second cell of the first row
+    assert index.nearest(-3, 0.5, k=3).tolist() == [
+        _grid_position(0, 0),
+        _grid_position(0, 1),
+        _grid_position(0, 2),
+    ]
+    assert len(index.nearest(-10, -10, k=5, max_distance=1)) == 0
+
+
+def test_label_geometries():
+    dataset = read_from_json(COWC)
+    index = SpatialIndex.from_dataset(dataset, source="labels")
+    assert len(index) == sum(len(item.labels) for item in dataset.data)
+    ring = dataset.data[1].labels[0].object["geometry"]["coordinates"][0]
+    result = index.query_bbox((ring[0][0], ring[0][1], ring[2][0], ring[2][1]))
+    assert 1 in result.tolist()
+    assert len(set(result.tolist())) == len(result)
+
+
+def test_persisted_index(tmp_path):
+    file_path = str(tmp_path / "grid.json")
+    dataset = {
+        "type": "AI_EOTrainingDataset",
+        "id": "grid",
+        "extent": [0, 0, 30, 30],
+        "data": _grid_items(),
+    }
+    with open(file_path, "w") as f:
+        json.dump(dataset, f)
+    index = open_spatial_index(file_path)
+    assert index.bounds == (0, 0, 30, 30)
+    assert index.query_bbox((0.2, 0.2, 0.4, 0.4), ids=True) == ["cell-0"]
+    assert open_spatial_index(file_path, build=False).ids == index.ids
+
+    # An encoding of another size makes the index out of date
+    dataset["data"] = dataset["data"][:10]
+    with open(file_path, "w") as f:
+        json.dump(dataset, f)
+    with pytest.raises(ValueError):
+        open_spatial_index(file_path, build=False)
+    assert len(open_spatial_index(file_path)) == 10
+
+    # So does an encoding of the same size written later
+    dataset["data"][0]["extent"] = [5, 5, 6, 6]
+    stat = os.stat(file_path)
+    with open(file_path, "w") as f:
+        json.dump(dataset, f)
+    os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+    assert os.path.getsize(file_path) == stat.st_size
+    with pytest.raises(ValueError):
+        open_spatial_index(file_path, build=False)
+    index = open_spatial_index(file_path, node_capacity=4)
+    assert index.node_capacity == 4
+    assert index.query_bbox((5.2, 5.2, 5.4, 5.4), ids=True)[0] == "cell-0"
+    assert build_spatial_index(file_path, source="labels").endswith(".labels.rtree")
@@ -0,0 +1,62 @@
+import json
+from collections import Counter
+
+from pytdml.io import compute_statistics, read_from_json
+from pytdml.io.tdml_statistics import main
+
+COWC = "tests/data/object-detection/COWC_partial.json"
+
+
+def test_compute_statistics():
+    dataset = read_from_json(COWC)
+    statistics = compute_statistics(dataset, update=False)
+    labels = [label for item in dataset.data for label in item.labels]
+    assert statistics["labelsPerClass"] == dict(
+        Counter(label.label_class for label in labels)
+    )
+    histogram = statistics["labelsPerImage"]["histogram"]
+    assert sum(histogram) == len(dataset.data)
+    assert sum(count * n for n, count in enumerate(histogram)) == len(labels)
+    assert statistics["trainingTypes"] == {"training": len(dataset.data)}
+    ring = labels[0].object["geometry"]["coordinates"][0]
+    width = max(p[0] for p in ring) - min(p[0] for p in ring)
+    assert statistics["bboxWidth"]["count"] == len(labels)
+    assert statistics["bboxWidth"]["min"] <= width <= statistics["bboxWidth"]["max"]
+    assert statistics["bboxArea"]["p50"] > 0
+    assert dataset.statistics_info is None
+
+
+def test_statistics_update_dataset():
+    dataset = read_from_json(COWC)
+    dataset.classes = dataset.classes[:1]
+    dataset.data[0].number_of_labels = 99
+    statistics = compute_statistics(dataset)
+    assert dataset.amount_of_training_data == len(dataset.data)
+    assert dataset.data[0].number_of_labels == len(dataset.data[0].labels)
+    assert {value.key for value in dataset.statistics_info} == set(statistics)
+    # Classes used by labels but missing are added with their label count
+    keys = [value.key for value in dataset.classes]
+    assert set(keys) == set(statistics["labelsPerClass"])
+    assert dataset.number_of_classes == len(keys)
+    added = dataset.classes[-1]
+    assert added.value == statistics["labelsPerClass"][added.key]
+
+
+def test_statistics_lazy_dataset():
+    dataset = read_from_json("tests/data/json/AiRound-aerial.json", lazy=True)
+    classes = [value.model_copy() for value in dataset.classes]
+    statistics = compute_statistics(dataset)
+    assert dataset.data.parsed_count() == 0
+    assert sum(statistics["labelsPerClass"].values()) == len(dataset.data)
+    assert statistics["bboxWidth"] == {"count": 0}
+    # Existing class values are kept
+    assert dataset.classes == classes
+
+
+def test_statistics_cli(tmp_path, capsys):
+    output = str(tmp_path / "with-statistics.json")
+    main([COWC, "--output", output])
+    printed = json.loads(capsys.readouterr().out)
+    dataset = read_from_json(output)
+    assert dataset.statistics_info[0].key == "labelsPerClass"
+    assert dataset.statistics_info[0].value == printed["labelsPerClass"]
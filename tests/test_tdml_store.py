@@ -0,0 +1,82 @@
+import pickle
+import sqlite3
+
+import pytest
+
+from pytdml.io import TDMLStore, read_from_json
+
+AIROUND = "tests/data/json/AiRound-aerial.json"
+COWC = "tests/data/object-detection/COWC_partial.json"
+
+
+@pytest.fixture(scope="module")
+def dataset():
+    return read_from_json(AIROUND)
+
+
+def test_store_load_and_query(dataset):
+    with TDMLStore() as store:
+        assert store.load(AIROUND) == dataset.id
+        assert len(store) == len(dataset.data)
+        assert store.datasets == [dataset.id]
+        assert store.header(dataset.id)["name"] == dataset.name
+
+        classes = sorted({item.labels[0].label_class for item in dataset.data})[:2]
+        expected = [
+            item
+            for item in dataset.data
+            if item.labels[0].label_class in classes
+            and item.training_type == "training"
+        ]
+        items = list(store.query(classes=classes, training_type="training"))
+        assert items == expected
+        assert store.count(classes=classes, training_type="training") == len(expected)
+        assert store.get(dataset.data[3].id) == dataset.data[3]
+        with pytest.raises(KeyError):
+            store.get("no such id")
+
+
+def test_store_union_of_datasets(dataset):
+    cowc = read_from_json(COWC)
+    with TDMLStore() as store:
+        store.load(AIROUND)
+        store.add(cowc)
+        assert store.datasets == [dataset.id, cowc.id]
+        assert len(store) == len(dataset.data) + len(cowc.data)
+        assert store.count(dataset=cowc.id) == len(cowc.data)
+        class_counts = store.classes(dataset=cowc.id)
+        assert set(class_counts) == {
+            label.label_class for item in cowc.data for label in item.labels
+        }
+        # Loading a dataset again replaces it
+        store.load(AIROUND)
+        assert len(store) == len(dataset.data) + len(cowc.data)
+        store.remove(cowc.id)
+        assert store.datasets == [dataset.id]
+
+
+def test_store_file(tmp_path, dataset):
+    path = tmp_path / "store.sqlite"
+    with TDMLStore(path) as store:
+        store.load(AIROUND)
+    store = pickle.loads(pickle.dumps(TDMLStore(path)))
+    assert len(store) == len(dataset.data)
+    assert store.to_dataset(dataset.id) == dataset
+    store.close()
+
+
+def test_store_long_lists(dataset):
+    ids = [item.id for item in dataset.data]
+    missing = ["missing-{}".format(index) for index in range(5000)]
+    classes = sorted({item.labels[0].label_class for item in dataset.data})
+    with TDMLStore() as store:
+        connection = store._connect()
+        if hasattr(connection, "setlimit"):
+            # Builds may allow more parameters than the default of old versions
+            connection.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 999)
+        store.load(AIROUND)
+        assert store.count(ids=missing + ids[::2], classes=classes) == len(ids[::2])
+        items = list(store.query(ids=ids[1::2] + missing, training_type="training"))
+        assert items == [
+            item for item in dataset.data[1::2] if item.training_type == "training"
+        ]
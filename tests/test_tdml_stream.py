@@ -0,0 +1,55 @@
+import io
+import json
+
+import pytest
+
+from pytdml.io._json_stream import ITEM, iter_members
+from pytdml.io import iter_training_data, read_from_json
+from pytdml.type import AI_EOTrainingData
+
+tdml_path = r"tests/data/object-detection/COWC_partial.json"
+
+
+def test_iter_training_data_matches_read_from_json():
+    td = read_from_json(tdml_path)
+    stream = iter_training_data(tdml_path)
+    items = list(stream)
+    assert all(isinstance(item, AI_EOTrainingData) for item in items)
+    assert items == td.data
+    # the stream can be iterated again
+    assert [item.id for item in stream] == [item.id for item in td.data]
+
+
+def test_iter_training_data_header():
+    stream = iter_training_data(tdml_path)
+    header = stream.header
+    assert "data" not in header
+    assert header["name"] == "COWC"
+    assert header["tasks"][0]["taskType"] == "Object Detection"
+
+
+def test_iter_members_small_chunks():
+    with open(tdml_path, "rb") as f:
+        raw = f.read()
+    expected = json.loads(raw)
+    for chunk_size in (1, 7, 64):
+        items = []
+        members = {}
+        for kind, key, value, value_raw, start, end in iter_members(
+            io.BytesIO(raw), chunk_size=chunk_size
+        ):
+            assert raw[start:end] == value_raw
+            if kind == ITEM:
+                items.append(value)
+            else:
+                members[key] = value
+        assert items == expected.pop("data")
+        assert members == expected
+        expected["data"] = items
+
+
+def test_iter_members_invalid_json():
+    with pytest.raises(ValueError):
+        list(iter_members(io.BytesIO(b'{"data": [1, 2')))
+    with pytest.raises(ValueError):
+        list(iter_members(io.BytesIO(b'{"data": [1.]}')))
@@ -0,0 +1,59 @@
+from datetime import datetime
+
+import numpy as np
+
+from pytdml.io import TemporalIndex, read_from_json
+
+TIMES = [
+    ["2020-01-15"],
+    ["2020-07-01T10:30:00", "2021-07-02"],
+    ["2020-12-24"],
+    ["2021-02"],
+    ["2022"],
+    ["12:00:00"],
+    [],
+]
+
+
+def _items():
+    return [
+        {"id": "item-{}".format(i), "dataTime": times} for i, times in enumerate(TIMES)
+    ]
+
+
+def test_range_queries():
+    index = TemporalIndex.from_items(_items())
+    # The time of day without a date is skipped
+    assert len(index) == 6
+    assert np.all(np.diff(index.times) >= 0)
+    assert index.start == np.datetime64("2020-01-15T00:00:00")
+    assert index.range("2020-06", "2021").tolist() == [1, 2]
+    assert index.range("2021-01-01", "2021-07-02T00:00:01").tolist() == [1, 3]
+    assert index.before("2020-07-01T10:30:00").tolist() == [0]
+    assert index.after(datetime(2021, 3, 1), ids=True) == ["item-1", "item-4"]
+    assert len(index.range("2030", "2031")) == 0
+
+
+def test_season():
+    index = TemporalIndex.from_items(_items())
+    assert index.season("06-01", "08-31").tolist() == [1]
+    assert index.season("12-01", "02-28").tolist() == [0, 2, 3, 4]
+    assert index.season("12-01", "02-28", years=[2020]).tolist() == [2, 3]
+    assert index.season("01-01", "01-01").tolist() == [4]
+
+
+def test_batches():
+    index = TemporalIndex.from_items(_items())
+    batches = list(index.batches(2))
+    assert [batch.tolist() for batch in batches] == [[0, 1], [2, 3], [4]]
+    assert [batch.tolist() for batch in index.batches(10, start="2020-07-02")] == [
+        [2, 3, 1, 4]
+    ]
+
+
+def test_from_dataset():
+    dataset = read_from_json("tests/data/json/WHU-building.json")
+    index = TemporalIndex.from_dataset(dataset)
+    assert len(index) == len(dataset.data[0].data_time)
+    assert index.range(ids=True) == [dataset.data[0].id]
+    assert len(TemporalIndex.from_dataset(dataset, source="labels")) == 0
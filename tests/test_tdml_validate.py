@@ -0,0 +1,98 @@
+import gzip
+import json
+
+from pytdml.io import validate_file
+
+AIROUND = "tests/data/json/AiRound-aerial.json"
+COWC = "tests/data/object-detection/COWC_partial.json"
+
+
+def _corrupted(tmp_path):
+    with open(AIROUND) as f:
+        json_dict = json.load(f)
+    data = json_dict["data"]
+    del data[3]["dataURL"]
+    data[5]["labels"][0]["confidence"] = "high"
+    data[7]["id"] = data[2]["id"]
+    data[8]["numberOfLabels"] = 3
+    data[9]["labels"][0]["class"] = "Volcano"
+    data[10]["labels"][0]["class"] = "Volcano"
+    del json_dict["name"]
+    path = tmp_path / "corrupted.json"
+    path.write_text(json.dumps(json_dict))
+    return str(path), data
+
+
+def test_validate_valid_file():
+    assert list(validate_file(AIROUND, workers=1)) == []
+
+
+def test_validate_duplicate_ids():
+    issues = list(validate_file(COWC, workers=1))
+    # All items of the partial file have the same id
+    assert [issue.pointer for issue in issues] == [
+        "/data/1/id",
+        "/data/2/id",
+        "/data/3/id",
+        "/data/4/id",
+    ]
+    assert all("Duplicate" in issue.message for issue in issues)
+
+
+def test_validate_corrupted_file(tmp_path):
+    path, data = _corrupted(tmp_path)
+    issues = list(validate_file(path, workers=1, chunk_size=4))
+    pointers = {issue.pointer: issue for issue in issues}
+    assert pointers["/data/3/dataURL"].item_id == data[3]["id"]
+    assert "/data/5/labels/0/confidence" in pointers
+    assert pointers["/data/7/id"].item_id == data[2]["id"]
+    assert "Duplicate" in pointers["/data/7/id"].message
+    assert "numberOfLabels is 3" in pointers["/data/8/numberOfLabels"].message
+    # An unknown class is reported once, at its first label
+    unknown = pointers["/data/9/labels/0/class"]
+    assert "'Volcano' of 2 labels" in unknown.message
+    assert "/data/10/labels/0/class" not in pointers
+    assert pointers["/name"].item_id is None
+    assert len(issues) == 6
+
+
+def test_validate_workers(tmp_path):
+    path, _ = _corrupted(tmp_path)
+    assert list(validate_file(path, workers=2, chunk_size=100)) == list(
+        validate_file(path, workers=1, chunk_size=7)
+    )
+
+
+def test_validate_document_order(tmp_path):
+    path, _ = _corrupted(tmp_path)
+    issues = list(validate_file(path, workers=1, chunk_size=100))
+    # The duplicate id of item 7 comes between the issues of items 5 and 8
+    assert [issue.pointer for issue in issues[:4]] == [
+        "/data/3/dataURL",
+        "/data/5/labels/0/confidence",
+        "/data/7/id",
+        "/data/8/numberOfLabels",
+    ]
+
+
+def test_validate_header_after_data(tmp_path):
+    with open(AIROUND) as f:
+        json_dict = json.load(f)
+    json_dict["data"][2]["id"] = json_dict["data"][1]["id"]
+    data = json_dict.pop("data")
+    path = tmp_path / "data-first.json"
+    path.write_text(json.dumps(dict({"data": data}, **json_dict), indent=2))
+    expected = ["/data/2/id"]
+    assert [issue.pointer for issue in validate_file(str(path), workers=1)] == expected
+    issues = validate_file(str(path), workers=2, chunk_size=3)
+    assert [issue.pointer for issue in issues] == expected
+
+
+def test_validate_compressed_file(tmp_path):
+    path, _ = _corrupted(tmp_path)
+    compressed = tmp_path / "corrupted.json.gz"
+    with open(path, "rb") as f:
+        compressed.write_bytes(gzip.compress(f.read()))
+    assert list(validate_file(str(compressed), workers=2, chunk_size=4)) == list(
+        validate_file(path, workers=1)
+    )
@@ -0,0 +1,93 @@
+import io
+import json
+
+import pytest
+
+from pytdml.io import (
+    TDMLStreamWriter,
+    available_backends,
+    get_json_backend,
+    read_from_json,
+    write_to_json,
+)
+from pytdml.io.json_backend import JSON_BACKEND_ENV
+from pytdml.io.tdml_writers import dump_json, remove_empty_values
+
+tdml_paths = [
+    r"tests/data/json/AiRound-aerial.json",
+    r"tests/data/object-detection/COWC_partial.json",
+]
+
+
+@pytest.mark.parametrize("tdml_path", tdml_paths)
+@pytest.mark.parametrize("backend", available_backends())
+@pytest.mark.parametrize("indent", [4, 2, None, "\t"])
+def test_dump_json_matches_full_encoding(tdml_path, backend, indent):
+    td = read_from_json(tdml_path)
+    f = io.BytesIO()
+    dump_json(td, f, indent=indent, backend=backend)
+    expected = get_json_backend(backend).dumps(
+        remove_empty_values(td.to_dict()), indent=indent
+    )
+    assert f.getvalue() == expected
+
+
+def test_write_to_json_default_is_stdlib(tmp_path, monkeypatch):
+    monkeypatch.delenv(JSON_BACKEND_ENV, raising=False)
+    td = read_from_json(tdml_paths[0])
+    out_path = str(tmp_path / "default.json")
+    write_to_json(td, out_path)
+    expected = json.dumps(
+        remove_empty_values(td.to_dict()), indent=4, ensure_ascii=False
+    )
+    with open(out_path, "rb") as f:
+        assert f.read() == expected.encode("utf-8")
+
+
+def test_dump_json_lazy_dataset():
+    td = read_from_json(tdml_paths[1], lazy=True)
+    f = io.BytesIO()
+    dump_json(td, f, backend="stdlib")
+    expected = get_json_backend("stdlib").dumps(
+        remove_empty_values(td.to_dict()), indent=4
+    )
+    assert f.getvalue() == expected
+
+
+def test_stream_writer_matches_dump_json(tmp_path):
+    td = read_from_json(tdml_paths[0])
+    out_path = str(tmp_path / "stream.json")
+    with TDMLStreamWriter(out_path, td, backend="stdlib") as writer:
+        for item in td.data:
+            writer.add(item)
+    f = io.BytesIO()
+    dump_json(td, f, backend="stdlib")
+    with open(out_path, "rb") as result:
+        assert result.read() == f.getvalue()
+
+
+def test_stream_writer_totals():
+    td = read_from_json(tdml_paths[0])
+    header = td.to_dict()
+    for key in ("data", "classes", "numberOfClasses", "amountOfTrainingData"):
+        del header[key]
+    f = io.BytesIO()
+    with TDMLStreamWriter(f, header) as writer:
+        for item in td.data[:100]:
+            writer.add(item.to_dict())
+    result = json.loads(f.getvalue())
+    assert result["amountOfTrainingData"] == 100
+    assert len(result["data"]) == 100
+    class_counts = {}
+    for item in td.data[:100]:
+        for label in item.labels:
+            class_counts[label.label_class] = class_counts.get(label.label_class, 0) + 1
+    assert {c["key"]: c["value"] for c in result["classes"]} == class_counts
+    assert result["numberOfClasses"] == len(class_counts)
+
+
+def test_stream_writer_without_items():
+    td = read_from_json(tdml_paths[0])
+    with pytest.raises(ValueError):
+        with TDMLStreamWriter(io.BytesIO(), td):
+            pass
@@ -0,0 +1,70 @@
+import gc
+
+import pytest
+
+from pytdml.io import iter_training_data, parse_json, read_from_json
+from pytdml.type import (
+    AI_EOTrainingData,
+    AI_ObjectLabel,
+    AI_SceneLabel,
+    EOTrainingDataset,
+    LazyEOTrainingDataset,
+)
+from pytdml.type._utils import _gc_paused
+
+tdml_paths = [
+    r"tests/data/json/AiRound-aerial.json",
+    r"tests/data/json/UiT_HCD_California_2017.json",
+    r"tests/data/json/WHU-building.json",
+    r"tests/data/object-detection/COWC_partial.json",
+]
+
+
+@pytest.mark.parametrize("tdml_path", tdml_paths)
+def test_trusted_load_matches_validated(tdml_path):
+    validated = read_from_json(tdml_path)
+    trusted = read_from_json(tdml_path, validate=False)
+    assert isinstance(trusted, EOTrainingDataset)
+    assert trusted == validated
+    assert trusted.to_dict() == validated.to_dict()
+
+
+def test_trusted_load_resolves_label_types():
+    td = read_from_json(tdml_paths[3], validate=False)
+    label = td.data[0].labels[0]
+    assert isinstance(td.data[0], AI_EOTrainingData)
+    assert isinstance(label, AI_ObjectLabel)
+    assert label.object.geometry.type == "Polygon"
+    assert label.object.geometry.coordinates[0][0] == [92.0, 13.0]
+
+    td = read_from_json(tdml_paths[0], validate=False)
+    assert isinstance(td.data[0].labels[0], AI_SceneLabel)
+
+
+def test_trusted_lazy_and_stream():
+    validated = read_from_json(tdml_paths[0])
+    lazy = read_from_json(tdml_paths[0], lazy=True, validate=False)
+    assert isinstance(lazy, LazyEOTrainingDataset)
+    assert lazy.data[5] == validated.data[5]
+    assert list(iter_training_data(tdml_paths[0], validate=False)) == validated.data
+
+
+def test_trusted_load_missing_required_field():
+    json_dict = read_from_json(tdml_paths[0]).to_dict()
+    del json_dict["data"][0]["id"]
+    with pytest.raises(ValueError):
+        parse_json(json_dict, validate=False)
+
+
+def test_trusted_load_keeps_gc_state():
+    gc.disable()
+    try:
+        read_from_json(tdml_paths[0], validate=False)
+        assert not gc.isenabled()
+    finally:
+        gc.enable()
+    with _gc_paused():
+        read_from_json(tdml_paths[0], validate=False)
+        # The nested pause of the construction does not end the outer one
+        assert not gc.isenabled()
+    assert gc.isenabled()